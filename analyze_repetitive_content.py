@@ -1,108 +1,245 @@
 #!/usr/bin/env python3
 """
 Script to analyze repetitive content in the concatenated documentation file.
+
+The file is streamed twice, line by line, so memory stays bounded however
+large the compilation is. Pass one feeds a Rabin-Karp rolling hash over
+windows of consecutive lines into a fixed-size count-min sketch. Pass two
+joins every run of lines covered by a repeated window into a span, hashes
+the span, and totals how many times each span occurs and how many bytes
+removing its extra copies would save. No site-specific patterns are needed.
 """
 
-import re
+import argparse
+import hashlib
+from array import array
+from collections import deque
 from pathlib import Path
-from collections import Counter
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# Rabin-Karp over line hashes, modulo the Mersenne prime 2^61 - 1
+_MODULUS = (1 << 61) - 1
+_BASE = 1_000_003
+_MASK64 = (1 << 64) - 1
+_SKETCH_MULTIPLIERS = (
+    0x9E3779B97F4A7C15,
+    0xC2B2AE3D27D4EB4F,
+    0x165667B19E3779F9,
+    0xD6E8FEB86659FD93,
+)
+
+
+def _line_hash(line: bytes) -> int:
+    """Hash a line, ignoring trailing whitespace and line endings."""
+    return int.from_bytes(hashlib.blake2b(line.rstrip(), digest_size=8).digest(), 'big')
+
+
+class CountMinSketch:
+    """
+    Fixed-size frequency sketch; estimates never undercount.
+
+    Args:
+        width_bits: log2 of the counters per row (default: 20)
+        depth: Number of rows (default: 4)
+    """
+
+    def __init__(self, width_bits: int = 20, depth: int = 4):
+        self.shift = 64 - width_bits
+        self.rows = [array('I', bytes(4 << width_bits)) for _ in range(min(depth, len(_SKETCH_MULTIPLIERS)))]
+
+    def _slots(self, key: int):
+        for row, multiplier in zip(self.rows, _SKETCH_MULTIPLIERS):
+            yield row, ((key * multiplier) & _MASK64) >> self.shift
+
+    def add(self, key: int):
+        for row, slot in self._slots(key):
+            if row[slot] < 0xFFFFFFFF:
+                row[slot] += 1
+
+    def estimate(self, key: int) -> int:
+        return min(row[slot] for row, slot in self._slots(key))
+
+
+def _windows(path: Path, window: int):
+    """
+    Stream a file's lines with the rolling hash of the window ending at each.
+
+    Yields:
+        Tuple of (line, line hash, offset, window hash or None until the
+        first full window)
+    """
+    top_power = pow(_BASE, window - 1, _MODULUS)
+    recent: Deque[int] = deque()
+    rolling = 0
+    offset = 0
+
+    with open(path, 'rb') as f:
+        for line in f:
+            value = _line_hash(line) % _MODULUS
+            if len(recent) == window:
+                rolling = (rolling - recent.popleft() * top_power) % _MODULUS
+            recent.append(value)
+            rolling = (rolling * _BASE + value) % _MODULUS
+            yield line, value, offset, rolling if len(recent) == window else None
+            offset += len(line)
+
+
+class _Span:
+    """A run of lines that all belong to repeated windows."""
+
+    def __init__(self, offset: int):
+        self.offset = offset
+        self.preview = ""
+        self.size = 0
+        self.lines = 0
+        self.digest = hashlib.blake2b(digest_size=16)
+
+    def add(self, line_hash: int, size: int, preview: str):
+        # Preview the first non-blank line
+        self.preview = self.preview or preview
+        self.digest.update(line_hash.to_bytes(8, 'big'))
+        self.size += size
+        self.lines += 1
+
 
-def analyze_repetitive_content(file_path: str):
+def find_repeated_blocks(
+    file_path: str,
+    window: int = 3,
+    min_bytes: int = 200,
+    sketch_bits: int = 20,
+    max_blocks: int = 10000
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Find repeated spans of lines in a file of any size.
+
+    Args:
+        file_path: File to analyze
+        window: Consecutive lines hashed together; shorter repeats are ignored
+        min_bytes: Smallest span worth reporting
+        sketch_bits: log2 of the count-min sketch width (memory is
+            16 * 2^sketch_bits bytes)
+        max_blocks: Distinct spans tracked at once; spans seen only once are
+            evicted when the table fills
+
+    Returns:
+        Tuple of (repeated blocks sorted by bytes saved, file totals with
+        'size', 'lines' and 'sections')
+    """
+    path = Path(file_path)
+    sketch = CountMinSketch(sketch_bits)
+
+    # Pass 1: count every window of lines
+    for _, _, _, window_hash in _windows(path, window):
+        if window_hash is not None:
+            sketch.add(window_hash)
+
+    # Pass 2: join lines covered by repeated windows into spans
+    blocks: Dict[bytes, Dict[str, Any]] = {}
+    totals = {'size': 0, 'lines': 0, 'sections': 1}
+    buffered: Deque[List[Any]] = deque()
+    span: Optional[_Span] = None
+
+    def record(span: _Span):
+        if span.size < min_bytes:
+            return
+        key = span.digest.digest()
+        block = blocks.get(key)
+        if block is None:
+            if len(blocks) >= max_blocks:
+                for stale in [k for k, b in blocks.items() if b['occurrences'] == 1]:
+                    del blocks[stale]
+                if len(blocks) >= max_blocks:
+                    return
+            blocks[key] = block = {
+                'preview': span.preview,
+                'lines': span.lines,
+                'size': span.size,
+                'first_offset': span.offset,
+                'occurrences': 0
+            }
+        block['occurrences'] += 1
+
+    def finalize(entry: List[Any]):
+        nonlocal span
+        preview, line_hash, offset, size, covered = entry
+        if covered:
+            if span is None:
+                span = _Span(offset)
+            span.add(line_hash, size, preview)
+        elif span is not None:
+            record(span)
+            span = None
+
+    for line, line_hash, offset, window_hash in _windows(path, window):
+        totals['size'] += len(line)
+        totals['lines'] += 1
+        if line.startswith(b'<!-- Source:'):
+            totals['sections'] += 1
+
+        preview = line.strip()[:80].decode('utf-8', errors='replace')
+        buffered.append([preview, line_hash, offset, len(line), False])
+        if window_hash is not None and sketch.estimate(window_hash) > 1:
+            for entry in buffered:
+                entry[4] = True
+        if len(buffered) == window:
+            finalize(buffered.popleft())
+
+    while buffered:
+        finalize(buffered.popleft())
+    if span is not None:
+        record(span)
+
+    repeated = [block for block in blocks.values() if block['occurrences'] > 1]
+    for block in repeated:
+        block['bytes_saved'] = block['size'] * (block['occurrences'] - 1)
+    repeated.sort(key=lambda block: block['bytes_saved'], reverse=True)
+    return repeated, totals
+
+
+def analyze_repetitive_content(file_path: str, window: int = 3, min_bytes: int = 200, top: int = 20):
     """Analyze the file for repetitive content patterns."""
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Split into sections by source comments
-    sections = re.split(r'<!-- Source: .* -->', content)
-    
+
+    repeated, totals = find_repeated_blocks(file_path, window=window, min_bytes=min_bytes)
+
     print(f"📊 Analysis of repetitive content in {file_path}")
-    print(f"📄 Total sections found: {len(sections)}")
+    print(f"📄 Total sections found: {totals['sections']}")
+    print(f"📏 Lines scanned: {totals['lines']:,}")
     print("\n" + "="*60)
-    
-    # 1. Check for navigation menu repetition
-    nav_pattern = r'Navigation\s+Getting started.*?##### Resources.*?Legal and compliance'
-    nav_matches = re.findall(nav_pattern, content, re.DOTALL)
-    print(f"\n🔄 NAVIGATION MENU REPETITION:")
-    print(f"   Found {len(nav_matches)} instances of full navigation menu")
-    
-    # 2. Check for repeated headers
-    headers = re.findall(r'^# (.+)$', content, re.MULTILINE)
-    header_counts = Counter(headers)
-    duplicated_headers = {h: count for h, count in header_counts.items() if count > 1}
-    
-    print(f"\n📋 DUPLICATED HEADERS:")
-    for header, count in duplicated_headers.items():
-        print(f"   '{header}': appears {count} times")
-    
-    # 3. Check for repeated breadcrumb/navigation patterns
-    breadcrumb_pattern = r'\[Welcome\].*?\[Release Notes\]'
-    breadcrumb_matches = re.findall(breadcrumb_pattern, content)
-    print(f"\n🍞 BREADCRUMB REPETITION:")
-    print(f"   Found {len(breadcrumb_matches)} instances of breadcrumb navigation")
-    
-    # 4. Check for repeated footer/header elements
-    anthropic_logo_pattern = r'Anthropic home page.*?dark\.svg\]\]'
-    logo_matches = re.findall(anthropic_logo_pattern, content, re.DOTALL)
-    print(f"\n🏠 HEADER/LOGO REPETITION:")
-    print(f"   Found {len(logo_matches)} instances of Anthropic logo/header")
-    
-    # 5. Check for repeated search elements
-    search_pattern = r'Search\.\.\.\s*⌘K'
-    search_matches = re.findall(search_pattern, content)
-    print(f"\n🔍 SEARCH ELEMENT REPETITION:")
-    print(f"   Found {len(search_matches)} instances of search interface")
-    
-    # 6. Calculate potential space savings
-    total_chars = len(content)
-    
-    # Estimate repetitive content size
-    nav_size = sum(len(match) for match in nav_matches)
-    breadcrumb_size = sum(len(match) for match in breadcrumb_matches)
-    logo_size = sum(len(match) for match in logo_matches)
-    search_size = sum(len(match) for match in search_matches)
-    
-    # Keep only one instance of each, remove the rest
-    removable_size = (nav_size - (len(nav_matches[0]) if nav_matches else 0) +
-                     breadcrumb_size - (len(breadcrumb_matches[0]) if breadcrumb_matches else 0) +
-                     logo_size - (len(logo_matches[0]) if logo_matches else 0) +
-                     search_size - (len(search_matches[0]) if search_matches else 0))
-    
+
+    print(f"\n🔄 REPEATED BLOCKS ({len(repeated)} found, top {min(top, len(repeated))} by bytes saved):")
+    for block in repeated[:top]:
+        print(f"   {block['occurrences']:>5}x  {block['size']:>8,} bytes  "
+              f"saves {block['bytes_saved']:>10,}  | {block['preview']}")
+
+    # Removing every copy but the first of each block
+    total_chars = totals['size']
+    removable_size = sum(block['bytes_saved'] for block in repeated)
+
     print(f"\n💾 POTENTIAL SPACE SAVINGS:")
-    print(f"   Current file size: {total_chars:,} characters")
-    print(f"   Removable repetitive content: {removable_size:,} characters")
-    print(f"   Potential size after cleanup: {total_chars - removable_size:,} characters")
-    print(f"   Space savings: {(removable_size / total_chars) * 100:.1f}%")
-    
-    # 7. Identify specific repetitive patterns to remove
+    print(f"   Current file size: {total_chars:,} bytes")
+    print(f"   Removable repetitive content: {removable_size:,} bytes")
+    print(f"   Potential size after cleanup: {total_chars - removable_size:,} bytes")
+    if total_chars:
+        print(f"   Space savings: {(removable_size / total_chars) * 100:.1f}%")
+
     print(f"\n🧹 RECOMMENDED CLEANUP ACTIONS:")
-    
-    if len(nav_matches) > 1:
-        print(f"   ✂️  Remove {len(nav_matches) - 1} duplicate navigation menus")
-    
-    if len(breadcrumb_matches) > 1:
-        print(f"   ✂️  Remove {len(breadcrumb_matches) - 1} duplicate breadcrumb navigations")
-        
-    if len(logo_matches) > 1:
-        print(f"   ✂️  Remove {len(logo_matches) - 1} duplicate header/logo sections")
-        
-    if len(search_matches) > 1:
-        print(f"   ✂️  Remove {len(search_matches) - 1} duplicate search interfaces")
-    
-    if duplicated_headers:
-        print(f"   ✂️  Review and potentially merge duplicated content sections")
-    
+    for block in repeated[:top]:
+        print(f"   ✂️  Remove {block['occurrences'] - 1} duplicate copies of: {block['preview']}")
+
     print("\n" + "="*60)
     return {
-        'nav_count': len(nav_matches),
-        'breadcrumb_count': len(breadcrumb_matches),
-        'logo_count': len(logo_matches),
-        'search_count': len(search_matches),
-        'duplicate_headers': duplicated_headers,
+        'section_count': totals['sections'],
+        'repeated_blocks': repeated,
         'potential_savings': removable_size,
         'current_size': total_chars
     }
 
 if __name__ == "__main__":
-    file_path = "claude_code_complete_documentation.md"
-    results = analyze_repetitive_content(file_path)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Find repeated blocks in a compiled documentation file")
+    parser.add_argument('file_path', nargs='?', default="claude_code_complete_documentation.md")
+    parser.add_argument('--window', type=int, default=3, help='Lines per rolling-hash window')
+    parser.add_argument('--min-bytes', type=int, default=200, help='Smallest repeated block to report')
+    parser.add_argument('--top', type=int, default=20, help='Blocks to list')
+    args = parser.parse_args()
+
+    results = analyze_repetitive_content(args.file_path, window=args.window, min_bytes=args.min_bytes, top=args.top)
@@ -0,0 +1,234 @@
+"""
+Boilerplate Stripper - Cross-page removal of repeated site chrome
+
+Navigation menus, breadcrumbs, logo headers and search widgets are repeated
+on every page of a documentation site. While a site is crawled, each page's
+markdown is split into blocks and lines whose hashed shingles are counted
+once per page. Multi-line blocks, and lines made up mostly of links, that
+appear on more than a threshold fraction of the pages seen so far are
+stripped before the page is saved, so no site-specific patterns are needed.
+Other single lines are never stripped: recurring labels such as
+"**Parameters:**" or "Example:" are content, not chrome.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Set
+
+from .dedup import is_link_line
+
+_FENCES = ("```", "~~~")
+
+
+def _shingle_key(text: str) -> int:
+    """Hash whitespace-normalized text to a 64-bit key."""
+    normalized = " ".join(text.split())
+    return int.from_bytes(hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def _is_candidate_line(line: str) -> bool:
+    """Lines that may be stripped on their own: link lists, never headings or tables."""
+    stripped = line.strip()
+    return (
+        bool(stripped)
+        and not stripped.startswith(('#', '|'))
+        and is_link_line(stripped)
+    )
+
+
+@dataclass
+class _Block:
+    lines: List[str]
+    code: bool = False
+    key: int = 0
+    line_keys: List[int] = field(default_factory=list)
+    # Blank lines that followed the block in the page
+    trailing: List[str] = field(default_factory=list)
+
+
+class BoilerplateStripper:
+    """
+    Strips blocks and lines repeated across the pages of a site.
+
+    Frequencies are built incrementally, so stripping starts once
+    ``min_pages`` pages have been seen. Earlier pages are returned
+    unchanged; once saved, they can be stripped with ``strip_saved``.
+    Fenced code blocks are never stripped.
+
+    Args:
+        threshold: Fraction of pages (0-1) a block must appear on, strictly
+            exceeded, to count as boilerplate (default: 0.6)
+        min_pages: Pages to observe before anything is stripped (default: 5)
+    """
+
+    def __init__(self, threshold: float = 0.6, min_pages: int = 5):
+        if not 0.0 < threshold < 1.0:
+            raise ValueError(f"Boilerplate threshold must be in (0, 1): {threshold}")
+
+        self.threshold = threshold
+        self.min_pages = max(1, min_pages)
+        self.page_count = 0
+        self._frequency: Dict[int, int] = {}
+
+        self.stats: Dict[str, int] = {
+            'pages_stripped': 0,
+            'blocks_removed': 0,
+            'lines_removed': 0,
+            'chars_removed': 0
+        }
+
+    @property
+    def warming_up(self) -> bool:
+        """Whether too few pages have been seen to strip anything yet."""
+        return self.page_count < self.min_pages
+
+    def _split(self, markdown: str) -> List[_Block]:
+        """
+        Split markdown into blank-line separated blocks, keeping code fences whole.
+
+        Blank lines before the first block are kept in a leading block with
+        no lines, so the page can be rebuilt exactly.
+        """
+        blocks: List[_Block] = [_Block([])]
+        current: List[str] = []
+        fence = None
+
+        for line in markdown.splitlines():
+            marker = line.lstrip()[:3]
+            if fence is not None:
+                current.append(line)
+                if marker == fence:
+                    blocks.append(_Block(current, code=True))
+                    current, fence = [], None
+            elif marker in _FENCES:
+                if current:
+                    blocks.append(_Block(current))
+                current, fence = [line], marker
+            elif line.strip():
+                current.append(line)
+            else:
+                if current:
+                    blocks.append(_Block(current))
+                    current = []
+                blocks[-1].trailing.append(line)
+
+        if current:
+            blocks.append(_Block(current, code=fence is not None))
+
+        for block in blocks:
+            if block.lines and not block.code:
+                block.key = _shingle_key("\n".join(block.lines))
+                block.line_keys = [
+                    _shingle_key(line) if _is_candidate_line(line) else 0
+                    for line in block.lines
+                ]
+        return blocks
+
+    def _observe(self, blocks: List[_Block]):
+        """Count each block and candidate line once for this page."""
+        keys: Set[int] = set()
+        for block in blocks:
+            if block.code or not block.lines:
+                continue
+            if len(block.lines) > 1:
+                keys.add(block.key)
+            keys.update(key for key in block.line_keys if key)
+
+        self.page_count += 1
+        for key in keys:
+            self._frequency[key] = self._frequency.get(key, 0) + 1
+
+    def is_boilerplate(self, text: str) -> bool:
+        """Whether a block or line currently counts as boilerplate."""
+        return self._is_frequent(_shingle_key(text))
+
+    def _is_frequent(self, key: int) -> bool:
+        return (
+            self.page_count >= self.min_pages
+            and self._frequency.get(key, 0) > self.threshold * self.page_count
+        )
+
+    def strip(self, markdown: str) -> str:
+        """
+        Record a page's blocks and return it without boilerplate.
+
+        Args:
+            markdown: Extracted page markdown
+
+        Returns:
+            The markdown with repeated blocks and lines removed; unchanged
+            while fewer than ``min_pages`` pages have been seen
+        """
+        if not markdown:
+            return markdown
+
+        blocks = self._split(markdown)
+        self._observe(blocks)
+        if self.warming_up:
+            return markdown
+        return self._remove(markdown, blocks)
+
+    def strip_saved(self, path: Path) -> int:
+        """
+        Strip a page saved while the stripper was warming up.
+
+        The page is not counted again. Frontmatter at the top of the file is
+        left as it is.
+
+        Args:
+            path: Saved markdown file
+
+        Returns:
+            Characters removed from the file
+        """
+        if self.warming_up:
+            return 0
+        path = Path(path)
+        text = path.read_text(encoding='utf-8')
+        header = ""
+        if text.startswith("---\n"):
+            end = text.find("\n---\n", 3)
+            if end != -1:
+                header, text = text[:end + 5], text[end + 5:]
+
+        removed_before = self.stats['chars_removed']
+        stripped = self._remove(text, self._split(text))
+        if stripped is not text:
+            path.write_text(header + stripped, encoding='utf-8')
+        return self.stats['chars_removed'] - removed_before
+
+    def _remove(self, markdown: str, blocks: List[_Block]) -> str:
+        """Rebuild a page without its frequent blocks and lines, keeping its spacing."""
+        kept: List[str] = list(blocks[0].trailing)
+        removed_chars = 0
+        for block in blocks[1:]:
+            text = "\n".join(block.lines)
+            if block.code:
+                kept.extend(block.lines + block.trailing)
+                continue
+
+            if len(block.lines) > 1 and self._is_frequent(block.key):
+                self.stats['blocks_removed'] += 1
+                removed_chars += len(text)
+                continue
+
+            lines = []
+            for line, key in zip(block.lines, block.line_keys):
+                if key and self._is_frequent(key):
+                    self.stats['lines_removed'] += 1
+                    removed_chars += len(line)
+                else:
+                    lines.append(line)
+            # Drop separators left behind once a block's content is stripped
+            if len(lines) == len(block.lines) or any(any(c.isalnum() for c in line) for line in lines):
+                kept.extend(lines + block.trailing)
+            else:
+                removed_chars += sum(len(line) for line in lines)
+
+        if not removed_chars:
+            return markdown
+
+        self.stats['pages_stripped'] += 1
+        self.stats['chars_removed'] += removed_chars
+        return "\n".join(kept) + ("\n" if markdown.endswith(("\n", "\r")) else "")
@@ -0,0 +1,156 @@
+"""
+Browser Pool - Shared warm headless browsers for crawl4ai
+
+Keeps a small set of started AsyncWebCrawler instances alive for the lifetime
+of a crawl so that pages are fetched from an already-running Chromium instead
+of launching a new browser for every request. Browsers are retired and
+replaced after a configurable number of navigations to keep memory in check.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from crawl4ai import AsyncWebCrawler, BrowserConfig
+
+
+class _PooledBrowser:
+    """A started crawler plus the bookkeeping the pool needs for it."""
+
+    def __init__(self, crawler: AsyncWebCrawler):
+        self.crawler = crawler
+        self.active = 0
+        self.navigations = 0
+        self.retiring = False
+
+
+class BrowserLease:
+    """
+    Handle to a pooled browser, valid inside ``BrowserPool.acquire()``.
+
+    Navigations made through ``arun`` are counted so the pool knows when to
+    recycle the underlying browser.
+    """
+
+    def __init__(self, pool: 'BrowserPool', entry: _PooledBrowser):
+        self._pool = pool
+        self._entry = entry
+
+    @property
+    def crawler(self) -> AsyncWebCrawler:
+        """The underlying AsyncWebCrawler."""
+        return self._entry.crawler
+
+    async def arun(self, url: str, **kwargs) -> Any:
+        """Run a single crawl on the pooled browser."""
+        self._pool._record_navigation(self._entry)
+        return await self._entry.crawler.arun(url, **kwargs)
+
+
+class BrowserPool:
+    """
+    Pool of warm AsyncWebCrawler instances shared by concurrent page fetches.
+
+    Browsers are launched lazily when every live browser is busy, up to
+    ``size`` of them. Leases go to the least busy browser, so once the pool
+    is full many pages are rendered concurrently in tabs of the same browser.
+
+    Args:
+        size: Maximum number of live browsers (default: 2)
+        recycle_after: Navigations after which a browser is closed and
+            replaced once its in-flight pages finish; 0 disables recycling
+            (default: 100)
+        browser_config: Optional crawl4ai BrowserConfig for new browsers
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        recycle_after: int = 100,
+        browser_config: Optional[BrowserConfig] = None
+    ):
+        if size < 1:
+            raise ValueError("Browser pool size must be at least 1")
+
+        self.size = size
+        self.recycle_after = recycle_after
+        self.browser_config = browser_config
+
+        self._browsers: List[_PooledBrowser] = []
+        self._lock = asyncio.Lock()
+
+        self.stats: Dict[str, int] = {
+            'launched': 0,
+            'recycled': 0,
+            'navigations': 0
+        }
+
+    async def _launch(self) -> _PooledBrowser:
+        """Start a new browser and register it with the pool."""
+        if self.browser_config is not None:
+            crawler = AsyncWebCrawler(config=self.browser_config)
+        else:
+            crawler = AsyncWebCrawler()
+        await crawler.start()
+
+        entry = _PooledBrowser(crawler)
+        self._browsers.append(entry)
+        self.stats['launched'] += 1
+        return entry
+
+    async def _retire(self, entry: _PooledBrowser):
+        """Close a browser and drop it from the pool."""
+        if entry in self._browsers:
+            self._browsers.remove(entry)
+        await entry.crawler.close()
+
+    def _record_navigation(self, entry: _PooledBrowser):
+        """Count a navigation and mark the browser for recycling if due."""
+        entry.navigations += 1
+        self.stats['navigations'] += 1
+        if self.recycle_after and entry.navigations >= self.recycle_after and not entry.retiring:
+            entry.retiring = True
+            self.stats['recycled'] += 1
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[BrowserLease]:
+        """
+        Lease a browser from the pool.
+
+        Yields:
+            BrowserLease bound to a started browser
+        """
+        async with self._lock:
+            live = [b for b in self._browsers if not b.retiring]
+            entry = min(live, key=lambda b: b.active) if live else None
+            if entry is None or (entry.active > 0 and len(live) < self.size):
+                entry = await self._launch()
+            entry.active += 1
+
+        try:
+            yield BrowserLease(self, entry)
+        finally:
+            entry.active -= 1
+            if entry.retiring and entry.active == 0:
+                await self._retire(entry)
+
+    async def close(self):
+        """
+        Shut down all browsers.
+
+        Idle browsers are closed immediately; busy ones close as soon as their
+        last lease ends. The pool stays usable and launches fresh browsers on
+        the next ``acquire()``.
+        """
+        async with self._lock:
+            for entry in self._browsers:
+                entry.retiring = True
+            idle = [b for b in self._browsers if b.active == 0]
+
+        for entry in idle:
+            await self._retire(entry)
+
+    @property
+    def live_browsers(self) -> int:
+        """Number of browsers currently running."""
+        return len(self._browsers)
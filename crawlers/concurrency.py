@@ -0,0 +1,232 @@
+"""
+Adaptive Concurrency - Per-host request limits driven by server feedback
+
+Replaces fixed semaphores with additive-increase/multiplicative-decrease
+(AIMD) limits per host. Fast, healthy responses slowly raise a host's limit;
+429/503 responses, server errors, exceptions and latency spikes cut it in
+half, and ``Retry-After`` headers pause the host until the server is ready.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlparse
+
+
+@dataclass
+class HostState:
+    """Concurrency state for a single host."""
+    limit: float
+    in_flight: int = 0
+    latency: Optional[float] = None  # EWMA of healthy request latency
+    blocked_until: float = 0.0
+    last_decrease: float = 0.0
+    throttled: int = 0
+    errors: int = 0
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def wake(self):
+        """Wake every task waiting for this host."""
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+
+class AdaptiveConcurrencyController:
+    """
+    Per-host AIMD concurrency limits shared by all crawlers.
+
+    Args:
+        initial_limit: Starting concurrent requests per host (default: 4)
+        min_limit: Lowest limit a host can be reduced to (default: 1)
+        max_limit: Highest limit a host can grow to (default: 16)
+        decrease_factor: Multiplier applied on throttling or errors (default: 0.5)
+        latency_tolerance: Latency above this multiple of the host's average
+            counts as congestion (default: 2.0)
+        max_retry_after: Longest Retry-After pause honored, in seconds (default: 120)
+        progress_tracker: Receives limit changes via ``update_concurrency()`` (optional)
+    """
+
+    # Statuses that mean "slow down" rather than "page is broken"
+    THROTTLE_STATUSES = (429, 503)
+
+    DEFAULT_INITIAL_LIMIT = 4
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        max_retry_after: float = 120.0,
+        progress_tracker: Optional[Any] = None
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit, min_limit)
+        self.initial_limit = min(max(initial_limit, min_limit), self.max_limit)
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.max_retry_after = max_retry_after
+        self.progress_tracker = progress_tracker
+
+        self._hosts: Dict[str, HostState] = {}
+        self._reported: Dict[str, int] = {}
+
+    def _host(self, url: str) -> str:
+        return urlparse(url).netloc or url
+
+    def _state(self, url: str) -> HostState:
+        host = self._host(url)
+        if host not in self._hosts:
+            self._hosts[host] = HostState(limit=float(self.initial_limit))
+        return self._hosts[host]
+
+    def limit_for(self, url: str) -> int:
+        """Current concurrent request limit for the URL's host."""
+        return int(self._state(url).limit)
+
+    @property
+    def limits(self) -> Dict[str, int]:
+        """Current limit of every host seen so far."""
+        return {host: int(state.limit) for host, state in self._hosts.items()}
+
+    def _report(self, url: str, state: HostState):
+        """Forward limit changes to the progress tracker."""
+        host = self._host(url)
+        limit = int(state.limit)
+        if self._reported.get(host) == limit:
+            return
+        self._reported[host] = limit
+        if self.progress_tracker and hasattr(self.progress_tracker, 'update_concurrency'):
+            self.progress_tracker.update_concurrency(host, limit)
+
+    def _increase(self, url: str, state: HostState):
+        # Additive increase: roughly +1 per limit's worth of healthy responses
+        state.limit = min(self.max_limit, state.limit + 1.0 / state.limit)
+        self._report(url, state)
+
+    def _decrease(self, url: str, state: HostState):
+        # Multiplicative decrease, at most once per typical response time so a
+        # burst of failures from one congested moment only counts once
+        now = time.monotonic()
+        if state.last_decrease and now - state.last_decrease < (state.latency or 1.0):
+            return
+        state.limit = max(float(self.min_limit), state.limit * self.decrease_factor)
+        state.last_decrease = now
+        self._report(url, state)
+
+    def _parse_retry_after(self, value: str) -> Optional[float]:
+        """Convert a Retry-After header (seconds or HTTP date) to seconds."""
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def observe(self, url: str, status_code: Any, headers: Optional[Mapping[str, str]] = None):
+        """
+        Feed an HTTP response status back into the host's limit.
+
+        Args:
+            url: URL that was requested
+            status_code: Response status; non-integer values are ignored
+            headers: Response headers, checked for ``Retry-After``
+        """
+        if not isinstance(status_code, int):
+            return
+
+        state = self._state(url)
+        if status_code in self.THROTTLE_STATUSES:
+            state.throttled += 1
+            self._decrease(url, state)
+
+            retry_after = None
+            if isinstance(headers, Mapping):
+                for name, value in headers.items():
+                    if str(name).lower() == 'retry-after':
+                        retry_after = self._parse_retry_after(str(value))
+                        break
+            if retry_after:
+                pause = min(retry_after, self.max_retry_after)
+                state.blocked_until = max(state.blocked_until, time.monotonic() + pause)
+        elif status_code >= 500:
+            state.errors += 1
+            self._decrease(url, state)
+
+    def record_latency(self, url: str, seconds: float, started: Optional[float] = None):
+        """
+        Feed a completed request's latency back into the host's limit.
+
+        Used directly by batch crawls that do not go through ``slot()``.
+
+        Args:
+            url: URL that was requested
+            seconds: Time the request took
+            started: Monotonic start time; no increase if the host was
+                throttled after this point
+        """
+        state = self._state(url)
+        if started is None:
+            started = time.monotonic() - seconds
+
+        if state.latency is not None and seconds > state.latency * self.latency_tolerance:
+            self._decrease(url, state)
+        elif state.last_decrease < started:
+            self._increase(url, state)
+
+        state.latency = seconds if state.latency is None else 0.8 * state.latency + 0.2 * seconds
+
+    def record_failure(self, url: str):
+        """Count a failed request (exception or unusable response) against the host."""
+        state = self._state(url)
+        state.errors += 1
+        self._decrease(url, state)
+
+    async def wait_ready(self, url: str):
+        """Wait out any Retry-After pause for the URL's host."""
+        state = self._state(url)
+        delay = state.blocked_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _acquire(self, state: HostState):
+        while True:
+            delay = state.blocked_until - time.monotonic()
+            if delay <= 0 and state.in_flight < int(state.limit):
+                state.in_flight += 1
+                return
+            try:
+                await asyncio.wait_for(state.changed.wait(), timeout=delay if delay > 0 else None)
+            except asyncio.TimeoutError:
+                pass
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """
+        Hold one of the host's request slots for the duration of the block.
+
+        Waits while the host is at its limit or paused by Retry-After. Leaving
+        the block records the latency; an exception counts as a failure.
+        """
+        state = self._state(url)
+        await self._acquire(state)
+        started = time.monotonic()
+        try:
+            yield
+        except Exception:
+            self.record_failure(url)
+            raise
+        else:
+            self.record_latency(url, time.monotonic() - started, started)
+        finally:
+            state.in_flight -= 1
+            state.wake()
@@ -0,0 +1,142 @@
+"""
+Crawl Journal - Crash-safe, append-only record of crawl progress
+
+Every frontier entry, completed URL and output file is appended to a
+JSON-lines file under the output directory. Writes are flushed and fsynced
+in batches, so a crash loses at most the last unsynced batch, and replaying
+the journal to resume a crawl is a single linear pass over the file.
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass
+class JournalState:
+    """Crawl state rebuilt from a journal."""
+    # url -> (depth, parent) for every URL ever queued
+    queued: Dict[str, Tuple[int, Optional[str]]] = field(default_factory=dict)
+    # url -> done record (includes 'path' and any extra fields)
+    completed: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # url -> last error message, cleared once the URL completes
+    failed: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def pending(self) -> Dict[str, Tuple[int, Optional[str]]]:
+        """Queued URLs that never completed."""
+        return {url: entry for url, entry in self.queued.items() if url not in self.completed}
+
+
+class CrawlJournal:
+    """
+    Append-only JSON-lines journal with batched fsync.
+
+    Args:
+        output_dir: Directory the journal file lives in
+        filename: Journal file name (default: 'crawl_journal.jsonl')
+        sync_every: Records between fsyncs (default: 50)
+        sync_interval: Maximum seconds between fsyncs (default: 1.0)
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        filename: str = "crawl_journal.jsonl",
+        sync_every: int = 50,
+        sync_interval: float = 1.0
+    ):
+        self.path = Path(output_dir) / filename
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+
+        self._file = None
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def load(self) -> JournalState:
+        """
+        Replay the journal in one pass.
+
+        A torn final line left by a crash is ignored.
+        """
+        state = JournalState()
+        if not self.path.exists():
+            return state
+
+        with open(self.path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+
+                url = record.get('url')
+                event = record.get('event')
+                if not url:
+                    continue
+                if event == 'queued':
+                    state.queued.setdefault(url, (record.get('depth', 0), record.get('parent')))
+                elif event == 'done':
+                    state.completed[url] = record
+                    state.failed.pop(url, None)
+                elif event == 'failed':
+                    state.failed[url] = record.get('error', '')
+
+        return state
+
+    def reset(self):
+        """Discard the journal to start a fresh crawl."""
+        self.close()
+        if self.path.exists():
+            self.path.unlink()
+
+    def _open(self):
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Terminate a torn final line so the next record starts cleanly
+            needs_newline = False
+            if self.path.exists() and self.path.stat().st_size > 0:
+                with open(self.path, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    needs_newline = f.read(1) != b'\n'
+            self._file = open(self.path, 'a', encoding='utf-8')
+            if needs_newline:
+                self._file.write('\n')
+        return self._file
+
+    def _append(self, record: Dict[str, Any]):
+        self._open().write(json.dumps(record) + '\n')
+        self._pending += 1
+        if self._pending >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+
+    def record_queued(self, url: str, depth: int, parent: Optional[str] = None):
+        """Record a URL entering the frontier."""
+        self._append({'event': 'queued', 'url': url, 'depth': depth, 'parent': parent})
+
+    def record_done(self, url: str, path: Optional[str] = None, **extra: Any):
+        """Record a completed URL and the file its output was written to."""
+        self._append({'event': 'done', 'url': url, 'path': path, **extra})
+
+    def record_failed(self, url: str, error: str = ""):
+        """Record a URL that failed; it is retried on resume."""
+        self._append({'event': 'failed', 'url': url, 'error': error})
+
+    def sync(self):
+        """Flush buffered records and fsync them to disk."""
+        if self._file is not None and self._pending:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """Sync and close the journal file."""
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
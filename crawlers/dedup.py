@@ -0,0 +1,224 @@
+"""
+Duplicate Detector - Streaming near-duplicate detection for crawled pages
+
+Documentation sites serve the same page under many URLs (trailing slashes,
+locale variants, query parameters, redirects). Each page's markdown is
+reduced to a 64-bit SimHash of the word shingles of its main content (lines
+dominated by links, such as navigation, are left out) and looked up in an
+in-memory LSH index. Every LSH candidate is confirmed by the Jaccard
+similarity of the two pages' shingle sets, estimated from fixed-size bottom-k
+MinHash signatures, before the page is recorded as an alias of the first (canonical)
+URL instead of being saved again. Per-page state stays constant-size however
+long the page is.
+"""
+
+import hashlib
+import heapq
+import json
+import re
+from array import array
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+FINGERPRINT_BITS = 64
+
+_WORD_RE = re.compile(r"\w+")
+_LINK_RE = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+
+
+def is_link_line(line: str) -> bool:
+    """Whether at least half of a line's visible text is link text (menus, breadcrumbs)."""
+    links = _LINK_RE.findall(line)
+    if not links:
+        return False
+    visible = _LINK_RE.sub(lambda match: match.group(1), line)
+    link_chars = sum(len(text.strip()) for text in links)
+    return link_chars * 2 >= len(visible.strip(" \t*-+>|#"))
+
+
+def main_text(markdown: str) -> str:
+    """Drop lines that are mostly links (menus, sidebars, breadcrumbs)."""
+    return "\n".join(line for line in markdown.splitlines() if not is_link_line(line))
+
+
+class DuplicateDetector:
+    """
+    SimHash fingerprints with banded LSH lookup.
+
+    Two pages are candidates when their fingerprints differ in at most
+    ``(1 - threshold) * 64`` bits. The fingerprint is split into one more
+    band than that distance, so by the pigeonhole principle any candidate
+    shares at least one band with the page it duplicates and is always found.
+    A candidate is a near-duplicate only if the Jaccard similarity of the
+    two pages' shingle sets, estimated from their MinHash signatures, is at
+    least ``threshold``.
+
+    Args:
+        threshold: Shingle similarity (0-1) at or above which pages are duplicates (default: 0.9)
+        shingle_size: Words per shingle (default: 3)
+        min_words: Pages with fewer words are never treated as duplicates (default: 20)
+        signature_size: Smallest shingle hashes kept per page as its
+            bottom-k MinHash signature (default: 128)
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        shingle_size: int = 3,
+        min_words: int = 20,
+        signature_size: int = 128
+    ):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"Similarity threshold must be in (0, 1]: {threshold}")
+
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.min_words = min_words
+        self.max_distance = int((1.0 - threshold) * FINGERPRINT_BITS)
+
+        # Split the fingerprint into max_distance + 1 bands of near-equal width
+        band_count = min(self.max_distance + 1, FINGERPRINT_BITS)
+        widths = [FINGERPRINT_BITS // band_count + (1 if i < FINGERPRINT_BITS % band_count else 0)
+                  for i in range(band_count)]
+        self._bands: List[Tuple[int, int]] = []
+        offset = 0
+        for width in widths:
+            self._bands.append((offset, (1 << width) - 1))
+            offset += width
+
+        self._index: List[Dict[int, List[str]]] = [{} for _ in self._bands]
+        self.signature_size = signature_size
+        self.fingerprints: Dict[str, int] = {}
+        self.signatures: Dict[str, array] = {}
+        self.alias_of: Dict[str, str] = {}
+
+    def shingle_set(self, text: str) -> Optional[FrozenSet[int]]:
+        """
+        Hash the word shingles of a page's main content.
+
+        Returns:
+            Set of 64-bit shingle hashes, or None for pages too short to compare
+        """
+        words = _WORD_RE.findall(main_text(text).lower())
+        if len(words) < max(self.min_words, self.shingle_size):
+            return None
+        return frozenset(
+            int.from_bytes(
+                hashlib.blake2b(" ".join(words[i:i + self.shingle_size]).encode('utf-8'), digest_size=8).digest(),
+                'big'
+            )
+            for i in range(len(words) - self.shingle_size + 1)
+        )
+
+    def fingerprint(self, text: str) -> Optional[int]:
+        """
+        Compute the SimHash of a page's text.
+
+        Returns:
+            64-bit fingerprint, or None for pages too short to compare
+        """
+        shingles = self.shingle_set(text)
+        return self._simhash(shingles) if shingles is not None else None
+
+    @staticmethod
+    def _simhash(shingles: FrozenSet[int]) -> int:
+        counts = [0] * FINGERPRINT_BITS
+        for value in shingles:
+            for bit in range(FINGERPRINT_BITS):
+                counts[bit] += 1 if value >> bit & 1 else -1
+
+        fingerprint = 0
+        for bit, count in enumerate(counts):
+            if count > 0:
+                fingerprint |= 1 << bit
+        return fingerprint
+
+    def _band_keys(self, fingerprint: int):
+        for offset, mask in self._bands:
+            yield fingerprint >> offset & mask
+
+    def signature(self, shingles: FrozenSet[int]) -> array:
+        """Bottom-k MinHash signature: the smallest shingle hashes, sorted."""
+        return array('Q', heapq.nsmallest(self.signature_size, shingles))
+
+    def find(self, fingerprint: int, signature: Optional[array] = None) -> Optional[str]:
+        """
+        Return the canonical URL of an indexed near-duplicate, if any.
+
+        With ``signature``, LSH candidates must also reach the similarity
+        threshold estimated from their MinHash signatures.
+        """
+        checked = set()
+        for band, key in enumerate(self._band_keys(fingerprint)):
+            for url in self._index[band].get(key, ()):
+                if url in checked:
+                    continue
+                checked.add(url)
+                if bin(self.fingerprints[url] ^ fingerprint).count('1') > self.max_distance:
+                    continue
+                if signature is None or self.similarity(signature, self.signatures.get(url)) >= self.threshold:
+                    return url
+        return None
+
+    def similarity(self, a: array, b: Optional[array]) -> float:
+        """
+        Jaccard similarity estimated from two bottom-k signatures.
+
+        The k smallest hashes of the union are a uniform sample of it; the
+        share of them found in both signatures estimates the Jaccard index.
+        Exact for pages with at most k shingles.
+        """
+        if not a or not b:
+            return 0.0
+        sample = heapq.nsmallest(self.signature_size, set(a) | set(b))
+        both = set(a) & set(b)
+        return sum(value in both for value in sample) / len(sample)
+
+    def add(self, url: str, fingerprint: int, signature: Optional[array] = None):
+        """Index a canonical page."""
+        self.fingerprints[url] = fingerprint
+        if signature is not None:
+            self.signatures[url] = signature
+        for band, key in enumerate(self._band_keys(fingerprint)):
+            self._index[band].setdefault(key, []).append(url)
+
+    def check(self, url: str, text: str) -> Optional[str]:
+        """
+        Fingerprint a page and either index it or record it as an alias.
+
+        Returns:
+            The canonical URL when the page is a near-duplicate, otherwise
+            None (the page is indexed as a new canonical page)
+        """
+        if url in self.fingerprints:
+            return None
+
+        shingles = self.shingle_set(text)
+        if shingles is None:
+            return None
+
+        fingerprint = self._simhash(shingles)
+        signature = self.signature(shingles)
+        canonical = self.find(fingerprint, signature)
+        if canonical is not None:
+            self.alias_of[url] = canonical
+            return canonical
+
+        self.add(url, fingerprint, signature)
+        return None
+
+    @property
+    def aliases(self) -> Dict[str, List[str]]:
+        """Alias URLs grouped by their canonical URL."""
+        grouped: Dict[str, List[str]] = {}
+        for alias, canonical in self.alias_of.items():
+            grouped.setdefault(canonical, []).append(alias)
+        return grouped
+
+    def save_aliases(self, path: Path) -> Optional[Path]:
+        """Write the canonical -> aliases mapping as JSON, if there are any aliases."""
+        if not self.alias_of:
+            return None
+        path = Path(path)
+        path.write_text(json.dumps(self.aliases, indent=2), encoding='utf-8')
+        return path
@@ -6,12 +6,17 @@ and saves the content as markdown files.
 """
 
 import asyncio
+import heapq
+import itertools
+import json
 import os
+import sys
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Any
+from typing import List, Dict, Set, Optional, Any, Tuple, Iterable
 from urllib.parse import urlparse, urljoin, urldefrag
 from datetime import datetime
 import hashlib
+import time
 
 from crawl4ai import (
     AsyncWebCrawler,
@@ -21,6 +26,16 @@ from crawl4ai import (
     MemoryAdaptiveDispatcher
 )
 
+from .tiered_fetcher import HttpResponse, StaticPage, TieredFetcher
+from .concurrency import AdaptiveConcurrencyController
+from .page_cache import PageCache
+from .crawl_journal import CrawlJournal
+from .dedup import DuplicateDetector
+from .boilerplate import BoilerplateStripper
+from .sitemap import SitemapReader, path_depth
+from .filename_registry import FilenameRegistry
+from .visited_set import bytes_per_url, create_visited_set
+
 
 class DepthCrawler:
     """
@@ -30,9 +45,37 @@ class DepthCrawler:
         root_url: The starting URL to crawl
         max_depth: Maximum depth to crawl (default: 2)
         output_dir: Directory to save markdown files (default: 'crawled_content')
-        max_concurrent: Maximum concurrent browser sessions (default: 5)
+        max_concurrent: Maximum concurrent browser sessions (default: 5); the
+            adaptive per-host limit never exceeds this
         memory_threshold: Memory usage threshold percentage (default: 70.0)
         exclude_patterns: List of URL patterns to exclude from crawling
+        http_first: Fetch pages over plain HTTP first and render only pages
+            that look like they need JavaScript (default: False)
+        concurrency: Shared AdaptiveConcurrencyController (optional; one is
+            created per crawler otherwise)
+        refresh: Page cache refresh policy ('conditional', 'always' or
+            'never'); None disables the page cache (default: None)
+        cache_dir: Page cache location (default: <output_dir>/.page_cache)
+        resume: Continue an interrupted crawl from the journal in output_dir,
+            skipping URLs already completed (default: False)
+        dedup_threshold: Similarity (0-1) at which a page is recorded as an
+            alias of an earlier page instead of saved; None disables
+            duplicate detection (default: None)
+        boilerplate_threshold: Fraction of pages (0-1) a block or link line must
+            appear on to be stripped as site chrome before saving; None
+            disables stripping (default: None)
+        use_sitemap: Queue sitemap URLs at their path depth below root_url;
+            with the page cache enabled, pages whose lastmod predates their
+            cached copy are reused without any request (default: False)
+        streaming: Save each page and queue its links as soon as it finishes
+            instead of waiting for the whole depth level (default: False)
+        content_addressed: Suffix filenames with a hash of the page content
+            instead of a counter, so identical pages share one file; later
+            URLs with the same file are recorded as aliases (default: False)
+        visited_backend: 'exact' keeps visited URLs as interned strings in
+            memory; 'compact' keeps a Bloom filter in memory and confirms
+            hits against an on-disk store, and stops keeping the URL of
+            every saved file in memory (default: 'exact')
     """
     
     def __init__(
@@ -43,7 +86,18 @@ class DepthCrawler:
         max_concurrent: int = 5,
         memory_threshold: float = 70.0,
         exclude_patterns: Optional[List[str]] = None,
-        progress_tracker: Optional[Any] = None
+        progress_tracker: Optional[Any] = None,
+        http_first: bool = False,
+        concurrency: Optional[AdaptiveConcurrencyController] = None,
+        refresh: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        resume: bool = False,
+        dedup_threshold: Optional[float] = None,
+        boilerplate_threshold: Optional[float] = None,
+        use_sitemap: bool = False,
+        streaming: bool = False,
+        content_addressed: bool = False,
+        visited_backend: str = 'exact'
     ):
         self.root_url = self._normalize_url(root_url)
         self.max_depth = max_depth
@@ -52,16 +106,45 @@ class DepthCrawler:
         self.memory_threshold = memory_threshold
         self.exclude_patterns = exclude_patterns or []
         self.progress_tracker = progress_tracker
+        self.http_first = http_first
+        self.streaming = streaming
+        self.content_addressed = content_addressed
+        # Content-addressed file name -> URL whose page it holds
+        self.content_files: Dict[str, str] = {}
+        # URL -> URL of the page with identical content and file name
+        self.content_aliases: Dict[str, str] = {}
         
         # Parse root domain for internal link checking
         self.root_domain = urlparse(self.root_url).netloc
         
+        # Create output directory
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        
         # Track visited URLs
-        self.visited_urls: Set[str] = set()
+        self.visited_backend = visited_backend
+        self.visited_urls = create_visited_set(visited_backend, self.output_dir / ".visited.sqlite")
         self.url_to_filepath: Dict[str, Path] = {}
+        self.track_filepaths = visited_backend == 'exact'
         
-        # Create output directory
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Redirected URLs mapped to where they landed, for the stitcher
+        self.redirects: Dict[str, str] = {}
+        
+        # Near-duplicate pages are recorded as aliases of the canonical page
+        self.duplicates = DuplicateDetector(dedup_threshold) if dedup_threshold is not None else None
+        
+        # Navigation, breadcrumbs and other chrome repeated across pages are stripped
+        self.boilerplate = BoilerplateStripper(boilerplate_threshold) if boilerplate_threshold is not None else None
+        # Pages saved before the stripper had seen enough pages; stripped after the crawl
+        self.unstripped_files: List[Path] = []
+        
+        # Names already on disk are registered once; saves never probe the filesystem
+        self.filenames = FilenameRegistry(self.output_dir)
+        
+        # Append-only progress journal; replayed on resume, restarted otherwise
+        self.journal = CrawlJournal(self.output_dir)
+        self.resume_state = self.journal.load() if resume else None
+        if not resume:
+            self.journal.reset()
         
         # Initialize crawler configs
         self.browser_config = BrowserConfig(
@@ -76,12 +159,40 @@ class DepthCrawler:
             exclude_external_links=True,
             exclude_social_media_links=True
         )
+        self.stream_config = self.run_config.clone(stream=True)
         
         self.dispatcher = MemoryAdaptiveDispatcher(
             memory_threshold_percent=self.memory_threshold,
             check_interval=1.0,
             max_session_permit=self.max_concurrent
         )
+        
+        # Per-host AIMD limit; sizes each browser batch and gates HTTP fetches
+        # Start at most at the configured concurrency and ramp up to it
+        self.concurrency = concurrency or AdaptiveConcurrencyController(
+            initial_limit=min(self.max_concurrent, AdaptiveConcurrencyController.DEFAULT_INITIAL_LIMIT),
+            max_limit=self.max_concurrent,
+            progress_tracker=self.progress_tracker
+        )
+        
+        # HTTP tier for static pages; also counts which tier served each page
+        self.fetcher = TieredFetcher(
+            max_connections=self.max_concurrent * 2,
+            controller=self.concurrency
+        )
+        
+        # Conditional-GET cache; crawl4ai's own cache stays bypassed
+        self.page_cache = None
+        if refresh is not None:
+            self.page_cache = PageCache(cache_dir or self.output_dir / ".page_cache", refresh=refresh)
+        
+        # Sitemap lastmod dates by URL
+        self.use_sitemap = use_sitemap
+        self.sitemap_lastmod: Dict[str, Optional[datetime]] = {}
+        
+        # URLs queued from outside while crawling (e.g. navigation links), by depth
+        self.seed_urls: Dict[int, Set[str]] = {}
+        self.current_depth = -1
     
     def _normalize_url(self, url: str) -> str:
         """Remove fragment and trailing slash from URL."""
@@ -135,16 +246,151 @@ class DepthCrawler:
         
         return self.output_dir / f"{filename}.md"
     
+    async def _revalidate(
+        self,
+        urls: List[str]
+    ) -> Tuple[List[StaticPage], List[str], Dict[str, HttpResponse]]:
+        """
+        Check cached pages with conditional GETs.
+        
+        Returns:
+            Tuple of (results rebuilt from unchanged cached pages, URLs that
+            must be crawled, revalidation responses by URL)
+        """
+        async def check(url: str):
+            entry = self.page_cache.lookup(url)
+            if self.page_cache.serves_without_request(entry, self.sitemap_lastmod.get(url)):
+                return entry, None
+            async with self.concurrency.slot(url):
+                response = await self.fetcher.fetch_response(url, self.page_cache.request_headers(entry))
+            return (entry if self.page_cache.is_unchanged(entry, response) else None), response
+        
+        checks = await asyncio.gather(*(check(url) for url in urls))
+        
+        cached_results = []
+        remaining = []
+        responses = {}
+        for url, (entry, response) in zip(urls, checks):
+            if response is not None:
+                responses[url] = response
+            if entry is None:
+                self.page_cache.stats['misses'] += 1
+                remaining.append(url)
+                continue
+            
+            entry = self.page_cache.touch(entry, response)
+            cached_results.append(StaticPage(
+                url=url,
+                html="",
+                markdown=entry.markdown,
+                metadata=entry.metadata,
+                links={'internal': [{'href': link} for link in entry.links], 'external': []}
+            ))
+        
+        return cached_results, remaining, responses
+    
+    async def _fetch_static(
+        self,
+        urls: List[str],
+        responses: Optional[Dict[str, HttpResponse]] = None
+    ) -> Tuple[List[Any], List[str]]:
+        """
+        Serve as many URLs as possible over plain HTTP.
+        
+        Args:
+            urls: URLs to fetch
+            responses: Bodies already downloaded while revalidating the cache
+        
+        Returns:
+            Tuple of (static results, URLs that still need a browser render)
+        """
+        responses = responses or {}
+        
+        async def fetch(url: str):
+            html = responses[url].html if url in responses else None
+            async with self.concurrency.slot(url):
+                return await self.fetcher.fetch(url, html)
+        
+        pages = await asyncio.gather(*(fetch(url) for url in urls))
+        
+        static_results = []
+        browser_urls = []
+        for url, page in zip(urls, pages):
+            if page is not None:
+                static_results.append(page)
+            else:
+                browser_urls.append(url)
+        
+        return static_results, browser_urls
+    
+    async def _crawl_browser_batch(self, crawler: AsyncWebCrawler, urls: List[str]) -> List[Any]:
+        """
+        Render URLs with arun_many, sized by the adaptive concurrency limit.
+        
+        The dispatcher's session permit follows the root host's current limit,
+        and every result's status, headers and latency are fed back into the
+        controller for the next batch.
+        """
+        await self.concurrency.wait_ready(self.root_url)
+        self.dispatcher.max_session_permit = self.concurrency.limit_for(self.root_url)
+        
+        browser_results = await crawler.arun_many(
+            urls=urls,
+            config=self.run_config,
+            dispatcher=self.dispatcher
+        )
+        
+        results = []
+        for result in browser_results:
+            results.append(result)
+            self.fetcher.record_hit('browser')
+            self._observe_result(result)
+        return results
+    
+    def _observe_result(self, result: Any):
+        """Report a browser result's status and latency to the concurrency controller."""
+        self.concurrency.observe(
+            result.url,
+            getattr(result, 'status_code', None),
+            getattr(result, 'response_headers', None)
+        )
+        
+        dispatch = getattr(result, 'dispatch_result', None)
+        start = getattr(dispatch, 'start_time', None)
+        end = getattr(dispatch, 'end_time', None)
+        if isinstance(start, datetime) and isinstance(end, datetime):
+            start, end = start.timestamp(), end.timestamp()
+        if result.success and isinstance(start, (int, float)) and isinstance(end, (int, float)):
+            # Dispatcher timestamps are wall-clock; convert the start to our monotonic clock
+            started = time.monotonic() - (time.time() - start)
+            self.concurrency.record_latency(result.url, max(0.0, end - start), started)
+    
+    def _content_addressed_path(self, url: str, content: str, depth: int) -> Tuple[Path, str]:
+        """
+        Name a page after its URL and a hash of its content.
+        
+        Returns:
+            Tuple of (file path, URL whose page the file holds); a different
+            URL means the page is recorded as an alias of that URL
+        """
+        filepath = self._generate_filename(url, depth)
+        digest = hashlib.sha256(str(content).encode('utf-8')).hexdigest()[:12]
+        filepath = filepath.with_stem(f"{filepath.stem}_{digest}")
+        owner = self.content_files.setdefault(filepath.name, url)
+        if owner != url:
+            self.content_aliases[url] = owner
+        return filepath, owner
+    
     def _save_markdown(self, url: str, content: str, depth: int, metadata: Dict) -> Path:
         """Save crawled content as markdown with metadata."""
-        filepath = self._generate_filename(url, depth)
-        
         # Ensure unique filepath
-        counter = 1
-        original_filepath = filepath
-        while filepath.exists():
-            filepath = original_filepath.with_stem(f"{original_filepath.stem}_{counter}")
-            counter += 1
+        if self.content_addressed:
+            filepath, owner = self._content_addressed_path(url, content, depth)
+            if owner != url:
+                # Identical page already saved under this name; keep its URL
+                return filepath
+        else:
+            filepath = self.filenames.allocate(self._generate_filename(url, depth))
         
         # Create markdown with metadata header
         markdown_content = f"""---
@@ -161,10 +407,28 @@ description: {metadata.get('description', '')}
 """
         
         filepath.write_text(markdown_content, encoding='utf-8')
-        self.url_to_filepath[url] = filepath
+        if self.track_filepaths:
+            self.url_to_filepath[sys.intern(url)] = filepath
         
         return filepath
     
+    def close(self):
+        """
+        Release the visited-URL store and the journal.
+        
+        Call once the crawler is no longer needed; crawl() and
+        add_seed_urls() keep working until then, so one crawler can be
+        crawled again or seeded after a crawl.
+        """
+        self.visited_urls.close()
+        self.journal.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        self.close()
+    
     async def crawl(self) -> Dict[str, any]:
         """
         Perform depth-based crawling starting from root URL.
@@ -177,13 +441,168 @@ description: {metadata.get('description', '')}
             'successful': 0,
             'failed': 0,
             'files_created': [],
-            'errors': []
+            'duplicates': 0,
+            'sitemap_urls': 0,
+            'boilerplate_chars_removed': 0,
+            'errors': [],
+            'fetch_tiers': self.fetcher.stats,
+            'concurrency_limits': self.concurrency.limits
         }
         
+        self.current_depth = -1
         current_urls = {self.root_url}
+        start_depth = 0
+        carry: Dict[int, Set[str]] = {}
+        if self.resume_state and self.resume_state.queued:
+            current_urls, start_depth, carry = self._restore_from_journal(results)
+        else:
+            self.journal.record_queued(self.root_url, 0)
+        
+        try:
+            if self.use_sitemap:
+                await self._seed_from_sitemap(carry)
+            if self.streaming:
+                await self._crawl_streaming(current_urls, results, start_depth, carry)
+            else:
+                await self._crawl_levels(current_urls, results, start_depth, carry)
+        finally:
+            # Levels are done; later seeds have nowhere to go
+            self.current_depth = self.max_depth + 1
+            await self.fetcher.close()
+            self.journal.close()
+            results['concurrency_limits'] = self.concurrency.limits
+            self.visited_urls.flush()
+            results['visited_backend'] = self.visited_backend
+            results['visited_bytes_per_url'] = bytes_per_url(self.visited_urls)
+            results['sitemap_urls'] = len(self.sitemap_lastmod)
+            if self.boilerplate:
+                results['boilerplate_chars_removed'] = self.boilerplate.stats['chars_removed']
+        
+        if self.boilerplate and self.unstripped_files:
+            for filepath in self.unstripped_files:
+                self.boilerplate.strip_saved(filepath)
+            results['boilerplate_chars_removed'] = self.boilerplate.stats['chars_removed']
+        
+        aliases = self.duplicates.aliases if self.duplicates else {}
+        for alias, canonical in self.content_aliases.items():
+            aliases.setdefault(canonical, []).append(alias)
+        if aliases:
+            (self.output_dir / "aliases.json").write_text(json.dumps(aliases, indent=2), encoding='utf-8')
+        if self.redirects:
+            (self.output_dir / "redirects.json").write_text(json.dumps(self.redirects, indent=2), encoding='utf-8')
+        
+        # Generate summary
+        self._generate_summary(results)
+        
+        return results
+    
+    async def _seed_from_sitemap(self, carry: Dict[int, Set[str]]) -> int:
+        """
+        Add sitemap URLs below the root to the pending URLs of their depth.
+        
+        Returns:
+            Number of URLs added
+        """
+        reader = SitemapReader(self.root_url, fetcher=self.fetcher)
+        pages = await reader.read()
+        
+        added = 0
+        for url, lastmod in pages.items():
+            if not self._is_valid_url(url):
+                continue
+            self.sitemap_lastmod[url] = lastmod
+            depth = path_depth(url, self.root_url)
+            if 0 < depth <= self.max_depth and url not in self.visited_urls:
+                carry.setdefault(depth, set()).add(url)
+                self.journal.record_queued(url, depth)
+                added += 1
+        
+        print(f"Sitemap: {len(pages)} URLs listed, {added} queued")
+        return added
+    
+    def add_seed_urls(self, urls: Iterable[str]) -> int:
+        """
+        Queue URLs found outside the crawl, such as navigation links.
+        
+        Safe to call while crawl() is running. Each URL is queued at its
+        path depth below the root, or at the next level not yet started when
+        the crawl is already past that depth.
+        
+        Args:
+            urls: Absolute URLs to queue
+        
+        Returns:
+            Number of URLs queued
+        """
+        pending = set().union(*self.seed_urls.values())
+        added = 0
+        for url in urls:
+            url = self._normalize_url(url)
+            if url in pending or url in self.visited_urls or not self._is_valid_url(url):
+                continue
+            depth = max(path_depth(url, self.root_url), self.current_depth + 1)
+            if depth > self.max_depth:
+                continue
+            self.seed_urls.setdefault(depth, set()).add(url)
+            self.journal.record_queued(url, depth)
+            pending.add(url)
+            added += 1
+        return added
+    
+    def _restore_from_journal(self, results: Dict[str, Any]) -> Tuple[Set[str], int, Dict[int, Set[str]]]:
+        """
+        Rebuild crawl state from the journal.
+        
+        Returns:
+            Tuple of (URLs to crawl first, their depth, pending URLs of
+            deeper levels by depth)
+        """
+        state = self.resume_state
+        for url, record in state.completed.items():
+            self.visited_urls.add(url)
+            if record.get('path'):
+                if self.track_filepaths:
+                    self.url_to_filepath[url] = Path(record['path'])
+                if self.content_addressed:
+                    self.content_files[Path(record['path']).name] = url
+                results['files_created'].append(record['path'])
+        results['resumed'] = len(state.completed)
+        
+        by_depth: Dict[int, Set[str]] = {}
+        for url, (depth, _) in state.pending.items():
+            by_depth.setdefault(depth, set()).add(url)
+        
+        if not by_depth:
+            return set(), self.max_depth + 1, {}
+        
+        start_depth = min(by_depth)
+        current_urls = by_depth.pop(start_depth)
+        print(f"Resuming at depth {start_depth}: {len(state.completed)} URLs done, "
+              f"{len(current_urls) + sum(map(len, by_depth.values()))} pending")
+        return current_urls, start_depth, by_depth
+    
+    async def _crawl_levels(
+        self,
+        current_urls: Set[str],
+        results: Dict[str, Any],
+        start_depth: int = 0,
+        carry: Optional[Dict[int, Set[str]]] = None
+    ):
+        """
+        Crawl level by level until max_depth or no new URLs remain.
         
+        Args:
+            current_urls: URLs at start_depth
+            results: Crawl statistics, updated in place
+            start_depth: Depth of current_urls (non-zero when resuming)
+            carry: Pending URLs of deeper levels restored from the journal
+        """
+        carry = carry or {}
         async with AsyncWebCrawler(config=self.browser_config) as crawler:
-            for depth in range(self.max_depth + 1):
+            for depth in range(start_depth, self.max_depth + 1):
+                self.current_depth = depth
+                current_urls = set(current_urls) | carry.pop(depth, set()) | self.seed_urls.pop(depth, set())
+                
                 # Create depth-specific progress tracking
                 if self.progress_tracker:
                     depth_task = self.progress_tracker.create_task(
@@ -207,7 +626,11 @@ description: {metadata.get('description', '')}
                         self.progress_tracker.complete_task(f"depth_{depth}", "No new URLs to crawl")
                     else:
                         print("No new URLs to crawl at this depth")
-                    break
+                    # Deeper sitemap, journal or seeded URLs may still be pending
+                    if not carry and not self.seed_urls:
+                        break
+                    current_urls = set()
+                    continue
                 
                 # Update progress with actual count
                 if self.progress_tracker:
@@ -220,83 +643,30 @@ description: {metadata.get('description', '')}
                 else:
                     print(f"Crawling {len(urls_to_crawl)} URLs...")
                 
-                # Batch crawl all URLs at current depth
-                crawl_results = await crawler.arun_many(
-                    urls=urls_to_crawl,
-                    config=self.run_config,
-                    dispatcher=self.dispatcher
-                )
+                # Reuse unchanged cached pages, serve static pages over HTTP,
+                # and render the rest in the browser
+                crawl_results = []
+                cached_urls = set()
+                responses = {}
+                if self.page_cache:
+                    crawl_results, urls_to_crawl, responses = await self._revalidate(urls_to_crawl)
+                    cached_urls = {result.url for result in crawl_results}
+                    self.fetcher.record_hit('cache', len(crawl_results))
                 
-                next_level_urls = set()
-                processed_count = 0
+                if self.http_first and urls_to_crawl:
+                    static_results, urls_to_crawl = await self._fetch_static(urls_to_crawl, responses)
+                    crawl_results.extend(static_results)
+                    self.fetcher.record_hit('http', len(static_results))
+                
+                # Batch crawl all remaining URLs at current depth
+                if urls_to_crawl:
+                    crawl_results.extend(await self._crawl_browser_batch(crawler, urls_to_crawl))
                 
+                next_level_urls = set()
+                task_id = f"depth_{depth}"
                 for result in crawl_results:
-                    url = self._normalize_url(result.url)
-                    self.visited_urls.add(url)
-                    results['total_crawled'] += 1
-                    processed_count += 1
-                    
-                    if result.success:
-                        # Extract metadata
-                        metadata = {
-                            'title': result.metadata.get('title', 'Untitled'),
-                            'description': result.metadata.get('description', ''),
-                            'word_count': len(result.markdown.split()) if result.markdown else 0
-                        }
-                        
-                        # Save content if it has substantial text
-                        if result.markdown and metadata['word_count'] > 50:
-                            filepath = self._save_markdown(
-                                url, 
-                                result.markdown, 
-                                depth, 
-                                metadata
-                            )
-                            results['successful'] += 1
-                            results['files_created'].append(str(filepath))
-                            
-                            if self.progress_tracker:
-                                self.progress_tracker.update_task(
-                                    f"depth_{depth}",
-                                    advance=1,
-                                    current_item=f"✓ {metadata['title']} ({metadata['word_count']} words)"
-                                )
-                                self.progress_tracker.increment_stats(processed=1, successful=1)
-                            else:
-                                print(f"✓ {url}")
-                                print(f"  → Saved to: {filepath.name}")
-                                print(f"  → Words: {metadata['word_count']}")
-                        else:
-                            if self.progress_tracker:
-                                self.progress_tracker.update_task(
-                                    f"depth_{depth}",
-                                    advance=1,
-                                    current_item=f"⚠ {url} - Insufficient content"
-                                )
-                                self.progress_tracker.increment_stats(processed=1, skipped=1)
-                            else:
-                                print(f"⚠ {url} - Insufficient content")
-                        
-                        # Collect internal links for next depth
-                        if depth < self.max_depth:
-                            for link in result.links.get("internal", []):
-                                next_url = self._normalize_url(link["href"])
-                                if self._is_valid_url(next_url) and next_url not in self.visited_urls:
-                                    next_level_urls.add(next_url)
-                    else:
-                        results['failed'] += 1
-                        error_msg = f"{url}: {result.error_message}"
-                        results['errors'].append(error_msg)
-                        
-                        if self.progress_tracker:
-                            self.progress_tracker.update_task(
-                                f"depth_{depth}",
-                                advance=1,
-                                current_item=f"✗ {error_msg}"
-                            )
-                            self.progress_tracker.increment_stats(processed=1, failed=1)
-                        else:
-                            print(f"✗ {error_msg}")
+                    self._process_result(result, depth, results, next_level_urls, task_id,
+                                         cached_urls, responses)
                 
                 # Complete depth task
                 if self.progress_tracker:
@@ -309,11 +679,312 @@ description: {metadata.get('description', '')}
                 
                 # Prepare URLs for next depth
                 current_urls = next_level_urls
+    
+    async def _crawl_streaming(
+        self,
+        current_urls: Set[str],
+        results: Dict[str, Any],
+        start_depth: int = 0,
+        carry: Optional[Dict[int, Set[str]]] = None
+    ):
+        """
+        Crawl without level barriers, bounded only by max_depth.
         
-        # Generate summary
-        self._generate_summary(results)
+        Pending URLs wait in a shallowest-first heap and are handed out in
+        streaming batches sized by the free slots of the adaptive
+        concurrency limit. Each page is saved and its links queued as soon as
+        its result arrives, so a slow page holds only its own slot and no
+        more results than the limit are held in memory.
         
-        return results
+        Args:
+            current_urls: URLs at start_depth
+            results: Crawl statistics, updated in place
+            start_depth: Depth of current_urls (non-zero when resuming)
+            carry: Pending URLs of deeper levels restored from the journal
+        """
+        heap: List[Tuple[int, int, str]] = []
+        order = itertools.count()
+        queued = create_visited_set(self.visited_backend, self.output_dir / ".queued.sqlite")
+        
+        def push(urls: Iterable[str], depth: int):
+            for url in urls:
+                queued.add(url)
+                heapq.heappush(heap, (depth, next(order), url))
+        
+        push((url for url in current_urls if url not in self.visited_urls), start_depth)
+        for depth, urls in (carry or {}).items():
+            push((url for url in urls if url not in self.visited_urls and url not in queued), depth)
+        
+        task_id = "streaming"
+        if self.progress_tracker:
+            self.progress_tracker.create_task(
+                task_id,
+                f"📊 Streaming crawl up to depth {self.max_depth}",
+                total=len(queued)
+            )
+        else:
+            print(f"\n{'='*50}")
+            print(f"Streaming crawl up to depth {self.max_depth}")
+            print(f"{'='*50}")
+        
+        in_flight = 0
+        jobs: Set[asyncio.Task] = set()
+        wake = asyncio.Event()
+        
+        async def run_batch(crawler: AsyncWebCrawler, batch: List[Tuple[int, str]]):
+            nonlocal in_flight
+            depths = {url: depth for depth, url in batch}
+            urls = list(depths)
+            remaining = len(urls)
+            
+            def handle(result: Any, cached_urls: Set[str], responses: Dict[str, HttpResponse]):
+                nonlocal in_flight, remaining
+                depth = depths.get(self._normalize_url(result.url), batch[-1][0])
+                discovered = self._process_result(result, depth, results, queued, task_id,
+                                                  cached_urls, responses)
+                push(discovered, depth + 1)
+                remaining -= 1
+                in_flight -= 1
+                wake.set()
+            
+            try:
+                cached = []
+                responses = {}
+                if self.page_cache:
+                    cached, urls, responses = await self._revalidate(urls)
+                    self.fetcher.record_hit('cache', len(cached))
+                cached_urls = {result.url for result in cached}
+                for result in cached:
+                    handle(result, cached_urls, responses)
+                
+                if self.http_first and urls:
+                    static_results, urls = await self._fetch_static(urls, responses)
+                    self.fetcher.record_hit('http', len(static_results))
+                    for result in static_results:
+                        handle(result, cached_urls, responses)
+                
+                if urls:
+                    # Dispatchers keep per-run queues, so every batch gets its own
+                    dispatcher = MemoryAdaptiveDispatcher(
+                        memory_threshold_percent=self.memory_threshold,
+                        check_interval=1.0,
+                        max_session_permit=len(urls)
+                    )
+                    stream = await crawler.arun_many(urls=urls, config=self.stream_config, dispatcher=dispatcher)
+                    async for result in stream:
+                        self.fetcher.record_hit('browser')
+                        self._observe_result(result)
+                        handle(result, cached_urls, responses)
+            finally:
+                # Release the slots of pages that never produced a result
+                in_flight -= remaining
+                wake.set()
+        
+        async with AsyncWebCrawler(config=self.browser_config) as crawler:
+            try:
+                while True:
+                    wake.clear()
+                    for job in [job for job in jobs if job.done()]:
+                        jobs.discard(job)
+                        job.result()
+                    
+                    # URLs queued from outside while crawling
+                    for depth, urls in sorted(self.seed_urls.items()):
+                        push((url for url in urls if url not in self.visited_urls and url not in queued), depth)
+                    self.seed_urls.clear()
+                    
+                    batch = []
+                    limit = self.concurrency.limit_for(self.root_url)
+                    while heap and in_flight + len(batch) < limit:
+                        depth, _, url = heapq.heappop(heap)
+                        if url not in self.visited_urls:
+                            batch.append((depth, url))
+                    
+                    if batch:
+                        await self.concurrency.wait_ready(self.root_url)
+                        in_flight += len(batch)
+                        jobs.add(asyncio.create_task(run_batch(crawler, batch)))
+                        if self.progress_tracker:
+                            self.progress_tracker.update_task(task_id, total=len(queued), advance=0)
+                    
+                    if not jobs:
+                        break
+                    await wake.wait()
+            finally:
+                for job in jobs:
+                    job.cancel()
+                await asyncio.gather(*jobs, return_exceptions=True)
+                queued.close()
+        
+        if self.progress_tracker:
+            self.progress_tracker.complete_task(
+                task_id,
+                f"✅ Streaming crawl complete - {results['total_crawled']} pages"
+            )
+        else:
+            print(f"\nStreaming crawl complete: {results['total_crawled']} pages")
+    
+    def _process_result(
+        self,
+        result: Any,
+        depth: int,
+        results: Dict[str, Any],
+        queued: Set[str],
+        task_id: str,
+        cached_urls: Set[str],
+        responses: Dict[str, HttpResponse]
+    ) -> List[str]:
+        """
+        Persist one crawl result and queue its internal links.
+        
+        Args:
+            result: CrawlResult (or a cache/HTTP stand-in) for the page
+            depth: Depth of the page
+            results: Crawl statistics, updated in place
+            queued: URLs already queued; new links are added to it
+            task_id: Progress task to advance
+            cached_urls: URLs served from the page cache, not stored again
+            responses: Revalidation responses by URL, stored with the page
+        
+        Returns:
+            Links queued at depth + 1
+        """
+        url = self._normalize_url(result.url)
+        self.visited_urls.add(url)
+        results['total_crawled'] += 1
+        
+        redirected = getattr(result, 'redirected_url', None)
+        if isinstance(redirected, str) and redirected:
+            target = self._normalize_url(redirected)
+            if target != url:
+                self.redirects[url] = target
+        
+        discovered = []
+        if result.success:
+            saved_path = None
+            
+            # Extract metadata
+            metadata = {
+                'title': result.metadata.get('title', 'Untitled'),
+                'description': result.metadata.get('description', ''),
+                'word_count': len(result.markdown.split()) if result.markdown else 0
+            }
+            
+            if self.page_cache and result.url not in cached_urls and result.markdown:
+                self.page_cache.store(
+                    url,
+                    str(result.markdown),
+                    responses.get(result.url),
+                    metadata={'title': metadata['title'], 'description': metadata['description']},
+                    links=[link["href"] for link in result.links.get("internal", [])]
+                )
+            
+            # Cache the full page; strip site chrome only from what is saved
+            markdown = result.markdown
+            unstripped = False
+            if self.boilerplate and markdown:
+                markdown = self.boilerplate.strip(str(markdown))
+                metadata['word_count'] = len(markdown.split())
+                unstripped = self.boilerplate.warming_up
+            
+            canonical = None
+            if self.duplicates and markdown:
+                canonical = self.duplicates.check(url, str(markdown))
+            if not canonical and self.content_addressed and markdown and metadata['word_count'] > 50:
+                _, owner = self._content_addressed_path(url, str(markdown), depth)
+                canonical = owner if owner != url else None
+            
+            if canonical:
+                results['duplicates'] += 1
+                if self.progress_tracker:
+                    self.progress_tracker.update_task(
+                        task_id,
+                        advance=1,
+                        current_item=f"≈ {url} - Duplicate of {canonical}"
+                    )
+                    self.progress_tracker.increment_stats(processed=1, skipped=1)
+                else:
+                    print(f"≈ {url} - Duplicate of {canonical}")
+            # Save content if it has substantial text
+            elif markdown and metadata['word_count'] > 50:
+                filepath = self._save_markdown(
+                    url, 
+                    markdown, 
+                    depth, 
+                    metadata
+                )
+                saved_path = str(filepath)
+                if unstripped:
+                    self.unstripped_files.append(filepath)
+                results['successful'] += 1
+                results['files_created'].append(str(filepath))
+                
+                if self.progress_tracker:
+                    self.progress_tracker.update_task(
+                        task_id,
+                        advance=1,
+                        current_item=f"✓ {metadata['title']} ({metadata['word_count']} words)"
+                    )
+                    self.progress_tracker.increment_stats(processed=1, successful=1)
+                else:
+                    print(f"✓ {url}")
+                    print(f"  → Saved to: {filepath.name}")
+                    print(f"  → Words: {metadata['word_count']}")
+            else:
+                if self.progress_tracker:
+                    self.progress_tracker.update_task(
+                        task_id,
+                        advance=1,
+                        current_item=f"⚠ {url} - Insufficient content"
+                    )
+                    self.progress_tracker.increment_stats(processed=1, skipped=1)
+                else:
+                    print(f"⚠ {url} - Insufficient content")
+            
+            # Collect internal links for next depth
+            if depth < self.max_depth:
+                for link in result.links.get("internal", []):
+                    next_url = self._normalize_url(link["href"])
+                    if (self._is_valid_url(next_url) and next_url not in self.visited_urls
+                            and next_url not in queued):
+                        queued.add(next_url)
+                        discovered.append(next_url)
+                        self.journal.record_queued(next_url, depth + 1, url)
+            
+            # Journal completion after its links so a resume never loses them
+            if canonical:
+                self.journal.record_done(url, None, depth=depth, alias_of=canonical)
+            else:
+                self.journal.record_done(url, saved_path, depth=depth)
+        else:
+            results['failed'] += 1
+            error_msg = f"{url}: {result.error_message}"
+            results['errors'].append(error_msg)
+            self.journal.record_failed(url, str(result.error_message))
+            
+            if self.progress_tracker:
+                self.progress_tracker.update_task(
+                    task_id,
+                    advance=1,
+                    current_item=f"✗ {error_msg}"
+                )
+                self.progress_tracker.increment_stats(processed=1, failed=1)
+            else:
+                print(f"✗ {error_msg}")
+        
+        return discovered
+    
+    @staticmethod
+    def _url_from_file(filepath: str) -> str:
+        """Read the URL from a saved file's metadata header."""
+        try:
+            with open(filepath, encoding='utf-8') as f:
+                for _, line in zip(range(3), f):
+                    if line.startswith('url: '):
+                        return line[5:].strip()
+        except OSError:
+            pass
+        return "Unknown"
     
     def _generate_summary(self, results: Dict):
         """Generate a summary file of the crawl."""
@@ -330,11 +1001,23 @@ description: {metadata.get('description', '')}
 - Successful: {results['successful']}
 - Failed: {results['failed']}
 - Files Created: {len(results['files_created'])}
+- Completed in Earlier Runs: {results.get('resumed', 0)}
+- URLs Listed in Sitemaps: {results.get('sitemap_urls', 0)}
+- Duplicates Recorded as Aliases: {results.get('duplicates', 0)}
+- Boilerplate Removed: {results.get('boilerplate_chars_removed', 0):,} characters
+- Served over HTTP: {results.get('fetch_tiers', {}).get('http', 0)}
+- Rendered in Browser: {results.get('fetch_tiers', {}).get('browser', 0)}
+- Reused from Cache: {results.get('fetch_tiers', {}).get('cache', 0)}
+- Visited Set: {results.get('visited_backend', self.visited_backend)}, {results.get('visited_bytes_per_url', 0):.1f} bytes per URL
+- Final Concurrency Limits: {', '.join(f'{host}: {limit}' for host, limit in results.get('concurrency_limits', {}).items()) or 'n/a'}
 
 ## Crawled Pages
 
 """
         
+        # Saved files by path; the compact backend keeps them on disk only
+        file_urls = {str(fp): url for url, fp in self.url_to_filepath.items()}
+        
         # Group files by depth
         for depth in range(self.max_depth + 1):
             depth_files = [
@@ -347,11 +1030,7 @@ description: {metadata.get('description', '')}
                 for filepath in sorted(depth_files):
                     filename = Path(filepath).name
                     # Find URL for this file
-                    url = next(
-                        (url for url, fp in self.url_to_filepath.items() 
-                         if str(fp) == filepath),
-                        "Unknown"
-                    )
+                    url = file_urls.get(filepath) or self._url_from_file(filepath)
                     summary += f"- [{filename}]({filename}) - {url}\n"
         
         if results['errors']:
@@ -5,42 +5,194 @@ Creates a single, well-organized markdown document from multiple crawled pages,
 preserving the intended reading order based on site navigation.
 """
 
+import gzip
+import hashlib
+import io
+import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Set, Any, TextIO, Union
 from dataclasses import dataclass
 from datetime import datetime
 from urllib.parse import urlparse, urldefrag
 import yaml
 
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
 from .navigation_extractor import NavigationNode
 
 
+# Frontmatter keys the crawlers write; anything else falls back to YAML
+FRONTMATTER_KEYS = frozenset({'url', 'crawled_at', 'depth', 'title', 'description', 'parent'})
+
+# Frontmatter larger than this is not ours; the file is skipped
+MAX_FRONTMATTER_BYTES = 64 * 1024
+
+# Characters read per step when streaming page bodies
+BODY_CHUNK_SIZE = 64 * 1024
+
+# Compressed output formats of the streaming writer and their file suffixes
+COMPRESSION_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+
+MANIFEST_VERSION = 1
+
+
+def _copy_range(src_fd: int, dst_fd: int, offset: int, length: int):
+    """
+    Append ``length`` bytes at ``offset`` of one file to another.
+    
+    Uses copy_file_range or sendfile so the kernel moves the data without
+    a round trip through user space, falling back to pread/write.
+    """
+    while length > 0:
+        copied = 0
+        try:
+            if hasattr(os, 'copy_file_range'):
+                copied = os.copy_file_range(src_fd, dst_fd, length, offset)
+            elif hasattr(os, 'sendfile'):
+                copied = os.sendfile(dst_fd, src_fd, offset, length)
+        except OSError:
+            copied = 0
+        if not copied:
+            data = os.pread(src_fd, min(length, 1 << 20), offset)
+            if not data:
+                raise OSError(f"Unexpected end of file while copying {length} bytes at offset {offset}")
+            copied = os.write(dst_fd, data)
+        offset += copied
+        length -= copied
+
+
+class _SpliceWriter:
+    """
+    Output file that tracks its byte offset and can splice in byte ranges
+    of another file.
+    """
+    
+    def __init__(self, path: Path, buffer_size: int = 1 << 16):
+        # Unbuffered, so spliced ranges and our own writes share one file position
+        self._file = open(path, 'wb', buffering=0)
+        self._buffer: List[bytes] = []
+        self._buffered = 0
+        self.buffer_size = buffer_size
+        self.position = 0
+    
+    def write(self, text: str):
+        # Same line endings as a text-mode file
+        if os.linesep != '\n':
+            text = text.replace('\n', os.linesep)
+        data = text.encode('utf-8')
+        self._buffer.append(data)
+        self._buffered += len(data)
+        self.position += len(data)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+    
+    def splice(self, src_fd: int, offset: int, length: int):
+        self.flush()
+        _copy_range(src_fd, self._file.fileno(), offset, length)
+        self.position += length
+    
+    def flush(self):
+        data = b''.join(self._buffer)
+        view = memoryview(data)
+        while view:
+            view = view[self._file.write(view):]
+        self._buffer.clear()
+        self._buffered = 0
+    
+    def close(self):
+        self.flush()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
 @dataclass
 class PageContent:
-    """Represents a single page's content with metadata."""
+    """
+    Represents a single page's content with metadata.
+    
+    Pages loaded from disk leave ``content`` as None and keep the offset of
+    the body in ``filepath`` instead; ``body()`` reads it when needed.
+    """
     url: str
     title: str
-    content: str
+    content: Optional[str]
     filepath: Path
     depth: int
     crawled_at: str
     nav_position: Optional[int] = None
     nav_breadcrumb: Optional[List[str]] = None
     nav_level: Optional[int] = None
+    body_offset: int = 0
+    
+    def body(self) -> str:
+        """Return the page markdown without frontmatter, reading it from disk if needed."""
+        return "".join(self.iter_body())
+    
+    def iter_body(self, chunk_size: int = BODY_CHUNK_SIZE) -> Iterator[str]:
+        """
+        Stream the page markdown without frontmatter, stripped of
+        surrounding whitespace, in chunks of about ``chunk_size`` characters.
+        """
+        if self.content is not None:
+            yield self.content
+            return
+        
+        with open(self.filepath, 'rb') as raw:
+            raw.seek(self.body_offset)
+            # Universal newlines, so \r\n in saved pages becomes \n
+            text = io.TextIOWrapper(raw, encoding='utf-8')
+            started = False
+            # Whitespace held back until more text follows it
+            pending = ""
+            while True:
+                chunk = text.read(chunk_size)
+                if not chunk:
+                    break
+                if not started:
+                    chunk = chunk.lstrip()
+                    if not chunk:
+                        continue
+                    started = True
+                stripped = chunk.rstrip()
+                if stripped:
+                    yield pending + stripped
+                    pending = chunk[len(stripped):]
+                else:
+                    pending += chunk
 
 
 class DocumentStitcher:
     """
     Stitches together multiple markdown files into a single document
     following the navigation structure of the original website.
+    
+    Args:
+        content_dir: Directory containing crawled markdown files
+        navigation_tree: NavigationNode tree from NavigationExtractor
+        output_file: Name of the output file
+        aliases: Alias URL -> target URL (redirects, duplicates); by default
+            read from redirects.json and aliases.json in content_dir
     """
     
     def __init__(
         self, 
         content_dir: Path,
         navigation_tree: Optional[NavigationNode] = None,
-        output_file: str = "stitched_document.md"
+        output_file: str = "stitched_document.md",
+        aliases: Optional[Dict[str, str]] = None
     ):
         self.content_dir = Path(content_dir)
         self.navigation_tree = navigation_tree
@@ -49,41 +201,109 @@ class DocumentStitcher:
         self.url_to_page: Dict[str, PageContent] = {}
         self.unmatched_pages: List[PageContent] = []
         
-    def load_content(self) -> int:
+        # Redirect and duplicate aliases, followed to the end of their chain
+        self.aliases: Dict[str, str] = {}
+        if aliases is None:
+            self._load_alias_files()
+        else:
+            self.add_aliases(aliases)
+        
+        # Lookup indexes built by load_content: page URLs by URL path and
+        # by canonical URL, in load order
+        self.path_to_urls: Dict[str, List[str]] = {}
+        self.canonical_to_urls: Dict[str, List[str]] = {}
+        
+        # Sections reused and rendered by the last streaming write
+        self.stitch_stats: Dict[str, int] = {}
+    
+    def add_aliases(self, aliases: Dict[str, str]):
+        """
+        Record URLs that lead to another URL.
+        
+        Call before load_content so the canonical index includes them.
+        
+        Args:
+            aliases: Alias URL -> target URL
+        """
+        for alias, target in aliases.items():
+            alias, target = self._normalize_url(alias), self._normalize_url(target)
+            if alias != target:
+                self.aliases[alias] = target
+    
+    def _load_alias_files(self):
+        """Read the crawler's redirects.json and aliases.json, if present."""
+        redirects = self.content_dir / "redirects.json"
+        duplicates = self.content_dir / "aliases.json"
+        try:
+            if redirects.exists():
+                self.add_aliases(json.loads(redirects.read_text(encoding='utf-8')))
+            if duplicates.exists():
+                grouped = json.loads(duplicates.read_text(encoding='utf-8'))
+                self.add_aliases({
+                    alias: canonical
+                    for canonical, aliases in grouped.items()
+                    for alias in aliases
+                })
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"⚠️  Ignoring unreadable alias table: {e}")
+    
+    def canonical_url(self, url: str) -> str:
+        """Follow the alias chain of a normalized URL to its final target."""
+        seen = {url}
+        while url in self.aliases:
+            url = self.aliases[url]
+            if url in seen:
+                break
+            seen.add(url)
+        return url
+    
+    def _index_page(self, page: PageContent):
+        """Add a loaded page to the URL, path and canonical indexes."""
+        self.url_to_page[page.url] = page
+        self.path_to_urls.setdefault(urlparse(page.url).path, []).append(page.url)
+        self.canonical_to_urls.setdefault(self.canonical_url(page.url), []).append(page.url)
+        
+    def load_content(self, max_workers: Optional[int] = None) -> int:
         """
-        Load all markdown files from the content directory.
+        Load the metadata of all markdown files in the content directory.
+        
+        Only the frontmatter of each file is read, on a thread pool; page
+        bodies stay on disk until the document is stitched.
+        
+        Args:
+            max_workers: Reader threads (default: ThreadPoolExecutor's default)
         
         Returns:
             Number of files loaded
         """
-        md_files = list(self.content_dir.glob("*.md"))
+        with os.scandir(self.content_dir) as entries:
+            md_files = sorted(
+                Path(entry.path) for entry in entries
+                # Skip summary files
+                if entry.name.endswith('.md') and entry.is_file()
+                and entry.name not in ('crawl_summary.md', 'stitched_document.md')
+            )
         
-        for filepath in md_files:
-            # Skip summary files
-            if filepath.name in ['crawl_summary.md', 'stitched_document.md']:
-                continue
-            
-            content = filepath.read_text(encoding='utf-8')
-            
-            # Extract metadata from frontmatter
-            metadata = self._extract_frontmatter(content)
-            if not metadata:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            headers = list(pool.map(self._read_header, md_files))
+        
+        for filepath, header in zip(md_files, headers):
+            if not header:
                 continue
-            
-            # Extract clean content (without frontmatter)
-            clean_content = self._remove_frontmatter(content)
+            metadata, body_offset = header
             
             page = PageContent(
-                url=self._normalize_url(metadata.get('url', '')),
-                title=metadata.get('title', 'Untitled'),
-                content=clean_content,
+                url=self._normalize_url(str(metadata.get('url') or '')),
+                title=metadata.get('title') or 'Untitled',
+                content=None,
                 filepath=filepath,
                 depth=metadata.get('depth', 0),
-                crawled_at=metadata.get('crawled_at', '')
+                crawled_at=metadata.get('crawled_at', ''),
+                body_offset=body_offset
             )
             
             self.pages.append(page)
-            self.url_to_page[page.url] = page
+            self._index_page(page)
         
         return len(self.pages)
     
@@ -94,27 +314,70 @@ class DocumentStitcher:
             url = url[:-1]
         return url
     
-    def _extract_frontmatter(self, content: str) -> Optional[Dict]:
-        """Extract YAML frontmatter from markdown content."""
-        pattern = r'^---\s*\n(.*?)\n---\s*\n'
-        match = re.match(pattern, content, re.DOTALL)
+    def _read_header(self, filepath: Path) -> Optional[Tuple[Dict, int]]:
+        """
+        Read a file's frontmatter without reading its body.
         
-        if match:
-            try:
-                return yaml.safe_load(match.group(1))
-            except:
-                return None
+        Returns:
+            Tuple of (metadata, byte offset of the body), or None if the file
+            has no parseable frontmatter
+        """
+        try:
+            with open(filepath, 'rb') as f:
+                if f.readline().rstrip() != b'---':
+                    return None
+                lines = []
+                size = 0
+                for line in f:
+                    if line.rstrip() == b'---':
+                        metadata = self._parse_frontmatter(b''.join(lines).decode('utf-8'))
+                        return (metadata, f.tell()) if metadata else None
+                    lines.append(line)
+                    size += len(line)
+                    if size > MAX_FRONTMATTER_BYTES:
+                        return None
+        except (OSError, UnicodeDecodeError):
+            return None
         return None
     
-    def _remove_frontmatter(self, content: str) -> str:
-        """Remove YAML frontmatter from markdown content."""
-        pattern = r'^---\s*\n.*?\n---\s*\n'
-        return re.sub(pattern, '', content, flags=re.DOTALL).strip()
+    def _parse_frontmatter(self, text: str) -> Optional[Dict]:
+        """
+        Parse frontmatter written by the crawlers.
+        
+        The crawlers write one ``key: value`` line per known key, which is
+        parsed directly; anything else is handed to YAML.
+        """
+        metadata: Dict[str, Any] = {}
+        for line in text.splitlines():
+            key, sep, value = line.partition(':')
+            if not sep or key not in FRONTMATTER_KEYS or (value and not value.startswith(' ')):
+                return self._parse_yaml(text)
+            value = value.strip()
+            if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+                value = value[1:-1]
+            metadata[key] = value
+        if not metadata:
+            return None
+        
+        depth = metadata.get('depth', '0')
+        metadata['depth'] = int(depth) if depth.isdigit() else 0
+        return metadata
+    
+    @staticmethod
+    def _parse_yaml(text: str) -> Optional[Dict]:
+        try:
+            metadata = yaml.safe_load(text)
+        except yaml.YAMLError:
+            return None
+        return metadata if isinstance(metadata, dict) else None
     
     def match_to_navigation(self, ordered_urls: List[Dict]) -> Tuple[List[PageContent], List[PageContent]]:
         """
         Match loaded pages to navigation positions.
         
+        Runs in time linear in the navigation and page counts, using the
+        indexes built by load_content.
+        
         Args:
             ordered_urls: List of URLs in navigation order from NavigationExtractor
         
@@ -124,41 +387,39 @@ class DocumentStitcher:
         matched = []
         unmatched = []
         matched_urls = set()
+        matched_items = set()
+        
+        def assign(page: PageContent, nav_item: Dict):
+            page.nav_position = nav_item['order']
+            page.nav_breadcrumb = nav_item['breadcrumb']
+            page.nav_level = nav_item['level']
+            matched.append(page)
+            matched_urls.add(page.url)
+        
+        nav_urls = [self._normalize_url(nav_item['url']) for nav_item in ordered_urls]
         
         # First pass: exact URL matches
-        for nav_item in ordered_urls:
-            nav_url = self._normalize_url(nav_item['url'])
-            
+        for index, (nav_item, nav_url) in enumerate(zip(ordered_urls, nav_urls)):
             if nav_url in self.url_to_page:
-                page = self.url_to_page[nav_url]
-                page.nav_position = nav_item['order']
-                page.nav_breadcrumb = nav_item['breadcrumb']
-                page.nav_level = nav_item['level']
-                matched.append(page)
-                matched_urls.add(nav_url)
-        
-        # Second pass: fuzzy matching for redirects and variations
-        for nav_item in ordered_urls:
-            if nav_item['url'] in matched_urls:
+                assign(self.url_to_page[nav_url], nav_item)
+                matched_items.add(index)
+        
+        # Second pass: redirects and duplicates, then the same path on
+        # another host (e.g. www. vs bare domain)
+        for index, (nav_item, nav_url) in enumerate(zip(ordered_urls, nav_urls)):
+            if index in matched_items:
                 continue
             
-            nav_url = self._normalize_url(nav_item['url'])
-            nav_path = urlparse(nav_url).path
-            
-            for page_url, page in self.url_to_page.items():
-                if page_url in matched_urls:
-                    continue
-                
-                page_path = urlparse(page_url).path
-                
-                # Check if paths match (ignoring domain differences)
-                if nav_path == page_path:
-                    page.nav_position = nav_item['order']
-                    page.nav_breadcrumb = nav_item['breadcrumb']
-                    page.nav_level = nav_item['level']
-                    matched.append(page)
-                    matched_urls.add(page_url)
-                    break
+            candidates = (
+                self.canonical_to_urls.get(self.canonical_url(nav_url), []),
+                self.path_to_urls.get(urlparse(nav_url).path, [])
+            )
+            page_url = next(
+                (url for urls in candidates for url in urls if url not in matched_urls),
+                None
+            )
+            if page_url:
+                assign(self.url_to_page[page_url], nav_item)
         
         # Collect unmatched pages
         for page_url, page in self.url_to_page.items():
@@ -184,18 +445,206 @@ class DocumentStitcher:
         Returns:
             The complete stitched document as markdown
         """
-        sections = []
+        return "".join(self._iter_document(matched_pages, unmatched_pages, include_unmatched))
+    
+    def write_stitched_document(
+        self,
+        matched_pages: List[PageContent],
+        unmatched_pages: List[PageContent],
+        include_unmatched: bool = True,
+        compression: Optional[str] = None
+    ) -> Path:
+        """
+        Stream the stitched document to disk in bounded memory.
+        
+        The table of contents comes from page metadata, and each page body
+        is copied from its file in chunks, so memory use does not grow with
+        the size of the corpus.
         
+        Uncompressed output is written incrementally: a manifest next to
+        the document records every page section's key and byte range, and
+        sections whose page is unchanged since the previous run are spliced
+        from the previous document instead of being rendered again.
+        
+        Args:
+            matched_pages: Pages matched to navigation positions
+            unmatched_pages: Pages not found in navigation
+            include_unmatched: Whether to include unmatched pages at the end
+            compression: None, 'gzip' or 'zstd' (requires the zstandard package)
+        
+        Returns:
+            Path to the written document
+        """
+        output_path = self.content_dir / self.output_file
+        if compression is not None:
+            if compression not in COMPRESSION_SUFFIXES:
+                raise ValueError(f"Unknown compression {compression!r}; expected 'gzip' or 'zstd'")
+            output_path = output_path.with_name(output_path.name + COMPRESSION_SUFFIXES[compression])
+        
+        if compression is None:
+            self._write_spliced(output_path, matched_pages, unmatched_pages, include_unmatched)
+            return output_path
+        
+        with self._open_output(output_path, compression) as f:
+            for chunk in self._iter_document(matched_pages, unmatched_pages, include_unmatched):
+                f.write(chunk)
+        return output_path
+    
+    def _manifest_path(self, output_path: Path) -> Path:
+        return output_path.with_name(output_path.name + ".manifest.json")
+    
+    def _load_manifest(self, output_path: Path) -> Optional[Dict]:
+        """Return the previous run's manifest if the document it describes is untouched."""
+        try:
+            manifest = json.loads(self._manifest_path(output_path).read_text(encoding='utf-8'))
+            stat = output_path.stat()
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_VERSION:
+            return None
+        if manifest.get('output') != {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}:
+            return None
+        return manifest
+    
+    def _section_entry(self, page: PageContent, previous: Optional[Dict]) -> Dict:
+        """
+        Describe a page section for the manifest.
+        
+        The key combines what the section header shows with a hash of the
+        page body; the body is only hashed again when its file changed
+        since the previous run.
+        """
+        shown = [page.url, page.title, page.nav_breadcrumb if page.nav_breadcrumb and len(page.nav_breadcrumb) > 1 else None]
+        header_hash = hashlib.blake2b(json.dumps(shown).encode('utf-8'), digest_size=16).hexdigest()
+        
+        if page.content is not None:
+            stat_key = None
+            body_hash = hashlib.blake2b(page.content.encode('utf-8'), digest_size=16).hexdigest()
+        else:
+            stat = os.stat(page.filepath)
+            stat_key = [stat.st_size, stat.st_mtime_ns, page.body_offset]
+            if previous and previous.get('stat') == stat_key:
+                body_hash = previous['body_hash']
+            else:
+                digest = hashlib.blake2b(digest_size=16)
+                with open(page.filepath, 'rb') as f:
+                    f.seek(page.body_offset)
+                    for block in iter(lambda: f.read(1 << 16), b''):
+                        digest.update(block)
+                body_hash = digest.hexdigest()
+        
+        return {
+            'key': f"{header_hash}:{body_hash}",
+            'file': str(page.filepath),
+            'stat': stat_key,
+            'body_hash': body_hash
+        }
+    
+    def _write_spliced(
+        self,
+        output_path: Path,
+        matched_pages: List[PageContent],
+        unmatched_pages: List[PageContent],
+        include_unmatched: bool
+    ):
+        """Write the document, splicing unchanged sections from the previous one."""
+        previous = self._load_manifest(output_path)
+        previous_sections = previous['sections'] if previous else []
+        reusable = {entry['key']: (entry['offset'], entry['length']) for entry in previous_sections}
+        by_file = {entry['file']: entry for entry in previous_sections}
+        
+        self.stitch_stats = {'sections_reused': 0, 'sections_rendered': 0, 'bytes_spliced': 0}
+        entries = []
+        temp_path = output_path.with_name(output_path.name + ".tmp")
+        old_fd = os.open(output_path, os.O_RDONLY) if reusable else None
+        try:
+            with _SpliceWriter(temp_path) as out:
+                sections = self._iter_sections(matched_pages, unmatched_pages, include_unmatched)
+                for index, section in enumerate(sections):
+                    if index:
+                        out.write("\n")
+                    if isinstance(section, str):
+                        out.write(section)
+                        continue
+                    if not isinstance(section, PageContent):
+                        for chunk in section:
+                            out.write(chunk)
+                        continue
+                    
+                    entry = self._section_entry(section, by_file.get(str(section.filepath)))
+                    entry['offset'] = out.position
+                    cached = reusable.get(entry['key'])
+                    if cached:
+                        out.splice(old_fd, *cached)
+                        self.stitch_stats['sections_reused'] += 1
+                        self.stitch_stats['bytes_spliced'] += cached[1]
+                    else:
+                        for chunk in self._iter_page_section(section):
+                            out.write(chunk)
+                        self.stitch_stats['sections_rendered'] += 1
+                    entry['length'] = out.position - entry['offset']
+                    entries.append(entry)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        finally:
+            if old_fd is not None:
+                os.close(old_fd)
+        
+        stat = output_path.stat()
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'output': {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns},
+            'sections': entries
+        }
+        self._manifest_path(output_path).write_text(json.dumps(manifest), encoding='utf-8')
+    
+    @staticmethod
+    def _open_output(path: Path, compression: Optional[str]) -> TextIO:
+        if compression == 'gzip':
+            return gzip.open(path, 'wt', encoding='utf-8')
+        if compression == 'zstd':
+            if not ZSTD_AVAILABLE:
+                raise ImportError("zstd output requires the zstandard package: pip install zstandard")
+            raw = zstandard.ZstdCompressor().stream_writer(open(path, 'wb'), closefd=True)
+            return io.TextIOWrapper(raw, encoding='utf-8')
+        return open(path, 'w', encoding='utf-8')
+    
+    def _iter_document(
+        self,
+        matched_pages: List[PageContent],
+        unmatched_pages: List[PageContent],
+        include_unmatched: bool
+    ) -> Iterator[str]:
+        """Yield the stitched document piece by piece, reading page bodies as they are reached."""
+        sections = self._iter_sections(matched_pages, unmatched_pages, include_unmatched)
+        for index, section in enumerate(sections):
+            if index:
+                yield "\n"
+            if isinstance(section, str):
+                yield section
+            elif isinstance(section, PageContent):
+                yield from self._iter_page_section(section)
+            else:
+                yield from section
+    
+    def _iter_sections(
+        self,
+        matched_pages: List[PageContent],
+        unmatched_pages: List[PageContent],
+        include_unmatched: bool
+    ) -> Iterator[Union[str, Iterator[str], PageContent]]:
+        """Yield the document's sections: text, chunk iterators, or pages to render."""
         # Add document header
-        sections.append(self._create_document_header())
+        yield self._create_document_header()
         
         # Add table of contents
-        toc = self._create_table_of_contents(matched_pages, unmatched_pages, include_unmatched)
-        sections.append(toc)
+        yield self._iter_table_of_contents(matched_pages, unmatched_pages, include_unmatched)
         
         # Add matched pages in navigation order
         if matched_pages:
-            sections.append("\n---\n\n# 📖 Main Content\n\n")
+            yield "\n---\n\n# 📖 Main Content\n\n"
             
             # Sort by navigation position
             sorted_pages = sorted(matched_pages, key=lambda p: p.nav_position or 999)
@@ -206,29 +655,25 @@ class DocumentStitcher:
                 if page.nav_breadcrumb and len(page.nav_breadcrumb) > 1:
                     section = page.nav_breadcrumb[0] if len(page.nav_breadcrumb) > 0 else "Content"
                     if section != current_section:
-                        sections.append(f"\n\n## 📂 {section}\n\n")
+                        yield f"\n\n## 📂 {section}\n\n"
                         current_section = section
                 
                 # Add page content
-                page_section = self._create_page_section(page)
-                sections.append(page_section)
+                yield page
         
         # Add unmatched pages if requested
         if include_unmatched and unmatched_pages:
-            sections.append("\n---\n\n# 📎 Additional Content\n\n")
-            sections.append("*The following pages were crawled but not found in the main navigation:*\n\n")
+            yield "\n---\n\n# 📎 Additional Content\n\n"
+            yield "*The following pages were crawled but not found in the main navigation:*\n\n"
             
             # Sort by depth and title
             sorted_unmatched = sorted(unmatched_pages, key=lambda p: (p.depth, p.title))
             
             for page in sorted_unmatched:
-                page_section = self._create_page_section(page)
-                sections.append(page_section)
+                yield page
         
         # Add document footer
-        sections.append(self._create_document_footer(len(matched_pages), len(unmatched_pages)))
-        
-        return "\n".join(sections)
+        yield self._create_document_footer(len(matched_pages), len(unmatched_pages))
     
     def _create_document_header(self) -> str:
         """Create the document header with metadata."""
@@ -249,10 +694,27 @@ class DocumentStitcher:
         include_unmatched: bool
     ) -> str:
         """Create a table of contents with internal links."""
-        toc_lines = ["## 📑 Table of Contents\n"]
+        return "".join(self._iter_table_of_contents(matched_pages, unmatched_pages, include_unmatched))
+    
+    def _iter_table_of_contents(
+        self,
+        matched_pages: List[PageContent],
+        unmatched_pages: List[PageContent],
+        include_unmatched: bool
+    ) -> Iterator[str]:
+        """Yield the table of contents line by line, from page metadata alone."""
+        first = True
+        
+        def line(text: str) -> str:
+            nonlocal first
+            text = text if first else "\n" + text
+            first = False
+            return text
+        
+        yield line("## 📑 Table of Contents\n")
         
         if matched_pages:
-            toc_lines.append("### Main Content\n")
+            yield line("### Main Content\n")
             
             # Sort by navigation position
             sorted_pages = sorted(matched_pages, key=lambda p: p.nav_position or 999)
@@ -263,24 +725,27 @@ class DocumentStitcher:
                 if page.nav_breadcrumb and len(page.nav_breadcrumb) > 1:
                     section = page.nav_breadcrumb[0]
                     if section != current_section:
-                        toc_lines.append(f"\n**{section}**\n")
+                        yield line(f"\n**{section}**\n")
                         current_section = section
                 
                 # Create anchor link
                 anchor = self._create_anchor(page.title)
                 indent = "  " * (page.nav_level if page.nav_level else 0)
-                toc_lines.append(f"{indent}- [{page.title}](#{anchor})")
+                yield line(f"{indent}- [{page.title}](#{anchor})")
         
         if include_unmatched and unmatched_pages:
-            toc_lines.append("\n### Additional Content\n")
+            yield line("\n### Additional Content\n")
             for page in sorted(unmatched_pages, key=lambda p: p.title):
                 anchor = self._create_anchor(page.title)
-                toc_lines.append(f"- [{page.title}](#{anchor})")
-        
-        return "\n".join(toc_lines)
+                yield line(f"- [{page.title}](#{anchor})")
+
     
     def _create_page_section(self, page: PageContent) -> str:
         """Create a section for a single page."""
+        return "".join(self._iter_page_section(page))
+    
+    def _iter_page_section(self, page: PageContent) -> Iterator[str]:
+        """Yield a page's section, streaming its body from disk."""
         lines = []
         
         # Add navigation breadcrumb if available
@@ -295,14 +760,13 @@ class DocumentStitcher:
         
         # Add source URL
         lines.append(f"*Source: [{page.url}]({page.url})*\n")
+        yield "\n".join(lines) + "\n"
         
         # Add content
-        lines.append(page.content)
+        yield from page.iter_body()
         
         # Add separator
-        lines.append("\n---\n")
-        
-        return "\n".join(lines)
+        yield "\n\n---\n"
     
     def _create_anchor(self, title: str) -> str:
         """Create a valid anchor ID from a title."""
@@ -369,7 +833,9 @@ def stitch_crawled_content(
     ordered_urls: Optional[List[Dict]] = None,
     output_file: str = "stitched_document.md",
     include_unmatched: bool = True,
-    progress_tracker: Optional[Any] = None
+    progress_tracker: Optional[Any] = None,
+    streaming: bool = True,
+    compression: Optional[str] = None
 ) -> Path:
     """
     Main function to stitch crawled content into a single document.
@@ -381,6 +847,11 @@ def stitch_crawled_content(
         output_file: Name of the output file
         include_unmatched: Whether to include pages not in navigation
         progress_tracker: Optional progress tracker for status updates
+        streaming: Write the document page by page from disk, splicing
+            sections unchanged since the previous run from the previous
+            document; False builds the whole document in memory (default: True)
+        compression: 'gzip' or 'zstd' to compress the streamed document;
+            implies streaming
     
     Returns:
         Path to the created stitched document
@@ -417,8 +888,8 @@ def stitch_crawled_content(
             print(f"Matched {len(matched)} pages to navigation")
             print(f"Found {len(unmatched)} additional pages")
         
-        # Create stitched document
-        stitched_content = stitcher.stitch_document(matched, unmatched, include_unmatched)
+        # Pages in document order; bodies are read when the document is written
+        sections = (matched, unmatched, include_unmatched)
         
         if progress_tracker:
             progress_tracker.update_task("stitching", current_item="Generating reading guide...")
@@ -440,13 +911,23 @@ def stitch_crawled_content(
             print("No navigation structure provided - using depth-based ordering")
         
         sorted_pages = sorted(stitcher.pages, key=lambda p: (p.depth, p.title))
-        stitched_content = stitcher.stitch_document(sorted_pages, [], False)
+        sections = (sorted_pages, [], False)
     
     # Save stitched document
     if progress_tracker:
         progress_tracker.update_task("stitching", current_item="Saving final document...")
     
-    output_path = stitcher.save_stitched_document(stitched_content)
+    if streaming or compression:
+        output_path = stitcher.write_stitched_document(*sections, compression=compression)
+        if stitcher.stitch_stats.get('sections_reused'):
+            message = (f"Reused {stitcher.stitch_stats['sections_reused']} unchanged sections, "
+                       f"rendered {stitcher.stitch_stats['sections_rendered']}")
+            if progress_tracker:
+                progress_tracker.log(message)
+            else:
+                print(message)
+    else:
+        output_path = stitcher.save_stitched_document(stitcher.stitch_document(*sections))
     
     if progress_tracker:
         progress_tracker.complete_task("stitching", f"✅ Stitched document saved to {output_path.name}")
@@ -0,0 +1,126 @@
+"""
+File Writer - Background persistence for crawled pages
+
+Crawl workers hand finished documents to a bounded queue instead of writing
+them on the event loop thread. A single consumer task performs the blocking
+writes in a worker thread, so a slow disk never stalls network I/O, and the
+bounded queue applies back-pressure if the disk falls far behind.
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class FileWriter:
+    """
+    Writes text files from a bounded queue in a background thread.
+
+    Args:
+        max_pending: Queued documents before ``write()`` starts waiting (default: 100)
+    """
+
+    def __init__(self, max_pending: int = 100):
+        self.max_pending = max_pending
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumer: Optional[asyncio.Task] = None
+
+        self.stats: Dict[str, int] = {
+            'written': 0,
+            'failed': 0
+        }
+        self.errors: List[Tuple[str, str]] = []
+
+    def _ensure_started(self):
+        """
+        Start the consumer task on first use inside the running loop.
+
+        A consumer that stopped keeps its queue: documents already queued are
+        drained by its replacement, or the error that killed it is raised.
+        """
+        if self._consumer is not None and self._consumer.done():
+            if not self._consumer.cancelled() and self._consumer.exception() is not None:
+                raise RuntimeError("File writer stopped unexpectedly") from self._consumer.exception()
+            self._consumer = None
+        if self._consumer is None:
+            if self._queue is None:
+                self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._consumer = asyncio.create_task(self._consume())
+
+    @staticmethod
+    def _write_file(path: Path, content: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    async def _consume(self):
+        while True:
+            path, content, on_written = await self._queue.get()
+            try:
+                if path is not None:
+                    await asyncio.to_thread(self._write_file, path, content)
+                    self.stats['written'] += 1
+            except OSError as e:
+                logger.error(f"Error writing {path}: {e}")
+                self.stats['failed'] += 1
+                self.errors.append((str(path), str(e)))
+            else:
+                if on_written:
+                    try:
+                        on_written()
+                    except Exception as e:
+                        logger.error(f"Write callback failed for {path or 'deferred callback'}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def write(
+        self,
+        path: Path,
+        content: str,
+        on_written: Optional[Callable[[], None]] = None
+    ):
+        """
+        Queue a document for writing.
+
+        Waits only when ``max_pending`` documents are already queued.
+
+        Args:
+            path: Destination file
+            content: Text to write
+            on_written: Called once the file is safely written (optional)
+        """
+        self._ensure_started()
+        await self._queue.put((Path(path), content, on_written))
+
+    async def defer(self, callback: Callable[[], None]):
+        """
+        Queue a callback behind the pending documents.
+
+        It runs from the consumer like an ``on_written`` callback, once every
+        document queued before it has been handled, without writing a file.
+
+        Args:
+            callback: Called in queue order
+        """
+        self._ensure_started()
+        await self._queue.put((None, None, callback))
+
+    async def flush(self):
+        """Wait until every queued document has been written."""
+        if self._queue is not None:
+            self._ensure_started()
+            await self._queue.join()
+
+    async def close(self):
+        """Flush pending writes and stop the consumer task."""
+        try:
+            await self.flush()
+        finally:
+            if self._consumer is not None:
+                self._consumer.cancel()
+                await asyncio.gather(self._consumer, return_exceptions=True)
+            self._consumer = None
+            self._queue = None
@@ -0,0 +1,66 @@
+"""
+Filename Registry - Constant-time unique filename allocation
+
+Pages whose URLs collapse to the same readable name used to be told apart
+by probing ``name_1``, ``name_2``, ... on disk, one stat call per probe and
+racy under concurrency. The registry scans the output directory once and
+then hands out names from memory under a lock, remembering the next free
+suffix of every base name.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Set
+
+
+class FilenameRegistry:
+    """
+    Hands out unused file paths in one directory.
+
+    Args:
+        directory: Directory the files are written to; existing files are
+            registered on creation
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._taken: Set[str] = set()
+        self._next_suffix: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if self.directory.is_dir():
+            with os.scandir(self.directory) as entries:
+                self._taken.update(entry.name for entry in entries)
+
+    def __contains__(self, path: Path) -> bool:
+        return Path(path).name in self._taken
+
+    def __len__(self) -> int:
+        return len(self._taken)
+
+    def allocate(self, path: Path) -> Path:
+        """
+        Reserve ``path``, or the first free ``<stem>_<n><suffix>`` after it.
+
+        Args:
+            path: Preferred path inside the registry's directory
+
+        Returns:
+            The reserved path; no other call returns it again
+        """
+        path = Path(path)
+        with self._lock:
+            if path.name not in self._taken:
+                self._taken.add(path.name)
+                return path
+
+            # Resume from the last suffix handed out for this name
+            counter = self._next_suffix.get(path.name, 1)
+            while f"{path.stem}_{counter}{path.suffix}" in self._taken:
+                counter += 1
+            self._next_suffix[path.name] = counter + 1
+
+            name = f"{path.stem}_{counter}{path.suffix}"
+            self._taken.add(name)
+            return path.with_name(name)
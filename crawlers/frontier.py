@@ -0,0 +1,135 @@
+"""
+Crawl Frontier - Priority queue of URLs still to be crawled
+
+Workers pull the shallowest pending URL, crawl it, and push the links found on
+that page back into the frontier. Every entry carries its true link depth and
+the page it was discovered on, so discovery and content extraction happen in
+a single pass over the site.
+"""
+
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from urllib.parse import urldefrag
+
+
+@dataclass(order=True)
+class FrontierEntry:
+    """A URL waiting in the frontier, ordered by depth then discovery order."""
+    depth: int
+    sequence: int
+    url: str = field(compare=False)
+    parent: Optional[str] = field(default=None, compare=False)
+
+
+class CrawlFrontier:
+    """
+    Deduplicating, depth-bounded priority queue for concurrent crawl workers.
+
+    Args:
+        max_depth: Deepest link depth accepted into the frontier
+        url_filter: Optional predicate deciding whether a URL may be crawled
+        on_put: Optional callback receiving every newly queued entry
+        seen: Store of URLs already queued, supporting ``add`` and ``in``
+            (default: an in-memory set)
+    """
+
+    def __init__(
+        self,
+        max_depth: int,
+        url_filter: Optional[Callable[[str], bool]] = None,
+        on_put: Optional[Callable[[FrontierEntry], None]] = None,
+        seen: Optional[Any] = None
+    ):
+        self.max_depth = max_depth
+        self.url_filter = url_filter
+        self.on_put = on_put
+
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._sequence = itertools.count()
+        self.seen = seen if seen is not None else set()
+
+    def _normalize_url(self, url: str) -> str:
+        """Remove fragment and trailing slash from URL."""
+        url = urldefrag(url)[0]
+        if url.endswith('/'):
+            url = url[:-1]
+        return url
+
+    def put(self, url: str, depth: int, parent: Optional[str] = None) -> bool:
+        """
+        Add a URL unless it was seen before, is too deep, or is filtered out.
+
+        Returns:
+            True if the URL was queued
+        """
+        url = self._normalize_url(url)
+        if depth > self.max_depth or url in self.seen:
+            return False
+        if self.url_filter and depth > 0 and not self.url_filter(url):
+            return False
+
+        self.seen.add(url)
+        entry = FrontierEntry(depth, next(self._sequence), url, parent)
+        self._queue.put_nowait(entry)
+        if self.on_put:
+            self.on_put(entry)
+        return True
+
+    def restore(
+        self,
+        queued: Dict[str, Tuple[int, Optional[str]]],
+        completed: Iterable[str]
+    ) -> int:
+        """
+        Rebuild the frontier from a crawl journal.
+
+        Every previously queued URL is marked as seen, and those that never
+        completed are queued again with their original depth and parent.
+
+        Returns:
+            Number of URLs queued again
+        """
+        completed = set(completed)
+        restored = 0
+        for url, (depth, parent) in queued.items():
+            self.seen.add(url)
+            if url not in completed and depth <= self.max_depth:
+                self._queue.put_nowait(FrontierEntry(depth, next(self._sequence), url, parent))
+                restored += 1
+        return restored
+
+    def put_links(self, links: Iterable[str], parent: FrontierEntry) -> int:
+        """
+        Queue links found on a crawled page one level below it.
+
+        Returns:
+            Number of newly queued URLs
+        """
+        if parent.depth >= self.max_depth:
+            return 0
+        return sum(self.put(link, parent.depth + 1, parent.url) for link in links)
+
+    async def get(self) -> FrontierEntry:
+        """Wait for the shallowest pending URL."""
+        return await self._queue.get()
+
+    def task_done(self):
+        """Mark the entry returned by ``get()`` as fully processed."""
+        self._queue.task_done()
+
+    async def join(self):
+        """Wait until every queued URL has been processed."""
+        await self._queue.join()
+
+    def close(self):
+        """Close the seen-URL store if it holds resources (e.g. a compact visited set)."""
+        close = getattr(self.seen, 'close', None)
+        if close:
+            close()
+
+    @property
+    def pending(self) -> int:
+        """Number of URLs waiting to be crawled."""
+        return self._queue.qsize()
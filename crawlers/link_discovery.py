@@ -0,0 +1,179 @@
+"""
+Link Discovery - Non-blocking URL discovery over a shared HTTP pool
+
+Walks a site breadth-first with asyncio, streaming each response through an
+anchor-only HTML parser instead of building a full document tree. URLs are
+yielded as soon as they are found, so crawling can start while discovery is
+still running.
+"""
+
+import asyncio
+import codecs
+from html.parser import HTMLParser
+from typing import AsyncIterator, List, Optional, Set, Tuple
+from urllib.parse import urldefrag, urljoin, urlparse
+
+import aiohttp
+
+from .tiered_fetcher import TieredFetcher
+
+
+class AnchorParser(HTMLParser):
+    """Incremental HTML parser that only collects ``<a href>`` targets."""
+
+    def __init__(self, base_url: str):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.links: List[str] = []
+
+    def handle_starttag(self, tag: str, attrs):
+        if tag == 'base':
+            href = dict(attrs).get('href')
+            if href:
+                self.base_url = urljoin(self.base_url, href)
+        elif tag == 'a':
+            href = dict(attrs).get('href')
+            if href and not href.startswith(('#', 'mailto:', 'javascript:', 'tel:')):
+                self.links.append(urljoin(self.base_url, href.strip()))
+
+    def pop_links(self) -> List[str]:
+        """Return links parsed since the last call."""
+        links, self.links = self.links, []
+        return links
+
+
+class LinkDiscovery:
+    """
+    Breadth-first asynchronous link discovery below a root URL.
+
+    Only URLs under the root URL's path are followed, matching the scoping
+    RecursiveUrlLoader applied. The root is depth 0 and links are followed
+    from pages shallower than ``max_depth``.
+
+    Args:
+        root_url: Starting URL; also defines the discovery scope
+        max_depth: Maximum link depth to discover (default: 2)
+        exclude_patterns: URL substrings to skip
+        fetcher: TieredFetcher whose connection pool is shared (optional)
+        max_concurrent: Concurrent page downloads (default: 10)
+    """
+
+    # Extensions that never contain links worth following
+    SKIP_EXTENSIONS = ('.pdf', '.doc', '.docx', '.xls', '.xlsx', '.zip', '.tar', '.gz',
+                       '.png', '.jpg', '.jpeg', '.gif', '.svg', '.css', '.js')
+
+    def __init__(
+        self,
+        root_url: str,
+        max_depth: int = 2,
+        exclude_patterns: Optional[List[str]] = None,
+        fetcher: Optional[TieredFetcher] = None,
+        max_concurrent: int = 10
+    ):
+        self.root_url = self._normalize_url(root_url)
+        self.max_depth = max_depth
+        self.exclude_patterns = exclude_patterns or []
+        self.fetcher = fetcher or TieredFetcher()
+        self.max_concurrent = max_concurrent
+
+        parsed = urlparse(self.root_url)
+        self.root_domain = parsed.netloc
+        self.scope_prefix = parsed.path.rstrip('/')
+
+        self.seen: Set[str] = set()
+
+    def _normalize_url(self, url: str) -> str:
+        """Remove fragment and trailing slash from URL."""
+        url = urldefrag(url)[0]
+        if url.endswith('/'):
+            url = url[:-1]
+        return url
+
+    def in_scope(self, url: str) -> bool:
+        """Check whether a URL should be discovered."""
+        parsed = urlparse(url)
+        if parsed.scheme not in ('http', 'https') or parsed.netloc != self.root_domain:
+            return False
+
+        path = parsed.path.rstrip('/')
+        if self.scope_prefix and path != self.scope_prefix and not path.startswith(self.scope_prefix + '/'):
+            return False
+
+        if path.lower().endswith(self.SKIP_EXTENSIONS):
+            return False
+
+        return not any(pattern in url for pattern in self.exclude_patterns)
+
+    async def extract_links(self, url: str) -> List[str]:
+        """Stream a page and return the in-scope links it contains."""
+        session = await self.fetcher.get_session()
+        parser = AnchorParser(url)
+
+        try:
+            async with session.get(url) as response:
+                if response.status != 200 or 'html' not in response.headers.get('Content-Type', ''):
+                    return []
+                parser.base_url = str(response.url)
+                decoder = codecs.getincrementaldecoder(response.charset or 'utf-8')(errors='replace')
+                async for chunk in response.content.iter_chunked(16384):
+                    parser.feed(decoder.decode(chunk))
+                parser.feed(decoder.decode(b'', final=True))
+                parser.close()
+        except (aiohttp.ClientError, asyncio.TimeoutError, LookupError):
+            pass
+
+        links = []
+        for link in parser.pop_links():
+            link = self._normalize_url(link)
+            if self.in_scope(link):
+                links.append(link)
+        return links
+
+    async def discover(self) -> AsyncIterator[Tuple[str, int]]:
+        """
+        Discover URLs breadth-first.
+
+        Yields:
+            (url, depth) tuples, starting with the root URL, as they are found
+        """
+        found: asyncio.Queue = asyncio.Queue()
+        work: asyncio.Queue = asyncio.Queue()
+
+        self.seen = {self.root_url}
+        found.put_nowait((self.root_url, 0))
+        work.put_nowait((self.root_url, 0))
+
+        async def worker():
+            while True:
+                url, depth = await work.get()
+                try:
+                    if depth < self.max_depth:
+                        for link in await self.extract_links(url):
+                            if link not in self.seen:
+                                self.seen.add(link)
+                                found.put_nowait((link, depth + 1))
+                                work.put_nowait((link, depth + 1))
+                finally:
+                    work.task_done()
+
+        async def finish():
+            await work.join()
+            found.put_nowait(None)
+
+        tasks = [asyncio.create_task(worker()) for _ in range(self.max_concurrent)]
+        tasks.append(asyncio.create_task(finish()))
+
+        try:
+            while True:
+                item = await found.get()
+                if item is None:
+                    break
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def discover_all(self) -> List[str]:
+        """Run discovery to completion and return all URLs found."""
+        return [url async for url, _ in self.discover()]
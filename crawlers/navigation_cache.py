@@ -0,0 +1,143 @@
+"""
+Navigation Cache - Reuse extracted navigation trees across runs
+
+Extracting navigation needs a headless browser, yet a site's navigation
+rarely changes between runs. Extracted trees are stored per base URL with a
+TTL and a structural fingerprint of the navigation markup, fetched over
+plain HTTP. While the TTL holds and the fingerprint matches, the cached tree
+is reused and the browser is never launched.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .navigation_extractor import NavigationNode
+
+logger = logging.getLogger(__name__)
+
+
+class NavigationStructureParser(HTMLParser):
+    """
+    Collects the link structure of navigation markup.
+
+    Only link targets and their list nesting are recorded, so session
+    tokens, build hashes and other volatile attributes do not change the
+    fingerprint. Links outside navigation elements are kept separately as a
+    fallback for pages without semantic navigation.
+    """
+
+    NAV_TAGS = ('nav', 'aside')
+    # Elements that never contain navigation, so their nesting is not tracked
+    UNTRACKED_TAGS = ('a', 'br', 'img', 'input', 'link', 'meta', 'hr', 'source', 'wbr')
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.nav_links: List[str] = []
+        self.page_links: List[str] = []
+        self._open: List[Tuple[str, bool]] = []
+        self._nav_depth = 0
+        self._list_depth = 0
+
+    def handle_starttag(self, tag: str, attrs):
+        attrs = dict(attrs)
+        if tag in ('ul', 'ol'):
+            self._list_depth += 1
+        elif tag == 'a' and attrs.get('href'):
+            entry = f"{self._list_depth}:{attrs['href'].strip()}"
+            (self.nav_links if self._nav_depth else self.page_links).append(entry)
+
+        if tag in self.UNTRACKED_TAGS:
+            return
+        is_nav = tag in self.NAV_TAGS or attrs.get('role') == 'navigation'
+        self._open.append((tag, is_nav))
+        if is_nav:
+            self._nav_depth += 1
+
+    def handle_endtag(self, tag: str):
+        if tag in ('ul', 'ol'):
+            self._list_depth = max(0, self._list_depth - 1)
+        if tag in self.UNTRACKED_TAGS or all(name != tag for name, _ in self._open):
+            return
+        # Close any elements left unclosed inside this one (e.g. <li>, <p>)
+        while self._open:
+            name, is_nav = self._open.pop()
+            if is_nav:
+                self._nav_depth -= 1
+            if name == tag:
+                break
+
+
+class NavigationCache:
+    """
+    On-disk cache of navigation trees keyed by base URL.
+
+    Args:
+        cache_dir: Directory holding one JSON file per base URL
+        ttl: Seconds a cached tree stays valid (default: 86400)
+    """
+
+    def __init__(self, cache_dir: str, ttl: float = 86400.0):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+
+    def _path(self, base_url: str) -> Path:
+        key = hashlib.sha256(base_url.encode('utf-8')).hexdigest()[:32]
+        return self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def fingerprint(html: str) -> str:
+        """
+        Hash the navigation structure of a page.
+
+        Falls back to every link on the page when it has no navigation
+        elements (e.g. the navigation is rendered client-side).
+        """
+        parser = NavigationStructureParser()
+        parser.feed(html)
+        parser.close()
+        links = parser.nav_links or parser.page_links
+        return hashlib.sha256("\n".join(links).encode('utf-8')).hexdigest()
+
+    def load(self, base_url: str, fingerprint: Optional[str] = None) -> Optional[NavigationNode]:
+        """
+        Return the cached tree if it is fresh and the structure is unchanged.
+
+        Args:
+            base_url: Site the tree was extracted from
+            fingerprint: Current structural fingerprint; None when the page
+                could not be fetched, in which case only the TTL is checked
+        """
+        path = self._path(base_url)
+        if not path.exists():
+            return None
+
+        try:
+            data: Dict[str, Any] = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable navigation cache for {base_url}: {e}")
+            return None
+
+        if time.time() - data.get('created_at', 0) > self.ttl:
+            return None
+        if fingerprint is not None and data.get('fingerprint') != fingerprint:
+            return None
+        return NavigationNode.from_dict(data['tree'])
+
+    def store(self, base_url: str, tree: NavigationNode, fingerprint: Optional[str] = None):
+        """Save an extracted tree with its fingerprint."""
+        data = {
+            'base_url': base_url,
+            'fingerprint': fingerprint,
+            'created_at': time.time(),
+            'tree': tree.to_dict()
+        }
+        try:
+            self._path(base_url).write_text(json.dumps(data), encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"Could not cache navigation for {base_url}: {e}")
@@ -7,12 +7,16 @@ reading order for documentation and content.
 
 import asyncio
 import re
+import sys
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from urllib.parse import urljoin, urlparse, urldefrag
 import json
 
-from playwright.async_api import async_playwright, Page, ElementHandle
+from playwright.async_api import async_playwright, Page
+
+from .sitemap import SitemapReader
+from .tiered_fetcher import TieredFetcher
 
 
 @dataclass
@@ -35,6 +39,19 @@ class NavigationNode:
             'children': [child.to_dict() for child in self.children]
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict, parent: Optional['NavigationNode'] = None) -> 'NavigationNode':
+        """Rebuild a tree serialized with to_dict()."""
+        node = cls(
+            title=data.get('title', ''),
+            url=data.get('url', ''),
+            level=data.get('level', 0),
+            order=data.get('order', 0),
+            parent=parent
+        )
+        node.children = [cls.from_dict(child, node) for child in data.get('children', [])]
+        return node
+    
     def get_all_urls(self) -> List[str]:
         """Get all URLs in this branch of the tree."""
         urls = [self.url] if self.url else []
@@ -43,6 +60,55 @@ class NavigationNode:
         return urls
 
 
+class NavigationIndex:
+    """
+    Flattened, array-backed view of a navigation tree.
+    
+    Nodes are stored in pre-order, so a node's index is its position in the
+    tree. Parents are stored as indices and titles are interned; breadcrumbs
+    are built on demand by following parent indices instead of being copied
+    at every level of a traversal.
+    """
+    
+    def __init__(self, root: NavigationNode):
+        self.root = root
+        self.urls: List[str] = []
+        self.titles: List[str] = []
+        self.levels: List[int] = []
+        self.parents: List[int] = []
+        # First position of every URL
+        self.positions: Dict[str, int] = {}
+        
+        stack = [(root, -1)]
+        while stack:
+            node, parent = stack.pop()
+            index = len(self.urls)
+            self.urls.append(node.url)
+            self.titles.append(sys.intern(node.title or ""))
+            self.levels.append(node.level)
+            self.parents.append(parent)
+            if node.url and node.url not in self.positions:
+                self.positions[node.url] = index
+            stack.extend((child, index) for child in reversed(node.children))
+        
+        # Positions of nodes that link to a page, in navigation order
+        self.page_positions = [index for index, url in enumerate(self.urls) if url]
+    
+    def __len__(self) -> int:
+        return len(self.urls)
+    
+    def breadcrumb(self, index: int) -> List[str]:
+        """Titles from the root to a node, skipping untitled ancestors."""
+        crumbs = [self.titles[index]]
+        parent = self.parents[index]
+        while parent >= 0:
+            if self.titles[parent]:
+                crumbs.append(self.titles[parent])
+            parent = self.parents[parent]
+        crumbs.reverse()
+        return crumbs
+
+
 class NavigationExtractor:
     """
     Extracts navigation structure from websites using various strategies.
@@ -78,11 +144,105 @@ class NavigationExtractor:
         '[role="navigation"][aria-label*="main"]'
     ]
     
-    def __init__(self, base_url: str, progress_tracker: Optional[Any] = None):
+    # Runs all in-page strategies and returns the best-scoring candidate.
+    # Semantic navigation outranks link-list patterns, which outrank plain
+    # link clusters; within a strategy, more internal links and deeper
+    # nesting score higher.
+    EXTRACTION_SCRIPT = '''({priority, general}) => {
+        const NAV_WORDS = /^(home|about|docs|documentation|guide|tutorial|reference|api|blog|contact)/i;
+        
+        function isInternal(href) {
+            if (!href || href.startsWith('#')) return false;
+            try {
+                const url = new URL(href, document.baseURI);
+                return (url.protocol === 'http:' || url.protocol === 'https:') && url.host === location.host;
+            } catch (e) {
+                return false;
+            }
+        }
+        
+        function collect(root, nested) {
+            const links = [];
+            const processedUrls = new Set();
+            root.querySelectorAll('a').forEach((link, index) => {
+                const href = link.getAttribute('href');
+                if (!href || href === '#' || processedUrls.has(href)) return;
+                processedUrls.add(href);
+                
+                // Nesting depth of UL/OL lists between the link and the root
+                let level = 0;
+                if (nested) {
+                    for (let parent = link.parentElement; parent && parent !== root; parent = parent.parentElement) {
+                        if (parent.tagName === 'UL' || parent.tagName === 'OL') level++;
+                    }
+                }
+                links.push({text: link.textContent.trim(), href: href, level: level, order: index});
+            });
+            return links;
+        }
+        
+        const candidates = [];
+        function consider(selector, links, weight) {
+            const internal = links.filter(link => isInternal(link.href));
+            if (!internal.length) return;
+            const levels = new Set(internal.map(link => link.level)).size;
+            candidates.push({
+                selector: selector,
+                links: links,
+                score: weight * internal.length * (1 + 0.25 * (levels - 1))
+            });
+        }
+        
+        // Semantic navigation elements
+        const visited = new Set();
+        for (const [selectors, weight] of [[priority, 4], [general, 3]]) {
+            for (const selector of selectors) {
+                let element = null;
+                try {
+                    element = document.querySelector(selector);
+                } catch (e) {
+                    continue;
+                }
+                if (!element || visited.has(element)) continue;
+                visited.add(element);
+                consider(selector, collect(element, true), weight);
+            }
+        }
+        
+        // Lists of links that read like navigation
+        for (const list of document.querySelectorAll('ul, ol')) {
+            const anchors = Array.from(list.querySelectorAll('a'));
+            if (anchors.length < 3 || visited.has(list)) continue;
+            if (!anchors.some(a => NAV_WORDS.test(a.textContent.trim()))) continue;
+            consider('pattern-based', collect(list, false), 1);
+        }
+        
+        // Plain cluster of the first internal links on the page
+        const cluster = collect(document, false)
+            .filter(link => isInternal(link.href))
+            .slice(0, 20)
+            .map((link, index) => ({...link, order: index}));
+        if (cluster.length >= 3) consider('link-based', cluster, 0.5);
+        
+        candidates.sort((a, b) => b.score - a.score);
+        return candidates.length ? candidates[0] : null;
+    }'''
+    
+    def __init__(self, base_url: str, progress_tracker: Optional[Any] = None, cache: Optional[Any] = None):
+        """
+        Args:
+            base_url: Page whose navigation is extracted
+            progress_tracker: Optional progress tracker for status updates
+            cache: NavigationCache to reuse trees from while the site's
+                navigation structure is unchanged (optional)
+        """
         self.base_url = self._normalize_url(base_url)
         self.base_domain = urlparse(base_url).netloc
         self.navigation_tree: Optional[NavigationNode] = None
         self.progress_tracker = progress_tracker
+        self.cache = cache
+        self.from_cache = False
+        self._index: Optional[NavigationIndex] = None
         
     def _normalize_url(self, url: str) -> str:
         """Normalize URL for comparison."""
@@ -108,6 +268,16 @@ class NavigationExtractor:
         Returns:
             Root NavigationNode containing the entire navigation tree
         """
+        fingerprint = None
+        if self.cache:
+            fingerprint = await self._fetch_fingerprint()
+            cached = self.cache.load(self.base_url, fingerprint)
+            if cached is not None:
+                self.navigation_tree = cached
+                self.from_cache = True
+                self._index = NavigationIndex(cached)
+                return self.navigation_tree
+        
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             page = await browser.new_page()
@@ -121,29 +291,13 @@ class NavigationExtractor:
                 
                 await page.goto(self.base_url, wait_until='networkidle', timeout=30000)
                 
-                # Try different extraction strategies
+                # Run every in-page strategy in a single round-trip
                 if self.progress_tracker:
                     self.progress_tracker.update_task(
                         "nav_extraction",
-                        current_item="Analyzing semantic navigation..."
+                        current_item="Analyzing navigation..."
                     )
-                navigation = await self._extract_semantic_navigation(page)
-                
-                if not navigation or len(navigation.children) == 0:
-                    if self.progress_tracker:
-                        self.progress_tracker.update_task(
-                            "nav_extraction",
-                            current_item="Trying pattern-based extraction..."
-                        )
-                    navigation = await self._extract_by_patterns(page)
-                
-                if not navigation or len(navigation.children) == 0:
-                    if self.progress_tracker:
-                        self.progress_tracker.update_task(
-                            "nav_extraction",
-                            current_item="Analyzing link clusters..."
-                        )
-                    navigation = await self._extract_link_clusters(page)
+                navigation = await self._extract_in_page(page)
                 
                 if not navigation or len(navigation.children) == 0:
                     if self.progress_tracker:
@@ -151,88 +305,51 @@ class NavigationExtractor:
                             "nav_extraction",
                             current_item="Checking sitemap..."
                         )
-                    navigation = await self._extract_from_sitemap(page)
+                    navigation = await self._extract_from_sitemap()
                 
                 self.navigation_tree = navigation
                 
             finally:
                 await browser.close()
         
+        if self.navigation_tree:
+            self._index = NavigationIndex(self.navigation_tree)
+            if self.cache:
+                self.cache.store(self.base_url, self.navigation_tree, fingerprint)
+        
         return self.navigation_tree
     
-    async def _extract_semantic_navigation(self, page: Page) -> Optional[NavigationNode]:
-        """Extract navigation using semantic HTML elements."""
-        
-        # Try priority selectors first
-        for selector in self.PRIORITY_SELECTORS:
-            nav_element = await page.query_selector(selector)
-            if nav_element:
-                navigation = await self._parse_navigation_element(page, nav_element, selector)
-                if navigation and len(navigation.children) > 0:
-                    return navigation
-        
-        # Try general navigation selectors
-        for selector in self.NAVIGATION_SELECTORS:
-            nav_element = await page.query_selector(selector)
-            if nav_element:
-                navigation = await self._parse_navigation_element(page, nav_element, selector)
-                if navigation and len(navigation.children) > 0:
-                    return navigation
-        
-        return None
+    async def _fetch_fingerprint(self) -> Optional[str]:
+        """Fingerprint the page's navigation markup over plain HTTP."""
+        fetcher = TieredFetcher(max_connections=1)
+        try:
+            response = await fetcher.fetch_response(self.base_url)
+        finally:
+            await fetcher.close()
+        if response is None or response.html is None:
+            return None
+        return self.cache.fingerprint(response.html)
     
-    async def _parse_navigation_element(self, page: Page, element: ElementHandle, selector: str) -> Optional[NavigationNode]:
-        """Parse a navigation element into a tree structure."""
-        
-        # Extract all links within the navigation element
-        links_data = await page.evaluate('''(element) => {
-            const links = [];
-            const processedUrls = new Set();
-            
-            function extractLinks(el, level = 0) {
-                // Find all links in the current element
-                const linkElements = el.querySelectorAll('a');
-                
-                linkElements.forEach((link, index) => {
-                    const href = link.getAttribute('href');
-                    if (!href || href === '#' || processedUrls.has(href)) return;
-                    
-                    processedUrls.add(href);
-                    
-                    // Determine the hierarchy level
-                    let linkLevel = level;
-                    let parent = link.parentElement;
-                    let nestingLevel = 0;
-                    
-                    while (parent && parent !== el) {
-                        if (parent.tagName === 'UL' || parent.tagName === 'OL') {
-                            nestingLevel++;
-                        }
-                        parent = parent.parentElement;
-                    }
-                    
-                    links.push({
-                        text: link.textContent.trim(),
-                        href: href,
-                        level: nestingLevel,
-                        order: index,
-                        classes: link.className,
-                        isActive: link.classList.contains('active') || 
-                                 link.getAttribute('aria-current') === 'page'
-                    });
-                });
-            }
-            
-            extractLinks(element);
-            return links;
-        }''', element)
+    async def _extract_in_page(self, page: Page) -> Optional[NavigationNode]:
+        """
+        Extract navigation with one injected script.
         
-        if not links_data:
+        The script tries the semantic selectors, link-list patterns and link
+        clusters inside the page, scores every candidate, and returns only
+        the best one, so the whole extraction is a single evaluate call.
+        """
+        candidate = await page.evaluate(self.EXTRACTION_SCRIPT, {
+            'priority': self.PRIORITY_SELECTORS,
+            'general': self.NAVIGATION_SELECTORS
+        })
+        if not candidate:
             return None
-        
-        # Build navigation tree
+        return self._build_tree(candidate)
+    
+    def _build_tree(self, candidate: Dict[str, Any]) -> Optional[NavigationNode]:
+        """Build a navigation tree from the candidate chosen in the page."""
         root = NavigationNode(
-            title=f"Navigation ({selector})",
+            title=f"Navigation ({candidate['selector']})",
             url="",
             level=-1,
             order=0
@@ -241,86 +358,56 @@ class NavigationExtractor:
         # Group links by level and create hierarchy
         level_nodes = {-1: root}
         
-        for link_info in links_data:
+        for idx, link_info in enumerate(candidate.get('links', [])):
             url = self._make_absolute_url(link_info['href'])
             if not url or not self._is_internal_url(url):
                 continue
             
             node = NavigationNode(
-                title=link_info['text'],
+                title=link_info['text'] or f"Page {idx + 1}",
                 url=self._normalize_url(url),
                 level=link_info['level'],
                 order=link_info['order']
             )
             
             # Find parent node
-            parent_level = link_info['level'] - 1
-            if parent_level in level_nodes:
-                parent = level_nodes[parent_level]
-            else:
-                parent = root
-            
+            parent = level_nodes.get(link_info['level'] - 1, root)
             parent.children.append(node)
             node.parent = parent
             level_nodes[link_info['level']] = node
         
-        return root
+        return root if root.children else None
     
-    async def _extract_by_patterns(self, page: Page) -> Optional[NavigationNode]:
-        """Extract navigation by looking for common patterns."""
+    async def _extract_from_sitemap(self) -> Optional[NavigationNode]:
+        """Try to extract navigation from the site's sitemaps, without a browser."""
         
-        # Look for lists of links that appear to be navigation
-        nav_data = await page.evaluate('''() => {
-            const possibleNavs = [];
-            
-            // Find all UL/OL elements with multiple links
-            const lists = document.querySelectorAll('ul, ol');
-            
-            for (const list of lists) {
-                const links = list.querySelectorAll('a');
-                if (links.length < 3) continue;  // Need at least 3 links
-                
-                // Check if this looks like navigation
-                const linkTexts = Array.from(links).map(l => l.textContent.trim());
-                const hasNavigationalWords = linkTexts.some(text => 
-                    /^(home|about|docs|documentation|guide|tutorial|reference|api|blog|contact)/i.test(text)
-                );
-                
-                if (hasNavigationalWords) {
-                    const linkData = Array.from(links).map((link, index) => ({
-                        text: link.textContent.trim(),
-                        href: link.getAttribute('href'),
-                        order: index
-                    }));
-                    
-                    possibleNavs.push({
-                        selector: 'pattern-based',
-                        links: linkData
-                    });
-                }
-            }
-            
-            return possibleNavs[0];  // Return the first match
-        }''')
+        reader = SitemapReader(self.base_url)
+        try:
+            pages = await reader.read()
+        finally:
+            await reader.close()
         
-        if not nav_data or not nav_data.get('links'):
+        urls = [url for url in pages if self._is_internal_url(url)]
+        if not urls:
             return None
         
         root = NavigationNode(
-            title="Navigation (pattern-based)",
+            title="Navigation (sitemap)",
             url="",
             level=-1,
             order=0
         )
         
-        for idx, link_info in enumerate(nav_data['links']):
-            url = self._make_absolute_url(link_info['href'])
-            if not url or not self._is_internal_url(url):
-                continue
+        for idx, url in enumerate(urls):
+            # Extract title from URL path
+            path = urlparse(url).path
+            title = path.strip('/').replace('-', ' ').replace('_', ' ').title()
+            if not title:
+                title = "Home"
             
             node = NavigationNode(
-                title=link_info['text'],
-                url=self._normalize_url(url),
+                title=title,
+                url=url,
                 level=0,
                 order=idx
             )
@@ -329,113 +416,6 @@ class NavigationExtractor:
         
         return root
     
-    async def _extract_link_clusters(self, page: Page) -> Optional[NavigationNode]:
-        """Extract navigation by finding clusters of related links."""
-        
-        # Get all internal links on the page
-        links_data = await page.evaluate('''() => {
-            const links = [];
-            const linkElements = document.querySelectorAll('a[href]');
-            
-            linkElements.forEach((link, index) => {
-                const href = link.getAttribute('href');
-                if (!href || href === '#') return;
-                
-                links.push({
-                    text: link.textContent.trim(),
-                    href: href,
-                    parent: link.parentElement?.tagName,
-                    order: index
-                });
-            });
-            
-            return links;
-        }''')
-        
-        if not links_data:
-            return None
-        
-        # Filter for internal links and group by parent element
-        internal_links = []
-        for link_info in links_data:
-            url = self._make_absolute_url(link_info['href'])
-            if url and self._is_internal_url(url):
-                link_info['url'] = self._normalize_url(url)
-                internal_links.append(link_info)
-        
-        if len(internal_links) < 3:
-            return None
-        
-        # Create a simple flat navigation from the first 20 internal links
-        root = NavigationNode(
-            title="Navigation (link-based)",
-            url="",
-            level=-1,
-            order=0
-        )
-        
-        for idx, link_info in enumerate(internal_links[:20]):
-            node = NavigationNode(
-                title=link_info['text'] or f"Page {idx + 1}",
-                url=link_info['url'],
-                level=0,
-                order=idx
-            )
-            root.children.append(node)
-            node.parent = root
-        
-        return root
-    
-    async def _extract_from_sitemap(self, page: Page) -> Optional[NavigationNode]:
-        """Try to extract navigation from sitemap if available."""
-        
-        # Check for sitemap link
-        sitemap_url = urljoin(self.base_url, '/sitemap.xml')
-        
-        try:
-            response = await page.goto(sitemap_url, wait_until='domcontentloaded', timeout=10000)
-            if response and response.status == 200:
-                # Parse sitemap XML
-                sitemap_data = await page.evaluate('''() => {
-                    const urls = [];
-                    const urlElements = document.querySelectorAll('url loc');
-                    urlElements.forEach(el => {
-                        urls.push(el.textContent);
-                    });
-                    return urls;
-                }''')
-                
-                if sitemap_data:
-                    root = NavigationNode(
-                        title="Navigation (sitemap)",
-                        url="",
-                        level=-1,
-                        order=0
-                    )
-                    
-                    for idx, url in enumerate(sitemap_data[:30]):  # Limit to 30 URLs
-                        if self._is_internal_url(url):
-                            # Extract title from URL path
-                            path = urlparse(url).path
-                            title = path.strip('/').replace('-', ' ').replace('_', ' ').title()
-                            if not title:
-                                title = "Home"
-                            
-                            node = NavigationNode(
-                                title=title,
-                                url=self._normalize_url(url),
-                                level=0,
-                                order=idx
-                            )
-                            root.children.append(node)
-                            node.parent = root
-                    
-                    return root
-        except:
-            pass
-        
-        return None
-    
     def _is_internal_url(self, url: str) -> bool:
         """Check if URL belongs to the same domain."""
         if not url:
@@ -443,6 +423,15 @@ class NavigationExtractor:
         parsed = urlparse(url)
         return parsed.netloc == self.base_domain or parsed.netloc == ""
     
+    @property
+    def index(self) -> Optional[NavigationIndex]:
+        """Flattened index of the navigation tree, rebuilt if the tree was replaced."""
+        if not self.navigation_tree:
+            return None
+        if self._index is None or self._index.root is not self.navigation_tree:
+            self._index = NavigationIndex(self.navigation_tree)
+        return self._index
+    
     def find_position(self, url: str) -> Optional[Tuple[int, List[str]]]:
         """
         Find the position of a URL in the navigation tree.
@@ -450,25 +439,14 @@ class NavigationExtractor:
         Returns:
             Tuple of (position_index, breadcrumb_path) or None if not found
         """
-        if not self.navigation_tree:
+        index = self.index
+        if index is None:
             return None
         
-        normalized_url = self._normalize_url(url)
-        position = [0]
-        
-        def search_tree(node: NavigationNode, path: List[str], pos: List[int]) -> Optional[Tuple[int, List[str]]]:
-            if node.url == normalized_url:
-                return (pos[0], path + [node.title])
-            
-            for child in node.children:
-                pos[0] += 1
-                result = search_tree(child, path + [node.title] if node.title else path, pos)
-                if result:
-                    return result
-            
+        position = index.positions.get(self._normalize_url(url))
+        if position is None:
             return None
-        
-        return search_tree(self.navigation_tree, [], position)
+        return (position, index.breadcrumb(position))
     
     def get_ordered_urls(self) -> List[Dict[str, Any]]:
         """
@@ -477,26 +455,20 @@ class NavigationExtractor:
         Returns:
             List of dictionaries with url, title, level, and breadcrumb
         """
-        if not self.navigation_tree:
+        index = self.index
+        if index is None:
             return []
         
-        ordered = []
-        
-        def traverse(node: NavigationNode, breadcrumb: List[str]):
-            if node.url:
-                ordered.append({
-                    'url': node.url,
-                    'title': node.title,
-                    'level': node.level,
-                    'breadcrumb': breadcrumb + [node.title],
-                    'order': len(ordered)
-                })
-            
-            for child in node.children:
-                traverse(child, breadcrumb + [node.title] if node.title else breadcrumb)
-        
-        traverse(self.navigation_tree, [])
-        return ordered
+        return [
+            {
+                'url': index.urls[position],
+                'title': index.titles[position],
+                'level': index.levels[position],
+                'breadcrumb': index.breadcrumb(position),
+                'order': order
+            }
+            for order, position in enumerate(index.page_positions)
+        ]
     
     def export_structure(self, filepath: str):
         """Export navigation structure to JSON file."""
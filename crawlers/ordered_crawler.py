@@ -12,6 +12,7 @@ from datetime import datetime
 
 from .depth_crawler import DepthCrawler
 from .navigation_extractor import NavigationExtractor
+from .navigation_cache import NavigationCache
 from .document_stitcher import stitch_crawled_content
 from .progress_tracker import ProgressTracker
 
@@ -31,7 +32,10 @@ class OrderedCrawler:
         exclude_patterns: Optional[List[str]] = None,
         extract_navigation: bool = True,
         create_stitched: bool = True,
-        show_progress: bool = True
+        show_progress: bool = True,
+        http_first: bool = False,
+        refresh: Optional[str] = None,
+        nav_cache_ttl: Optional[float] = None
     ):
         """
         Initialize the OrderedCrawler.
@@ -45,6 +49,12 @@ class OrderedCrawler:
             extract_navigation: Whether to extract navigation structure
             create_stitched: Whether to create a stitched document
             show_progress: Whether to show progress bars
+            http_first: Serve static pages over HTTP and render only JavaScript pages
+            refresh: Page cache refresh policy ('conditional', 'always' or
+                'never'); None disables the page cache
+            nav_cache_ttl: Seconds an extracted navigation tree is reused while
+                the site's navigation markup is unchanged, e.g. 86400; None
+                always re-extracts with a browser (default: None)
         """
         self.root_url = root_url
         self.max_depth = max_depth
@@ -54,6 +64,9 @@ class OrderedCrawler:
         self.extract_navigation = extract_navigation
         self.create_stitched = create_stitched
         self.show_progress = show_progress
+        self.http_first = http_first
+        self.refresh = refresh
+        self.nav_cache_ttl = nav_cache_ttl
         
         # Results storage
         self.navigation_tree = None
@@ -92,111 +105,38 @@ class OrderedCrawler:
             'stages': {}
         }
         
-        # Stage 1: Extract Navigation Structure
-        if self.extract_navigation:
-            if self.progress:
-                with self.progress.stage("Stage 1: Extracting Navigation", "🗺️ Analyzing site structure"):
-                    nav_task = self.progress.create_task(
-                        "nav_extraction", 
-                        "🔍 Extracting navigation structure", 
-                        total=None
-                    )
-            else:
-                print("📍 Stage 1: Extracting Navigation Structure")
-                print("-" * 40)
-            
-            nav_extractor = NavigationExtractor(self.root_url, progress_tracker=self.progress)
-            try:
-                self.navigation_tree = await nav_extractor.extract()
-                
-                if self.navigation_tree:
-                    self.ordered_urls = nav_extractor.get_ordered_urls()
-                    
-                    if self.progress:
-                        self.progress.complete_task("nav_extraction", 
-                            f"✅ Found {len(self.ordered_urls)} pages in navigation")
-                        self.progress.update_stats(total_discovered=len(self.ordered_urls))
-                    else:
-                        nav_extractor.print_structure()
-                        print(f"✅ Found {len(self.ordered_urls)} pages in navigation")
-                    
-                    # Save navigation structure
-                    nav_file = self.output_dir / "navigation_structure.json"
-                    nav_file.parent.mkdir(parents=True, exist_ok=True)
-                    nav_extractor.export_structure(str(nav_file))
-                    
-                    results['stages']['navigation'] = {
-                        'success': True,
-                        'pages_found': len(self.ordered_urls),
-                        'structure_file': str(nav_file)
-                    }
-                else:
-                    if self.progress:
-                        self.progress.fail_task("nav_extraction", "Could not extract navigation structure")
-                    else:
-                        print("⚠️  Could not extract navigation structure")
-                    results['stages']['navigation'] = {
-                        'success': False,
-                        'error': 'No navigation structure found'
-                    }
-            except Exception as e:
-                if self.progress:
-                    self.progress.fail_task("nav_extraction", f"Navigation extraction failed: {e}")
-                else:
-                    print(f"❌ Navigation extraction failed: {e}")
-                results['stages']['navigation'] = {
-                    'success': False,
-                    'error': str(e)
-                }
-        
-        # Stage 2: Crawl Website
-        if self.progress:
-            with self.progress.stage("Stage 2: Crawling Website", "📊 Downloading page content"):
-                pass
-        else:
-            print("\n📊 Stage 2: Crawling Website Content")
-            print("-" * 40)
-        
         crawler = DepthCrawler(
             root_url=self.root_url,
             max_depth=self.max_depth,
             output_dir=str(self.output_dir / "content"),
             max_concurrent=self.max_concurrent,
             exclude_patterns=self.exclude_patterns,
-            progress_tracker=self.progress
+            progress_tracker=self.progress,
+            http_first=self.http_first,
+            refresh=self.refresh,
+            cache_dir=str(self.output_dir / ".page_cache")
         )
         
+        # Stages 1 and 2 run concurrently; navigation URLs seed the crawl as
+        # soon as they are known, and both are joined before stitching
+        nav_job = None
+        if self.extract_navigation:
+            nav_job = asyncio.create_task(self._extract_navigation(results, crawler))
+        
+        crawl_job = asyncio.create_task(self._crawl_content(results, crawler))
         try:
-            self.crawl_results = await crawler.crawl()
-            
-            results['stages']['crawling'] = {
-                'success': True,
-                'total_crawled': self.crawl_results['total_crawled'],
-                'successful': self.crawl_results['successful'],
-                'failed': self.crawl_results['failed'],
-                'files_created': len(self.crawl_results['files_created'])
-            }
-            
-            if self.progress:
-                self.progress.log(
-                    f"Crawled {self.crawl_results['total_crawled']} pages "
-                    f"({self.crawl_results['successful']} successful, {self.crawl_results['failed']} failed)",
-                    "success"
-                )
-            else:
-                print(f"✅ Crawled {self.crawl_results['total_crawled']} pages")
-                print(f"   - Successful: {self.crawl_results['successful']}")
-                print(f"   - Failed: {self.crawl_results['failed']}")
-            
-        except Exception as e:
-            if self.progress:
-                self.progress.log(f"Crawling failed: {e}", "error")
-            else:
-                print(f"❌ Crawling failed: {e}")
-            results['stages']['crawling'] = {
-                'success': False,
-                'error': str(e)
-            }
+            try:
+                await crawl_job
+            except BaseException:
+                if nav_job:
+                    nav_job.cancel()
+                raise
+            if nav_job:
+                await nav_job
+        finally:
+            crawler.close()
+        
+        if not results['stages']['crawling']['success']:
             results['end_time'] = datetime.now()
             results['duration'] = str(results['end_time'] - results['start_time'])
             if self.progress:
@@ -257,6 +197,125 @@ class OrderedCrawler:
         
         return results
     
+    async def _extract_navigation(self, results: Dict, crawler: DepthCrawler):
+        """
+        Stage 1: extract the navigation structure and seed the crawl with it.
+        
+        Args:
+            results: Run results, updated in place
+            crawler: Content crawler running concurrently
+        """
+        if self.progress:
+            with self.progress.stage("Stage 1: Extracting Navigation", "🗺️ Analyzing site structure"):
+                self.progress.create_task(
+                    "nav_extraction", 
+                    "🔍 Extracting navigation structure", 
+                    total=None
+                )
+        else:
+            print("📍 Stage 1: Extracting Navigation Structure")
+            print("-" * 40)
+        
+        nav_cache = None
+        if self.nav_cache_ttl is not None:
+            nav_cache = NavigationCache(self.output_dir / ".nav_cache", ttl=self.nav_cache_ttl)
+        nav_extractor = NavigationExtractor(self.root_url, progress_tracker=self.progress, cache=nav_cache)
+        try:
+            self.navigation_tree = await nav_extractor.extract()
+            
+            if self.navigation_tree:
+                self.ordered_urls = nav_extractor.get_ordered_urls()
+                seeded = crawler.add_seed_urls(item['url'] for item in self.ordered_urls)
+                
+                source = " (cached)" if nav_extractor.from_cache else ""
+                if self.progress:
+                    self.progress.complete_task("nav_extraction", 
+                        f"✅ Found {len(self.ordered_urls)} pages in navigation{source}, "
+                        f"{seeded} queued for crawling")
+                    self.progress.update_stats(total_discovered=len(self.ordered_urls))
+                else:
+                    nav_extractor.print_structure()
+                    print(f"✅ Found {len(self.ordered_urls)} pages in navigation{source}, "
+                          f"{seeded} queued for crawling")
+                
+                # Save navigation structure
+                nav_file = self.output_dir / "navigation_structure.json"
+                nav_file.parent.mkdir(parents=True, exist_ok=True)
+                nav_extractor.export_structure(str(nav_file))
+                
+                results['stages']['navigation'] = {
+                    'success': True,
+                    'pages_found': len(self.ordered_urls),
+                    'pages_seeded': seeded,
+                    'structure_file': str(nav_file),
+                    'cached': nav_extractor.from_cache
+                }
+            else:
+                if self.progress:
+                    self.progress.fail_task("nav_extraction", "Could not extract navigation structure")
+                else:
+                    print("⚠️  Could not extract navigation structure")
+                results['stages']['navigation'] = {
+                    'success': False,
+                    'error': 'No navigation structure found'
+                }
+        except Exception as e:
+            if self.progress:
+                self.progress.fail_task("nav_extraction", f"Navigation extraction failed: {e}")
+            else:
+                print(f"❌ Navigation extraction failed: {e}")
+            results['stages']['navigation'] = {
+                'success': False,
+                'error': str(e)
+            }
+    
+    async def _crawl_content(self, results: Dict, crawler: DepthCrawler):
+        """
+        Stage 2: crawl the site content.
+        
+        Args:
+            results: Run results, updated in place
+            crawler: Content crawler to run
+        """
+        if self.progress:
+            with self.progress.stage("Stage 2: Crawling Website", "📊 Downloading page content"):
+                pass
+        else:
+            print("\n📊 Stage 2: Crawling Website Content")
+            print("-" * 40)
+        
+        try:
+            self.crawl_results = await crawler.crawl()
+            
+            results['stages']['crawling'] = {
+                'success': True,
+                'total_crawled': self.crawl_results['total_crawled'],
+                'successful': self.crawl_results['successful'],
+                'failed': self.crawl_results['failed'],
+                'files_created': len(self.crawl_results['files_created'])
+            }
+            
+            if self.progress:
+                self.progress.log(
+                    f"Crawled {self.crawl_results['total_crawled']} pages "
+                    f"({self.crawl_results['successful']} successful, {self.crawl_results['failed']} failed)",
+                    "success"
+                )
+            else:
+                print(f"✅ Crawled {self.crawl_results['total_crawled']} pages")
+                print(f"   - Successful: {self.crawl_results['successful']}")
+                print(f"   - Failed: {self.crawl_results['failed']}")
+            
+        except Exception as e:
+            if self.progress:
+                self.progress.log(f"Crawling failed: {e}", "error")
+            else:
+                print(f"❌ Crawling failed: {e}")
+            results['stages']['crawling'] = {
+                'success': False,
+                'error': str(e)
+            }
+    
     async def _create_master_summary(self, results: Dict):
         """Create a master summary file with all results."""
         summary_path = self.output_dir / "master_summary.md"
@@ -279,6 +338,7 @@ class OrderedCrawler:
                 summary_lines.extend([
                     f"### ✅ Navigation Extraction",
                     f"- Pages found in navigation: {nav['pages_found']}",
+                    f"- Pages queued for crawling: {nav.get('pages_seeded', 0)}",
                     f"- Structure saved to: `{Path(nav['structure_file']).name}`",
                     f""
                 ])
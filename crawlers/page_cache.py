@@ -0,0 +1,199 @@
+"""
+Page Cache - Persistent conditional-GET cache for incremental recrawls
+
+Stores the validators (ETag/Last-Modified), a hash of the raw HTML and the
+extracted markdown of every crawled page, keyed by normalized URL. On the
+next run a conditional request tells us whether a page changed; unchanged
+pages (304, or an identical body) reuse the cached markdown and skip the
+browser render entirely.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urldefrag
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedPage:
+    """A cached crawl result for one URL."""
+    url: str
+    markdown: str
+    content_hash: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    links: List[str] = field(default_factory=list)
+
+
+class PageCache:
+    """
+    On-disk page cache with a recrawl refresh policy.
+
+    Refresh policies:
+        conditional: Revalidate every cached page with a conditional GET and
+            reuse it on 304 or an unchanged content hash (default)
+        always: Ignore cached pages and refetch everything, refreshing the cache
+        never: Serve cached pages without any request; only new URLs are fetched
+
+    Args:
+        cache_dir: Directory holding one JSON file per cached URL
+        refresh: Refresh policy (default: 'conditional')
+    """
+
+    REFRESH_POLICIES = ("conditional", "always", "never")
+
+    def __init__(self, cache_dir: str, refresh: str = "conditional"):
+        if refresh not in self.REFRESH_POLICIES:
+            raise ValueError(f"Unknown refresh policy: {refresh}")
+
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.refresh = refresh
+
+        self.stats: Dict[str, int] = {
+            'hits': 0,
+            'misses': 0,
+            'stored': 0
+        }
+
+    def _normalize_url(self, url: str) -> str:
+        """Remove fragment and trailing slash from URL."""
+        url = urldefrag(url)[0]
+        if url.endswith('/'):
+            url = url[:-1]
+        return url
+
+    def _path(self, url: str) -> Path:
+        key = hashlib.sha256(self._normalize_url(url).encode('utf-8')).hexdigest()[:32]
+        return self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def hash_content(html: str) -> str:
+        """Hash a raw HTML body for change detection."""
+        return hashlib.sha256(html.encode('utf-8', errors='replace')).hexdigest()
+
+    def lookup(self, url: str) -> Optional[CachedPage]:
+        """
+        Load the cached entry for a URL, honoring the refresh policy.
+
+        Returns:
+            The cached page, or None if missing, unreadable, or the policy
+            is 'always'
+        """
+        if self.refresh == "always":
+            return None
+
+        path = self._path(url)
+        if not path.exists():
+            return None
+
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+            return CachedPage(**data)
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry for {url}: {e}")
+            return None
+
+    def serves_without_request(self, entry: Optional[CachedPage], lastmod: Optional[datetime] = None) -> bool:
+        """
+        Whether a cached page can be used without contacting the server.
+
+        Args:
+            entry: Cached page (may be None)
+            lastmod: When the page last changed, e.g. from the sitemap; a page
+                cached after that needs no revalidation
+        """
+        if entry is None:
+            return False
+        if self.refresh == "never":
+            return True
+        if lastmod is None:
+            return False
+        try:
+            fetched_at = datetime.fromisoformat(entry.fetched_at).astimezone()
+        except ValueError:
+            return False
+        if lastmod.tzinfo is None:
+            lastmod = lastmod.astimezone()
+        return fetched_at >= lastmod
+
+    def request_headers(self, entry: Optional[CachedPage]) -> Dict[str, str]:
+        """Conditional request headers for revalidating a cached page."""
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def is_unchanged(self, entry: Optional[CachedPage], response: Any) -> bool:
+        """
+        Decide whether a revalidation response means the cached page is current.
+
+        Args:
+            entry: Cached page (may be None)
+            response: HttpResponse from TieredFetcher.fetch_response() (may be None)
+        """
+        if entry is None or response is None:
+            return False
+        if response.status == 304:
+            return True
+        return (
+            response.status == 200
+            and response.html is not None
+            and entry.content_hash is not None
+            and self.hash_content(response.html) == entry.content_hash
+        )
+
+    def store(
+        self,
+        url: str,
+        markdown: str,
+        response: Any = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        links: Optional[List[str]] = None
+    ) -> CachedPage:
+        """
+        Save a crawled page and the validators of its HTTP response.
+
+        Args:
+            url: Page URL
+            markdown: Extracted markdown to reuse while the page is unchanged
+            response: HttpResponse the page was validated with (optional)
+            metadata: Page metadata such as title and description
+            links: Internal links found on the page
+        """
+        entry = CachedPage(
+            url=self._normalize_url(url),
+            markdown=markdown,
+            metadata=metadata or {},
+            links=links or []
+        )
+        if response is not None and response.status == 200:
+            entry.etag = response.headers.get('ETag')
+            entry.last_modified = response.headers.get('Last-Modified')
+            if response.html is not None:
+                entry.content_hash = self.hash_content(response.html)
+
+        try:
+            self._path(url).write_text(json.dumps(asdict(entry)), encoding='utf-8')
+            self.stats['stored'] += 1
+        except OSError as e:
+            logger.warning(f"Could not cache {url}: {e}")
+        return entry
+
+    def touch(self, entry: CachedPage, response: Any = None) -> CachedPage:
+        """Record a cache hit, refreshing validators sent with a 200 response."""
+        self.stats['hits'] += 1
+        if response is not None and response.status == 200:
+            return self.store(entry.url, entry.markdown, response, entry.metadata, entry.links)
+        return entry
@@ -47,6 +47,7 @@ class ProgressStats:
     current_url: str = ""
     stage: str = ""
     start_time: float = field(default_factory=time.time)
+    concurrency_limits: Dict[str, int] = field(default_factory=dict)
     
     @property
     def processing_rate(self) -> float:
@@ -291,6 +292,19 @@ class ProgressTracker:
         self.stats.failed += failed
         self.stats.skipped += skipped
     
+    def update_concurrency(self, host: str, limit: int):
+        """
+        Record the current adaptive concurrency limit for a host.
+        
+        Args:
+            host: Host name the limit applies to
+            limit: Concurrent requests currently allowed
+        """
+        previous = self.stats.concurrency_limits.get(host)
+        self.stats.concurrency_limits[host] = limit
+        if previous is not None and limit < previous:
+            self.log(f"Throttling {host}: concurrency {previous} → {limit}", "warning")
+    
     def log(self, message: str, level: str = "info"):
         """
         Log a message with appropriate styling.
@@ -353,6 +367,8 @@ class ProgressTracker:
             table.add_row("Success Rate", f"{self.stats.success_rate:.1f}%")
             table.add_row("Processing Rate", f"{self.stats.processing_rate:.2f} items/sec")
             table.add_row("Total Time", f"{elapsed:.1f} seconds")
+            if self.stats.concurrency_limits:
+                table.add_row("Concurrency Limits", self._format_limits())
             
             self.console.print(table)
         else:
@@ -367,8 +383,14 @@ class ProgressTracker:
             self._fallback_log(f"Success Rate: {self.stats.success_rate:.1f}%")
             self._fallback_log(f"Processing Rate: {self.stats.processing_rate:.2f} items/sec")
             self._fallback_log(f"Total Time: {elapsed:.1f} seconds")
+            if self.stats.concurrency_limits:
+                self._fallback_log(f"Concurrency Limits: {self._format_limits()}")
             self._fallback_log("="*50)
     
+    def _format_limits(self) -> str:
+        """Format per-host concurrency limits for display."""
+        return ", ".join(f"{host}: {limit}" for host, limit in self.stats.concurrency_limits.items())
+    
     def _fallback_log(self, message: str):
         """Fallback logging when Rich is not available."""
         print(message, flush=True)
@@ -0,0 +1,236 @@
+"""
+Sitemap Reader - Browser-free site enumeration from XML sitemaps
+
+Sitemaps are the cheapest way to list every page of a site. Sitemap
+locations are taken from robots.txt ``Sitemap:`` lines (falling back to
+/sitemap.xml), sitemap indexes are followed, and gzipped sitemaps are
+inflated on the fly. Each file is streamed over the shared HTTP pool into
+an incremental XML parser, so even very large sitemaps are never held in
+memory, and every URL is reported with its ``lastmod`` date.
+"""
+
+import asyncio
+import logging
+import xml.etree.ElementTree as ET
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urldefrag, urljoin, urlparse
+
+import aiohttp
+
+from .tiered_fetcher import TieredFetcher
+
+logger = logging.getLogger(__name__)
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+
+def parse_lastmod(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a W3C datetime from a sitemap.
+
+    Returns:
+        Timezone-aware datetime (UTC when the value has no zone), or None
+        if the value is missing or malformed
+    """
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def path_depth(url: str, root_url: str) -> int:
+    """Number of path segments a URL lies below the root URL's path."""
+    root_parts = [p for p in urlparse(root_url).path.split('/') if p]
+    parts = [p for p in urlparse(url).path.split('/') if p]
+    if parts[:len(root_parts)] == root_parts:
+        return len(parts) - len(root_parts)
+    return len(parts)
+
+
+@dataclass
+class SitemapEntry:
+    """A page listed in a sitemap."""
+    url: str
+    lastmod: Optional[datetime] = None
+
+
+class SitemapReader:
+    """
+    Streams page URLs and lastmod dates from a site's sitemaps.
+
+    Args:
+        base_url: Site URL; robots.txt and /sitemap.xml are looked up on its host
+        fetcher: TieredFetcher whose connection pool is shared (optional)
+        sitemap_urls: Explicit sitemap locations, skipping robots.txt discovery
+        max_sitemaps: Maximum sitemap files read, including nested ones (default: 100)
+    """
+
+    CHUNK_SIZE = 65536
+
+    def __init__(
+        self,
+        base_url: str,
+        fetcher: Optional[TieredFetcher] = None,
+        sitemap_urls: Optional[List[str]] = None,
+        max_sitemaps: int = 100
+    ):
+        self.base_url = base_url
+        self.sitemap_urls = sitemap_urls
+        self.max_sitemaps = max_sitemaps
+
+        self._owns_fetcher = fetcher is None
+        self.fetcher = fetcher or TieredFetcher()
+
+        self.stats: Dict[str, int] = {
+            'sitemaps': 0,
+            'urls': 0
+        }
+
+    def _normalize_url(self, url: str) -> str:
+        """Remove fragment and trailing slash from URL."""
+        url = urldefrag(url)[0]
+        if url.endswith('/'):
+            url = url[:-1]
+        return url
+
+    async def _stream(self, url: str) -> AsyncIterator[bytes]:
+        """Yield the raw body of a successful response in chunks."""
+        session = await self.fetcher.get_session()
+        async with session.get(url) as response:
+            if response.status != 200:
+                return
+            async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                yield chunk
+
+    async def discover(self) -> List[str]:
+        """
+        Find sitemap locations.
+
+        Returns:
+            Sitemaps listed in robots.txt, or the conventional /sitemap.xml
+        """
+        if self.sitemap_urls:
+            return list(self.sitemap_urls)
+
+        robots_url = urljoin(self.base_url, '/robots.txt')
+        body = b""
+        try:
+            async for chunk in self._stream(robots_url):
+                body += chunk
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug(f"Could not read {robots_url}: {e}")
+
+        sitemaps = []
+        for line in body.decode('utf-8', errors='replace').splitlines():
+            key, _, value = line.partition(':')
+            if key.strip().lower() == 'sitemap' and value.strip():
+                sitemaps.append(urljoin(robots_url, value.strip()))
+
+        return sitemaps or [urljoin(self.base_url, '/sitemap.xml')]
+
+    async def parse(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[str, SitemapEntry]]:
+        """
+        Incrementally parse a (possibly gzipped) sitemap or sitemap index.
+
+        Yields:
+            Tuple of ('url', entry) for pages and ('sitemap', entry) for
+            nested sitemaps of an index
+        """
+        parser = ET.XMLPullParser(events=('start', 'end'))
+        decompressor = None
+        started = False
+        root = None
+        loc: Optional[str] = None
+        lastmod: Optional[datetime] = None
+        # Local names of the open elements; loc and lastmod only count as
+        # direct children of an entry, not e.g. <image:loc> inside one
+        open_tags: List[str] = []
+
+        def events():
+            nonlocal root, loc, lastmod
+            for event, elem in parser.read_events():
+                tag = elem.tag.rsplit('}', 1)[-1]
+                if event == 'start':
+                    if root is None:
+                        root = elem
+                    open_tags.append(tag)
+                    continue
+                open_tags.pop()
+                in_entry = bool(open_tags) and open_tags[-1] in ('url', 'sitemap')
+                if tag == 'loc' and in_entry:
+                    loc = (elem.text or "").strip()
+                elif tag == 'lastmod' and in_entry:
+                    lastmod = parse_lastmod(elem.text)
+                elif tag in ('url', 'sitemap'):
+                    if loc:
+                        yield tag, SitemapEntry(self._normalize_url(loc), lastmod)
+                    loc, lastmod = None, None
+                    # Drop finished entries so memory stays flat
+                    root.clear()
+
+        async for chunk in chunks:
+            if not started:
+                started = True
+                if chunk.startswith(_GZIP_MAGIC):
+                    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            parser.feed(decompressor.decompress(chunk) if decompressor else chunk)
+            for item in events():
+                yield item
+
+        if decompressor:
+            parser.feed(decompressor.flush())
+        if started:
+            parser.close()
+            for item in events():
+                yield item
+
+    async def entries(self) -> AsyncIterator[SitemapEntry]:
+        """Yield every page from all sitemaps, following sitemap indexes."""
+        pending = deque(await self.discover())
+        visited = set()
+
+        while pending and len(visited) < self.max_sitemaps:
+            sitemap_url = pending.popleft()
+            if sitemap_url in visited:
+                continue
+            visited.add(sitemap_url)
+            self.stats['sitemaps'] += 1
+
+            try:
+                async for kind, entry in self.parse(self._stream(sitemap_url)):
+                    if kind == 'sitemap':
+                        pending.append(entry.url)
+                    else:
+                        self.stats['urls'] += 1
+                        yield entry
+            except (aiohttp.ClientError, asyncio.TimeoutError, ET.ParseError, zlib.error) as e:
+                logger.warning(f"Could not read sitemap {sitemap_url}: {e}")
+
+    async def read(self) -> Dict[str, Optional[datetime]]:
+        """
+        Collect all sitemap pages.
+
+        Returns:
+            Mapping of normalized URL to its lastmod date (None if not given),
+            in sitemap order
+        """
+        pages: Dict[str, Optional[datetime]] = {}
+        async for entry in self.entries():
+            if entry.url not in pages or entry.lastmod is not None:
+                pages[entry.url] = entry.lastmod
+        return pages
+
+    async def close(self):
+        """Close the HTTP session if this reader created it."""
+        if self._owns_fetcher:
+            await self.fetcher.close()
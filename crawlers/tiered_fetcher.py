@@ -0,0 +1,248 @@
+"""
+Tiered Fetcher - Plain HTTP first, headless browser only when needed
+
+Most documentation sites are server-rendered and do not need JavaScript to
+show their content. The fetcher downloads pages with a pooled aiohttp session
+and converts them to markdown directly, and reports when a page looks like a
+JavaScript shell so the caller can escalate to a crawl4ai browser render.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from urllib.parse import urljoin, urlparse
+
+import aiohttp
+from bs4 import BeautifulSoup
+from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+
+
+@dataclass
+class StaticPage:
+    """
+    A page fetched over plain HTTP.
+
+    Mirrors the crawl4ai CrawlResult attributes the crawlers read, so callers
+    can handle HTTP and browser results the same way.
+    """
+    url: str
+    html: str
+    markdown: str
+    metadata: Dict[str, str] = field(default_factory=dict)
+    links: Dict[str, List[Dict[str, str]]] = field(default_factory=dict)
+    status_code: int = 200
+    success: bool = True
+    error_message: Optional[str] = None
+
+
+@dataclass
+class HttpResponse:
+    """Status, headers and HTML body of a plain HTTP request."""
+    url: str
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    html: Optional[str] = None
+
+
+class TieredFetcher:
+    """
+    Fetches pages over HTTP and decides whether they need a browser.
+
+    Args:
+        max_connections: Size of the shared HTTP connection pool (default: 20)
+        timeout: Total request timeout in seconds (default: 15.0)
+        min_text_length: Visible text below this length means the page is
+            probably rendered client-side (default: 200)
+        controller: AdaptiveConcurrencyController informed of every response
+            status, e.g. 429s with Retry-After (optional)
+    """
+
+    # Attribute/markup hints left behind by client-side rendered apps
+    SPA_MARKERS = [
+        'ng-version',
+        'data-reactroot',
+        'id="app"',
+        'id="root"',
+        'id="__next"',
+        'id="___gatsby"',
+        '<app-root',
+    ]
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        timeout: float = 15.0,
+        min_text_length: int = 200,
+        controller: Optional[Any] = None
+    ):
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.min_text_length = min_text_length
+        self.controller = controller
+
+        self.markdown_generator = DefaultMarkdownGenerator(options={"body_width": 0})
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Per-tier hit counts for crawl statistics
+        self.stats: Dict[str, int] = {
+            'http': 0,
+            'browser': 0
+        }
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={'User-Agent': 'Mozilla/5.0 (compatible; FastOrderedCrawler)'}
+            )
+        return self._session
+
+    async def fetch_response(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[HttpResponse]:
+        """
+        Send a GET request, optionally conditional.
+
+        Args:
+            url: URL to request
+            headers: Extra request headers, e.g. If-None-Match
+
+        Returns:
+            HttpResponse whose ``html`` is set only for successful HTML pages,
+            or None if the request failed
+        """
+        session = await self.get_session()
+        try:
+            async with session.get(url, headers=headers) as response:
+                if self.controller:
+                    self.controller.observe(url, response.status, response.headers)
+                result = HttpResponse(url=url, status=response.status, headers=dict(response.headers))
+                if response.status == 200 and 'html' in response.headers.get('Content-Type', ''):
+                    result.html = await response.text(errors='replace')
+                return result
+        except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError):
+            return None
+
+    async def fetch_html(self, url: str) -> Optional[str]:
+        """
+        Download a page over HTTP.
+
+        Returns:
+            The HTML body, or None if the response is not a successful HTML page
+        """
+        response = await self.fetch_response(url)
+        return response.html if response is not None else None
+
+    def needs_browser(self, soup: BeautifulSoup) -> Optional[str]:
+        """
+        Decide whether a statically fetched page needs a JavaScript render.
+
+        Must be called before scripts are stripped from the soup.
+
+        Returns:
+            A short reason when the page should be escalated, otherwise None
+        """
+        noscript_text = " ".join(
+            tag.get_text(" ", strip=True) for tag in soup.find_all('noscript')
+        ).lower()
+
+        for tag in soup(['script', 'style', 'noscript', 'template']):
+            tag.decompose()
+
+        container = soup.select_one('main, article, [role="main"]') or soup.body or soup
+        text_length = len(container.get_text(" ", strip=True))
+
+        if text_length >= self.min_text_length:
+            return None
+
+        if 'javascript' in noscript_text:
+            return "noscript shell"
+
+        html = str(soup)
+        for marker in self.SPA_MARKERS:
+            if marker in html:
+                return f"SPA marker {marker}"
+
+        return "empty main content"
+
+    def _extract_links(self, soup: BeautifulSoup, url: str) -> Dict[str, List[Dict[str, str]]]:
+        """Split anchors into internal and external links like crawl4ai does."""
+        domain = urlparse(url).netloc
+        links: Dict[str, List[Dict[str, str]]] = {'internal': [], 'external': []}
+        seen = set()
+
+        for anchor in soup.find_all('a', href=True):
+            href = anchor['href'].strip()
+            if not href or href.startswith(('#', 'mailto:', 'javascript:', 'tel:')):
+                continue
+
+            absolute = urljoin(url, href)
+            if absolute in seen:
+                continue
+            seen.add(absolute)
+
+            kind = 'internal' if urlparse(absolute).netloc == domain else 'external'
+            links[kind].append({'href': absolute, 'text': anchor.get_text(" ", strip=True)})
+
+        return links
+
+    def _extract_metadata(self, soup: BeautifulSoup) -> Dict[str, str]:
+        """Read the title and meta description."""
+        metadata = {}
+        if soup.title and soup.title.string:
+            metadata['title'] = soup.title.string.strip()
+        description = soup.find('meta', attrs={'name': 'description'})
+        if description and description.get('content'):
+            metadata['description'] = description['content'].strip()
+        return metadata
+
+    async def fetch(self, url: str, html: Optional[str] = None) -> Optional[StaticPage]:
+        """
+        Try to serve a page from the HTTP tier.
+
+        Args:
+            url: Page URL
+            html: Body already downloaded for this URL, e.g. while revalidating
+                a cached page (optional)
+
+        Returns:
+            StaticPage when plain HTTP was enough, or None when the caller
+            should render the page in a browser instead
+        """
+        if html is None:
+            html = await self.fetch_html(url)
+        if html is None:
+            return None
+
+        soup = BeautifulSoup(html, "html.parser")
+        if self.needs_browser(soup):
+            return None
+
+        body = soup.body or soup
+        markdown = self.markdown_generator.generate_markdown(
+            input_html=str(body),
+            base_url=url,
+            citations=False
+        ).raw_markdown
+
+        return StaticPage(
+            url=url,
+            html=html,
+            markdown=markdown,
+            metadata=self._extract_metadata(soup),
+            links=self._extract_links(soup, url)
+        )
+
+    def record_hit(self, tier: str, count: int = 1):
+        """Count pages served by the given tier ('http' or 'browser')."""
+        self.stats[tier] = self.stats.get(tier, 0) + count
+
+    async def close(self):
+        """Close the pooled HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
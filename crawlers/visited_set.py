@@ -0,0 +1,261 @@
+"""
+Visited Set - Pluggable stores for URLs a crawl has already seen
+
+The exact backend is a set of interned URL strings: fast, but every URL
+costs well over a hundred bytes. The compact backend keeps only a scalable
+Bloom filter over 64-bit URL hashes in memory; most checks are new URLs and
+are answered by the filter alone, while the rare "maybe" is confirmed
+against an exact SQLite store on disk. That brings the memory cost down to a
+couple of bytes per URL for million-page crawls.
+"""
+
+import hashlib
+import math
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+VISITED_BACKENDS = ('exact', 'compact')
+
+
+def url_hash(url: str) -> int:
+    """Stable unsigned 64-bit hash of a URL."""
+    return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class BloomFilter:
+    """
+    Fixed-capacity Bloom filter over 64-bit keys.
+
+    Bit positions come from double hashing the two 32-bit halves of the key.
+
+    Args:
+        capacity: Keys the filter holds at the target error rate
+        error_rate: False-positive probability at capacity
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: int):
+        low = key & 0xFFFFFFFF
+        high = (key >> 32) | 1
+        for i in range(self.num_hashes):
+            yield (low + i * high) % self.num_bits
+
+    def add(self, key: int):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: int) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that grows by adding larger, stricter filters.
+
+    Each new filter has ``growth`` times the capacity and ``tightening``
+    times the error rate of the previous one, so the compound false-positive
+    rate stays below ``error_rate`` however many keys are added.
+
+    Args:
+        initial_capacity: Keys held by the first filter (default: 65536)
+        error_rate: Upper bound on the overall false-positive rate (default: 0.001)
+        growth: Capacity factor between filters (default: 2)
+        tightening: Error-rate factor between filters (default: 0.5)
+    """
+
+    def __init__(
+        self,
+        initial_capacity: int = 1 << 16,
+        error_rate: float = 0.001,
+        growth: int = 2,
+        tightening: float = 0.5
+    ):
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.growth = growth
+        self.tightening = tightening
+        self.filters: List[BloomFilter] = [
+            BloomFilter(initial_capacity, error_rate * (1 - tightening))
+        ]
+
+    def add(self, key: int):
+        current = self.filters[-1]
+        if current.count >= current.capacity:
+            current = BloomFilter(current.capacity * self.growth, current.error_rate * self.tightening)
+            self.filters.append(current)
+        current.add(key)
+
+    def __contains__(self, key: int) -> bool:
+        return any(key in bloom for bloom in self.filters)
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(len(bloom.bits) for bloom in self.filters)
+
+
+class ExactVisitedSet:
+    """In-memory set of interned URL strings."""
+
+    backend = 'exact'
+
+    def __init__(self):
+        self._urls = set()
+        self._string_bytes = 0
+
+    def add(self, url: str):
+        if url not in self._urls:
+            self._urls.add(sys.intern(url))
+            self._string_bytes += sys.getsizeof(url)
+
+    def update(self, urls: Iterable[str]):
+        for url in urls:
+            self.add(url)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._urls
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def __iter__(self):
+        return iter(self._urls)
+
+    @property
+    def memory_bytes(self) -> int:
+        return sys.getsizeof(self._urls) + self._string_bytes
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class CompactVisitedSet:
+    """
+    Bloom filter in memory, exact URL store on disk.
+
+    Args:
+        store_path: SQLite file for the exact store; replaced if it exists
+        initial_capacity: Keys held by the first Bloom filter (default: 65536)
+        error_rate: Bloom false-positive rate, i.e. the share of unseen URLs
+            that need a disk lookup (default: 0.001)
+        commit_every: Inserts between commits (default: 10000)
+    """
+
+    backend = 'compact'
+
+    def __init__(
+        self,
+        store_path: Union[str, Path],
+        initial_capacity: int = 1 << 16,
+        error_rate: float = 0.001,
+        commit_every: int = 10000
+    ):
+        self.store_path = Path(store_path)
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        self.store_path.unlink(missing_ok=True)
+        self.commit_every = commit_every
+
+        self.bloom = ScalableBloomFilter(initial_capacity, error_rate)
+        self._db = sqlite3.connect(str(self.store_path))
+        self._db.execute("PRAGMA journal_mode=OFF")
+        self._db.execute("PRAGMA synchronous=OFF")
+        self._db.execute(
+            "CREATE TABLE visited (hash INTEGER NOT NULL, url TEXT NOT NULL, "
+            "PRIMARY KEY (hash, url)) WITHOUT ROWID"
+        )
+        self._count = 0
+        self._uncommitted = 0
+
+        # Bloom "maybe" answers that the disk store confirmed or refuted
+        self.stats = {'disk_lookups': 0, 'false_positives': 0}
+
+    @staticmethod
+    def _key(url: str) -> int:
+        # SQLite integers are signed
+        key = url_hash(url)
+        return key - (1 << 64) if key >= 1 << 63 else key
+
+    def add(self, url: str):
+        if url in self:
+            return
+        key = self._key(url)
+        self.bloom.add(key & 0xFFFFFFFFFFFFFFFF)
+        self._db.execute("INSERT INTO visited VALUES (?, ?)", (key, url))
+        self._count += 1
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self.flush()
+
+    def update(self, urls: Iterable[str]):
+        for url in urls:
+            self.add(url)
+
+    def __contains__(self, url: str) -> bool:
+        key = self._key(url)
+        if key & 0xFFFFFFFFFFFFFFFF not in self.bloom:
+            return False
+        self.stats['disk_lookups'] += 1
+        found = self._db.execute(
+            "SELECT 1 FROM visited WHERE hash = ? AND url = ?", (key, url)
+        ).fetchone() is not None
+        if not found:
+            self.stats['false_positives'] += 1
+        return found
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        return (url for (url,) in self._db.execute("SELECT url FROM visited"))
+
+    @property
+    def memory_bytes(self) -> int:
+        return self.bloom.memory_bytes
+
+    def flush(self):
+        """Commit pending inserts."""
+        self._db.commit()
+        self._uncommitted = 0
+
+    def close(self):
+        """Commit and close the store."""
+        self.flush()
+        self._db.close()
+
+
+def create_visited_set(backend: str = 'exact', store_path: Optional[Union[str, Path]] = None):
+    """
+    Create a visited-URL store.
+
+    Args:
+        backend: 'exact' (in-memory set) or 'compact' (Bloom filter plus
+            on-disk store)
+        store_path: SQLite file for the compact backend
+
+    Returns:
+        ExactVisitedSet or CompactVisitedSet
+    """
+    if backend == 'exact':
+        return ExactVisitedSet()
+    if backend == 'compact':
+        if store_path is None:
+            raise ValueError("The compact visited set needs a store_path")
+        return CompactVisitedSet(store_path)
+    raise ValueError(f"Unknown visited backend {backend!r}; expected one of {', '.join(VISITED_BACKENDS)}")
+
+
+def bytes_per_url(visited) -> float:
+    """Memory the store uses per URL it holds."""
+    return visited.memory_bytes / len(visited) if len(visited) else 0.0
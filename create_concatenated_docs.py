@@ -3,9 +3,13 @@
 Script to concatenate all crawled Claude Code documentation pages into a single markdown file.
 """
 
+import argparse
+import io
+import json
 import os
 from pathlib import Path
 from datetime import datetime
+from typing import Iterator, Tuple
 import re
 
 def extract_title_from_content(content: str) -> str:
@@ -35,13 +39,86 @@ def remove_frontmatter(content: str) -> str:
             return content[frontmatter_end + 3:].strip()
     return content.strip()
 
-def create_concatenated_docs(content_dir: str, output_file: str = "claude_code_complete_documentation.md"):
+def scan_markdown_file(filepath: Path) -> Tuple[str, str, int]:
+    """
+    Read a page's title and URL without reading its body.
+    
+    The title comes from the frontmatter; files without one are scanned
+    only up to their first H1.
+    
+    Returns:
+        Tuple of (title, url, byte offset of the body)
+    """
+    title = ""
+    url = ""
+    body_offset = 0
+    with open(filepath, 'rb') as f:
+        if f.readline().startswith(b'---'):
+            for line in f:
+                if line.startswith(b'---'):
+                    body_offset = f.tell()
+                    break
+                key, _, value = line.decode('utf-8').partition(':')
+                value = value.strip()
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+                    value = value[1:-1]
+                if key == 'url':
+                    url = value
+                elif key == 'title':
+                    title = value
+            else:
+                # Unterminated frontmatter is part of the body
+                url = title = ""
+        
+        f.seek(body_offset)
+        if not title:
+            for line in f:
+                if line.startswith(b'# '):
+                    title = line[2:].decode('utf-8').strip()
+                    break
+    return title or "Untitled", url, body_offset
+
+
+def iter_body(filepath: Path, body_offset: int, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+    """Stream a page body from ``body_offset``, stripped of surrounding whitespace."""
+    with open(filepath, 'rb') as raw:
+        raw.seek(body_offset)
+        # Universal newlines, like reading the file in text mode
+        f = io.TextIOWrapper(raw, encoding='utf-8')
+        started = False
+        # Whitespace held back until more text follows it
+        pending = ""
+        for chunk in iter(lambda: f.read(chunk_size), ''):
+            if not started:
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+                started = True
+            stripped = chunk.rstrip()
+            if stripped:
+                yield (pending + stripped).encode('utf-8')
+                pending = chunk[len(stripped):]
+            else:
+                pending += chunk
+
+
+def create_concatenated_docs(
+    content_dir: str,
+    output_file: str = "claude_code_complete_documentation.md",
+    write_index: bool = False
+):
     """
     Create a concatenated markdown file from all crawled documentation pages.
     
+    Each file is read once: titles and URLs come from a frontmatter scan
+    that also builds the table of contents, and bodies are then streamed
+    straight into the output.
+    
     Args:
         content_dir: Directory containing the crawled markdown files
         output_file: Output file name for the concatenated documentation
+        write_index: Also write ``<output_file>.index.json`` with the byte
+            offset and length of every page in the output, for random access
     """
     content_path = Path(content_dir)
     
@@ -70,8 +147,12 @@ def create_concatenated_docs(content_dir: str, output_file: str = "claude_code_c
     
     # Sort other files alphabetically by filename
     other_files.sort(key=lambda x: x.name)
+    ordered_files = ([main_file] if main_file else []) + other_files
+    
+    # Scan frontmatter once for the TOC and the body offsets
+    pages = [(file, *scan_markdown_file(file)) for file in ordered_files]
     
-    # Prepare the concatenated content
+    # Prepare the header and table of contents
     concatenated_content = []
     
     # Add header
@@ -88,67 +169,46 @@ This document contains the complete Claude Code documentation concatenated from
 """
     concatenated_content.append(header)
     
-    # Add table of contents
-    toc_content = ["## Table of Contents\n"]
-    
-    # Process main file first
-    if main_file:
-        with open(main_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        title = extract_title_from_content(remove_frontmatter(content))
-        url = extract_url_from_frontmatter(content)
-        anchor = re.sub(r'[^a-zA-Z0-9\s]', '', title).lower().replace(' ', '-')
-        toc_content.append(f"1. [{title}](#{anchor})")
-        if url:
-            toc_content.append(f"   - Source: {url}")
-        toc_content.append("")
-    
-    # Add other files to TOC
-    for i, file in enumerate(other_files, start=2):
-        with open(file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        title = extract_title_from_content(remove_frontmatter(content))
-        url = extract_url_from_frontmatter(content)
+    # Add table of contents; the main page is always entry 1
+    concatenated_content.append("## Table of Contents\n")
+    first_number = 1 if main_file else 2
+    for i, (file, title, url, _) in enumerate(pages, start=first_number):
         anchor = re.sub(r'[^a-zA-Z0-9\s]', '', title).lower().replace(' ', '-')
-        toc_content.append(f"{i}. [{title}](#{anchor})")
+        concatenated_content.append(f"{i}. [{title}](#{anchor})")
         if url:
-            toc_content.append(f"   - Source: {url}")
-        toc_content.append("")
+            concatenated_content.append(f"   - Source: {url}")
+        concatenated_content.append("")
     
-    concatenated_content.extend(toc_content)
     concatenated_content.append("\n---\n")
     
-    # Process main file content
-    if main_file:
-        print(f"📄 Processing main file: {main_file.name}")
-        with open(main_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        clean_content = remove_frontmatter(content)
-        url = extract_url_from_frontmatter(content)
-        
-        concatenated_content.append(f"\n<!-- Source: {url} -->\n")
-        concatenated_content.append(clean_content)
-        concatenated_content.append("\n\n---\n")
-    
-    # Process other files
-    for file in other_files:
-        print(f"📄 Processing: {file.name}")
-        
-        with open(file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        clean_content = remove_frontmatter(content)
-        url = extract_url_from_frontmatter(content)
-        
-        concatenated_content.append(f"\n<!-- Source: {url} -->\n")
-        concatenated_content.append(clean_content)
-        concatenated_content.append("\n\n---\n")
-    
-    # Write the concatenated file
+    # Stream page bodies into the output
     output_path = Path(output_file)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(concatenated_content))
+    index = []
+    with open(output_path, 'wb') as f:
+        f.write('\n'.join(concatenated_content).encode('utf-8'))
+        for file, title, url, body_offset in pages:
+            if file is main_file:
+                print(f"📄 Processing main file: {file.name}")
+            else:
+                print(f"📄 Processing: {file.name}")
+            
+            f.write(f"\n\n<!-- Source: {url} -->\n\n".encode('utf-8'))
+            offset = f.tell()
+            for chunk in iter_body(file, body_offset):
+                f.write(chunk)
+            index.append({
+                'file': file.name,
+                'title': title,
+                'url': url,
+                'offset': offset,
+                'length': f.tell() - offset
+            })
+            f.write(b"\n\n\n---\n")
+    
+    if write_index:
+        index_path = output_path.with_name(output_path.name + ".index.json")
+        index_path.write_text(json.dumps({'output': output_path.name, 'pages': index}, indent=2), encoding='utf-8')
+        print(f"🗂️  Offset index: {index_path.absolute()}")
     
     print(f"\n✅ Concatenated documentation created!")
     print(f"📁 Output file: {output_path.absolute()}")
@@ -156,8 +216,11 @@ This document contains the complete Claude Code documentation concatenated from
     print(f"📏 File size: {output_path.stat().st_size / 1024:.1f} KB")
 
 if __name__ == "__main__":
-    # Use the latest crawl results
-    content_directory = "claude_docs_final/content"
-    output_filename = "claude_code_complete_documentation.md"
-    
-    create_concatenated_docs(content_directory, output_filename)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Concatenate crawled documentation pages into one markdown file")
+    # Default to the latest crawl results
+    parser.add_argument("content_dir", nargs="?", default="claude_docs_final/content")
+    parser.add_argument("output_file", nargs="?", default="claude_code_complete_documentation.md")
+    parser.add_argument("--index", action="store_true", help="Write a sidecar JSON index of page byte offsets")
+    args = parser.parse_args()
+    
+    create_concatenated_docs(args.content_dir, args.output_file, write_index=args.index)
\ No newline at end of file
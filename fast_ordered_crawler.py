@@ -3,14 +3,14 @@
 Fast Ordered Crawler - Optimized version based on performance analysis
 
 This implementation incorporates performance optimizations from existing scraping examples:
-1. RecursiveUrlLoader for faster URL discovery (from smart_content_scraper.py)
+1. Single-pass crawl frontier: links found on crawled pages feed the crawl
 2. Concurrent processing with proper resource management
 3. CSS selector optimization for main content extraction
 4. Simplified extraction strategy focused on speed
 5. Progress tracking with better performance metrics
 
 Key optimizations:
-- Uses RecursiveUrlLoader instead of custom navigation extraction
+- Priority-queue frontier with true link depth and parent per URL
 - Concurrent processing with configurable limits
 - CSS selector-based content extraction
 - Streamlined markdown generation
@@ -20,18 +20,29 @@ Key optimizations:
 import asyncio
 import os
 import re
-from typing import List, Dict, Optional, Set
+from typing import AsyncIterator, List, Dict, Optional, Set, Tuple, Union
 from urllib.parse import urlparse, urljoin
 from pathlib import Path
 import logging
 from datetime import datetime
 import json
 
-from crawl4ai import AsyncWebCrawler, CrawlerRunConfig
+from crawl4ai import CrawlerRunConfig
 from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
-from langchain_community.document_loaders import RecursiveUrlLoader
 from bs4 import BeautifulSoup
-import requests
+
+from crawlers.browser_pool import BrowserPool
+from crawlers.tiered_fetcher import HttpResponse, TieredFetcher
+from crawlers.link_discovery import LinkDiscovery
+from crawlers.frontier import CrawlFrontier, FrontierEntry
+from crawlers.file_writer import FileWriter
+from crawlers.concurrency import AdaptiveConcurrencyController
+from crawlers.page_cache import PageCache
+from crawlers.crawl_journal import CrawlJournal
+from crawlers.dedup import DuplicateDetector
+from crawlers.boilerplate import BoilerplateStripper
+from crawlers.sitemap import SitemapReader, path_depth
+from crawlers.visited_set import bytes_per_url, create_visited_set
 
 # from progress_tracker import ProgressTracker
 
@@ -46,6 +57,9 @@ class SimpleProgressTracker:
         print(f"📊 {description}")
         return name
     
+    def update_concurrency(self, host: str, limit: int):
+        print(f"   Concurrency for {host}: {limit}")
+    
     def update_task(self, name: str, advance: int = 1, description: Optional[str] = None, **kwargs):
         if name in self.tasks:
             self.tasks[name]["current"] += advance
@@ -82,7 +96,18 @@ class FastOrderedCrawler:
         output_dir: str = "fast_crawl", 
         max_concurrent: int = 10,  # Increased from 1
         exclude_patterns: Optional[List[str]] = None,
-        show_progress: bool = True
+        show_progress: bool = True,
+        browser_pool_size: int = 2,
+        browser_recycle_after: int = 100,
+        extraction_mode: str = "fetch_once",
+        http_first: bool = False,
+        refresh: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        resume: bool = False,
+        dedup_threshold: Optional[float] = None,
+        boilerplate_threshold: Optional[float] = None,
+        use_sitemap: bool = False,
+        visited_backend: str = 'exact'
     ):
         """
         Initialize the fast crawler.
@@ -91,16 +116,43 @@ class FastOrderedCrawler:
             root_url: Starting URL for crawling
             max_depth: Maximum crawl depth
             output_dir: Output directory for results
-            max_concurrent: Maximum concurrent crawls (increased for speed)
+            max_concurrent: Maximum concurrent crawls (increased for speed); also
+                the ceiling for each host's adaptive concurrency limit
             exclude_patterns: URL patterns to exclude
             show_progress: Whether to show progress bars
+            browser_pool_size: Number of warm browsers shared by all page fetches
+            browser_recycle_after: Navigations before a pooled browser is replaced
+            extraction_mode: 'fetch_once' renders each page once and applies all
+                content selectors to that HTML; 'per_selector' re-crawls per selector
+            http_first: Try a plain HTTP fetch before rendering in a browser, and
+                only escalate pages that look like they need JavaScript
+            refresh: Page cache refresh policy ('conditional', 'always' or
+                'never'); None disables the page cache
+            cache_dir: Page cache location (default: <output_dir>/.page_cache)
+            resume: Rebuild the frontier and completed URLs from the crawl
+                journal in output_dir and skip work already done
+            dedup_threshold: Similarity (0-1) at which a page is saved only as
+                an alias of an earlier page; None disables duplicate detection
+            boilerplate_threshold: Fraction of pages (0-1) a block or link line must
+                appear on to be stripped as site chrome; None disables stripping
+            use_sitemap: Seed the frontier from the site's sitemaps; with the
+                page cache enabled, pages whose lastmod predates their cached
+                copy are reused without any request
+            visited_backend: 'exact' keeps processed and queued URLs as interned
+                strings in memory; 'compact' keeps Bloom filters in memory and
+                confirms hits against on-disk stores
         """
+        if extraction_mode not in ("fetch_once", "per_selector"):
+            raise ValueError(f"Unknown extraction mode: {extraction_mode}")
+        
         self.root_url = root_url
         self.max_depth = max_depth
         self.output_dir = Path(output_dir)
         self.max_concurrent = max_concurrent
         self.exclude_patterns = exclude_patterns or []
         self.show_progress = show_progress
+        self.extraction_mode = extraction_mode
+        self.http_first = http_first
         
         # Create output directories
         self.output_dir.mkdir(exist_ok=True)
@@ -118,8 +170,65 @@ class FastOrderedCrawler:
             'body'
         ]
         
+        # Converts selected HTML fragments in fetch_once mode
+        self.markdown_generator = DefaultMarkdownGenerator(options={"body_width": 0})
+        
+        # Warm browsers shared by every page fetch for the crawler's lifetime
+        self.browser_pool = BrowserPool(
+            size=browser_pool_size,
+            recycle_after=browser_recycle_after
+        )
+        
+        # Per-host AIMD limits below max_concurrent, driven by latency, errors and Retry-After
+        # Start at most at the configured concurrency and ramp up to it
+        self.concurrency = AdaptiveConcurrencyController(
+            initial_limit=min(max_concurrent, AdaptiveConcurrencyController.DEFAULT_INITIAL_LIMIT),
+            max_limit=max_concurrent,
+            progress_tracker=self.progress_tracker
+        )
+        
+        # HTTP-first tier; also counts which tier served each page
+        self.fetcher = TieredFetcher(
+            max_connections=max_concurrent * 2,
+            controller=self.concurrency
+        )
+        
+        # Saves markdown off the event loop; bounded so disk stalls apply back-pressure
+        self.writer = FileWriter(max_pending=max_concurrent * 4)
+        
+        # Markdown of unchanged pages is reused across runs
+        self.page_cache = None
+        if refresh is not None:
+            self.page_cache = PageCache(cache_dir or self.output_dir / ".page_cache", refresh=refresh)
+        
         # Processed URLs tracking
-        self.processed_urls: Set[str] = set()
+        self.visited_backend = visited_backend
+        self.processed_urls = create_visited_set(visited_backend, self.output_dir / ".processed.sqlite")
+        
+        # Near-duplicate pages are recorded as aliases instead of saved again
+        self.duplicates = DuplicateDetector(dedup_threshold) if dedup_threshold is not None else None
+        
+        # Navigation, breadcrumbs and other chrome repeated across pages are stripped
+        self.boilerplate = BoilerplateStripper(boilerplate_threshold) if boilerplate_threshold is not None else None
+        # Pages saved before the stripper had seen enough pages; stripped after the crawl
+        self.unstripped_files: List[Path] = []
+        
+        # Append-only progress journal; replayed on resume, restarted otherwise
+        self.resume = resume
+        self.journal = CrawlJournal(self.output_dir)
+        self.resume_state = self.journal.load() if resume else None
+        if self.resume_state:
+            self.processed_urls.update(self.resume_state.completed)
+            logger.info(f"Resuming: {len(self.resume_state.completed)} URLs already completed")
+        else:
+            self.journal.reset()
+        
+        # Internal links seen on each fetched page, consumed by the frontier
+        self.page_links: Dict[str, List[str]] = {}
+        
+        # Sitemap lastmod dates by URL, used to skip revalidating unchanged pages
+        self.use_sitemap = use_sitemap
+        self.sitemap_lastmod: Dict[str, Optional[datetime]] = {}
         
     def sanitize_filename(self, url: str, depth: int = 0) -> str:
         """Convert URL to a safe filename with depth prefix."""
@@ -136,145 +245,266 @@ class FastOrderedCrawler:
         filename = re.sub(r'[^a-zA-Z0-9-_]', '', filename)
         return f"{filename[:80]}.md"
     
-    def extract_urls_fast(self) -> List[str]:
+    def create_link_discovery(self, max_depth: Optional[int] = None) -> LinkDiscovery:
+        """Create a link discovery engine sharing this crawler's HTTP pool."""
+        return LinkDiscovery(
+            root_url=self.root_url,
+            max_depth=self.max_depth if max_depth is None else max_depth,
+            exclude_patterns=self.exclude_patterns,
+            fetcher=self.fetcher,
+            max_concurrent=self.max_concurrent
+        )
+    
+    async def discover_urls(self) -> AsyncIterator[Tuple[str, int]]:
         """
-        Extract URLs using hybrid approach: RecursiveUrlLoader + custom extraction.
-        Based on smart_content_scraper.py approach with fallback.
+        Stream URLs from asynchronous link discovery.
+        
+        Yields (url, depth) pairs as soon as they are found, so crawling can
+        start before discovery has finished.
         """
         if self.progress_tracker:
-            task_id = self.progress_tracker.create_task(
+            self.progress_tracker.create_task(
                 "url_discovery", 
-                "Discovering URLs with hybrid approach", 
+                "Discovering URLs", 
                 total=None
             )
         
-        all_urls = set()
+        logger.info(f"Discovering URLs from {self.root_url} with max_depth={self.max_depth}")
+        
+        found = 0
+        async for url, depth in self.create_link_discovery().discover():
+            found += 1
+            yield url, depth
         
+        if self.progress_tracker:
+            self.progress_tracker.update_task(
+                "url_discovery", 
+                description=f"Found {found} URLs",
+                total=found,
+                advance=found
+            )
+        logger.info(f"URL discovery found {found} URLs")
+    
+    async def _discover_all(self, max_depth: Optional[int] = None) -> List[str]:
+        """Run discovery to completion and release the HTTP pool afterwards."""
         try:
-            logger.info(f"Extracting URLs from {self.root_url} with max_depth={self.max_depth}")
-            
-            # Method 1: Try RecursiveUrlLoader first
-            try:
-                loader = RecursiveUrlLoader(
-                    url=self.root_url,
-                    max_depth=self.max_depth,
-                    exclude_dirs=self.exclude_patterns,
-                    extractor=lambda x: BeautifulSoup(x, "html.parser").get_text()
-                )
-                
-                docs = loader.load()
-                all_urls.add(self.root_url)
-                
-                for doc in docs:
-                    if hasattr(doc, 'metadata') and 'source' in doc.metadata:
-                        url = doc.metadata['source']
-                        if not any(pattern in url for pattern in self.exclude_patterns):
-                            all_urls.add(url)
-                            
-                logger.info(f"RecursiveUrlLoader found {len(all_urls)} URLs")
-                
-            except Exception as e:
-                logger.warning(f"RecursiveUrlLoader failed: {e}")
-            
-            # Method 2: If we only got 1 URL, use custom extraction
-            if len(all_urls) <= 1:
-                logger.info("Using custom link extraction as fallback...")
-                all_urls = self.extract_urls_custom()
-            
-            if self.progress_tracker:
-                self.progress_tracker.update_task(
-                    "url_discovery", 
-                    description=f"Found {len(all_urls)} URLs",
-                    total=len(all_urls),
-                    advance=len(all_urls)
-                )
-                
+            return await self.create_link_discovery(max_depth).discover_all()
+        finally:
+            await self.fetcher.close()
+    
+    def extract_urls_fast(self) -> List[str]:
+        """
+        Discover all URLs up to max_depth before returning.
+        
+        Blocking convenience wrapper for use outside an event loop; crawl()
+        streams from discover_urls() instead.
+        """
+        try:
+            return asyncio.run(self._discover_all())
         except Exception as e:
             logger.error(f"Error extracting URLs: {e}")
-            all_urls.add(self.root_url)
-        
-        discovered_urls = list(all_urls)
-        logger.info(f"Hybrid URL discovery found {len(discovered_urls)} URLs")
-        return discovered_urls
+            return [self.root_url]
     
     def extract_urls_custom(self) -> Set[str]:
-        """Custom URL extraction using requests + BeautifulSoup."""
-        all_urls = set()
-        all_urls.add(self.root_url)
-        
+        """Extract the in-scope links found on the root page only."""
         try:
-            # Get the main page
-            response = requests.get(self.root_url, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Extract links from navigation and content areas
-                links = soup.find_all('a', href=True)
-                
-                for link in links:
-                    href = link['href']
-                    
-                    # Convert relative URLs to absolute
-                    if href.startswith('/'):
-                        full_url = f"https://docs.anthropic.com{href}"
-                    elif href.startswith('http'):
-                        full_url = href
-                    else:
-                        continue
-                    
-                    # Filter for relevant URLs
-                    if (full_url.startswith('https://docs.anthropic.com/en/docs/claude-code/') and 
-                        full_url != self.root_url and
-                        not any(pattern in full_url for pattern in self.exclude_patterns)):
-                        all_urls.add(full_url)
-                        
-                logger.info(f"Custom extraction found {len(all_urls)} URLs")
-                
+            return set(asyncio.run(self._discover_all(max_depth=1)))
         except Exception as e:
             logger.error(f"Custom URL extraction failed: {e}")
-        
-        return all_urls
+            return {self.root_url}
     
     async def crawl_with_optimized_selector(self, url: str, depth: int = 0) -> Optional[str]:
         """
         Crawl URL with optimized CSS selectors for main content.
         Based on approach from smart_content_scraper.py.
+        
+        In ``fetch_once`` mode the page is rendered a single time and the
+        selector cascade runs against the cached HTML; ``per_selector`` mode
+        re-crawls the page once per selector. With ``http_first`` enabled,
+        static pages are served over plain HTTP without a browser. Requests
+        to each host are limited by the adaptive concurrency controller.
+        With the page cache enabled, unchanged pages reuse cached markdown.
         """
         try:
-            # Try each selector until we find content
-            for selector in self.content_selectors:
-                config = CrawlerRunConfig(
-                    css_selector=selector,
-                    markdown_generator=DefaultMarkdownGenerator(
-                        options={"body_width": 0}  # No text wrapping for speed
-                    )
-                )
+            async with self.concurrency.slot(url):
+                cached, response = await self._check_cache(url)
+                if cached is not None:
+                    self.fetcher.record_hit('cache')
+                    return cached
+                
+                content = None
+                tier = 'http'
+                if self.http_first:
+                    content = await self._crawl_http(url, response.html if response else None)
                 
-                async with AsyncWebCrawler() as crawler:
-                    result = await crawler.arun(url, config=config)
+                if not content:
+                    tier = 'browser'
+                    async with self.browser_pool.acquire() as browser:
+                        if self.extraction_mode == "fetch_once":
+                            content = await self._crawl_fetch_once(browser, url)
+                        else:
+                            content = await self._crawl_per_selector(browser, url)
+            
+            if content:
+                self.fetcher.record_hit(tier)
+                if self.page_cache:
+                    self.page_cache.store(url, content, response, links=self.page_links.get(url))
+            return content
                     
-                    if result.success and result.markdown and len(result.markdown.strip()) > 100:
-                        # Found good content, return it
-                        return result.markdown
+        except Exception as e:
+            logger.error(f"Error crawling {url}: {e}")
             
-            # If no selector worked, try without selector
+        return None
+    
+    async def _check_cache(self, url: str) -> Tuple[Optional[str], Optional[HttpResponse]]:
+        """
+        Revalidate a cached page with a conditional GET.
+        
+        Returns:
+            Tuple of (cached markdown if the page is unchanged, the
+            revalidation response to reuse and cache on a miss)
+        """
+        if not self.page_cache:
+            return None, None
+        
+        entry = self.page_cache.lookup(url)
+        response = None
+        if not self.page_cache.serves_without_request(entry, self.sitemap_lastmod.get(url)):
+            response = await self.fetcher.fetch_response(url, self.page_cache.request_headers(entry))
+            if not self.page_cache.is_unchanged(entry, response):
+                self.page_cache.stats['misses'] += 1
+                return None, response
+        
+        self.page_cache.touch(entry, response)
+        self.page_links[url] = list(entry.links)
+        return entry.markdown, response
+    
+    def _record_links(self, url: str, result):
+        """Remember the internal links of a fetched page for the frontier."""
+        links = getattr(result, 'links', None)
+        if not isinstance(links, dict):
+            return
+        self.page_links[url] = [
+            link['href'] for link in links.get('internal', [])
+            if isinstance(link, dict) and link.get('href')
+        ]
+    
+    async def _crawl_http(self, url: str, html: Optional[str] = None) -> Optional[str]:
+        """Extract content over plain HTTP, or None if the page needs a browser."""
+        page = await self.fetcher.fetch(url, html)
+        if page is None:
+            return None
+        self._record_links(url, page)
+        return self.select_main_content(page.html, url) or page.markdown
+    
+    async def _crawl_fetch_once(self, browser, url: str) -> Optional[str]:
+        """Render the page once and evaluate every selector against its HTML."""
+        config = CrawlerRunConfig(
+            markdown_generator=DefaultMarkdownGenerator(
+                options={"body_width": 0}
+            )
+        )
+        
+        result = await browser.arun(url, config=config)
+        self.concurrency.observe(url, result.status_code, result.response_headers)
+        if not result.success:
+            return None
+        self._record_links(url, result)
+        
+        if result.html:
+            content = self.select_main_content(result.html, url)
+            if content:
+                return content
+        
+        # No selector matched enough text - fall back to the full page
+        if result.markdown:
+            return result.markdown
+        return None
+    
+    async def _crawl_per_selector(self, browser, url: str) -> Optional[str]:
+        """Re-crawl the page with each selector until one yields content."""
+        # Try each selector until we find content
+        for selector in self.content_selectors:
             config = CrawlerRunConfig(
+                css_selector=selector,
                 markdown_generator=DefaultMarkdownGenerator(
-                    options={"body_width": 0}
+                    options={"body_width": 0}  # No text wrapping for speed
                 )
             )
             
-            async with AsyncWebCrawler() as crawler:
-                result = await crawler.arun(url, config=config)
-                if result.success and result.markdown:
-                    return result.markdown
-                    
-        except Exception as e:
-            logger.error(f"Error crawling {url}: {e}")
+            result = await browser.arun(url, config=config)
+            self.concurrency.observe(url, result.status_code, result.response_headers)
             
+            if result.success:
+                self._record_links(url, result)
+            
+            if result.success and result.markdown and len(result.markdown.strip()) > 100:
+                # Found good content, return it
+                return result.markdown
+        
+        # If no selector worked, try without selector
+        config = CrawlerRunConfig(
+            markdown_generator=DefaultMarkdownGenerator(
+                options={"body_width": 0}
+            )
+        )
+        
+        result = await browser.arun(url, config=config)
+        if result.success:
+            self._record_links(url, result)
+        if result.success and result.markdown:
+            return result.markdown
         return None
     
-    async def process_url(self, url: str, depth: int, semaphore: asyncio.Semaphore) -> bool:
+    def select_main_content(self, html: str, url: str) -> Optional[str]:
+        """
+        Run the content selector cascade against already-rendered HTML.
+        
+        Applies the same acceptance rule as per-selector crawling: the first
+        selector whose markdown is longer than 100 characters wins.
+        
+        Args:
+            html: Rendered page HTML
+            url: Page URL, used to resolve relative links
+        
+        Returns:
+            Markdown for the first accepted selector, or None
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        for tag in soup(['script', 'style', 'noscript', 'template']):
+            tag.decompose()
+        
+        for selector in self.content_selectors:
+            elements = soup.select(selector)
+            
+            # Drop matches nested inside another match to avoid duplicate text
+            matched = set(map(id, elements))
+            elements = [
+                el for el in elements
+                if not any(id(parent) in matched for parent in el.parents)
+            ]
+            if not elements:
+                continue
+            
+            fragment = "\n".join(str(el) for el in elements)
+            markdown = self.markdown_generator.generate_markdown(
+                input_html=fragment,
+                base_url=url,
+                citations=False
+            ).raw_markdown
+            
+            if markdown and len(markdown.strip()) > 100:
+                return markdown
+        
+        return None
+    
+    async def process_url(
+        self,
+        url: str,
+        depth: int,
+        semaphore: asyncio.Semaphore,
+        parent: Optional[str] = None
+    ) -> bool:
         """Process a single URL with concurrency control."""
         async with semaphore:
             if url in self.processed_urls:
@@ -283,6 +513,21 @@ class FastOrderedCrawler:
             try:
                 # Crawl the URL
                 content = await self.crawl_with_optimized_selector(url, depth)
+                unstripped = False
+                if content and self.boilerplate:
+                    content = self.boilerplate.strip(content)
+                    unstripped = self.boilerplate.warming_up
+                
+                canonical = self.duplicates.check(url, content) if self.duplicates and content else None
+                if canonical:
+                    # Journal the alias from the writer like a saved page, after
+                    # the page's links have reached the frontier
+                    self.processed_urls.add(url)
+                    await self.writer.defer(
+                        lambda: self.journal.record_done(url, None, depth=depth, alias_of=canonical)
+                    )
+                    logger.info(f"Duplicate of {canonical}: {url}")
+                    return True
                 
                 if content:
                     # Save content
@@ -290,29 +535,36 @@ class FastOrderedCrawler:
                     filepath = self.content_dir / filename
                     
                     # Create metadata
+                    parent_line = f"parent: {parent}\n" if parent else ""
                     metadata = f"""---
 url: {url}
 crawled_at: {datetime.now().isoformat()}
 depth: {depth}
-title: {self.extract_title_from_content(content)}
+{parent_line}title: {self.extract_title_from_content(content)}
 description: {self.extract_description_from_content(content)}
 ---
 
 """
                     
-                    # Save file
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(metadata + content)
-                    
+                    # Queue file for the background writer; journal it once on disk
                     self.processed_urls.add(url)
+                    await self.writer.write(
+                        filepath,
+                        metadata + content,
+                        on_written=lambda: self.journal.record_done(url, str(filepath), depth=depth)
+                    )
+                    if unstripped:
+                        self.unstripped_files.append(filepath)
                     logger.info(f"Saved: {filename}")
                     return True
                 else:
                     logger.warning(f"No content extracted from {url}")
+                    self.journal.record_failed(url, "No content extracted")
                     return False
                     
             except Exception as e:
                 logger.error(f"Error processing {url}: {e}")
+                self.journal.record_failed(url, str(e))
                 return False
     
     def extract_title_from_content(self, content: str) -> str:
@@ -331,61 +583,207 @@ description: {self.extract_description_from_content(content)}
                 return line.strip()[:200] + "..." if len(line) > 200 else line.strip()
         return "No description available"
     
-    async def crawl_all_concurrent(self, urls: List[str]) -> Dict[str, any]:
-        """Crawl all URLs concurrently for maximum speed."""
+    async def _as_discovered(
+        self,
+        urls: Union[List[str], AsyncIterator[Tuple[str, int]]]
+    ) -> AsyncIterator[Tuple[str, int]]:
+        """Yield (url, depth) pairs from a URL list or a discovery stream."""
+        if isinstance(urls, list):
+            for url in urls:
+                yield url, 0 if url == self.root_url else 1  # Simple depth assignment
+        else:
+            async for url, depth in urls:
+                yield url, depth
+    
+    async def crawl_all_concurrent(
+        self,
+        urls: Union[List[str], AsyncIterator[Tuple[str, int]]]
+    ) -> Dict[str, any]:
+        """
+        Crawl all URLs concurrently for maximum speed.
+        
+        Accepts a URL list or a (url, depth) stream from discover_urls();
+        streamed URLs start crawling as soon as they are discovered, and
+        results are recorded in completion order.
+        """
         if self.progress_tracker:
             crawl_task = self.progress_tracker.create_task(
                 "crawling", 
                 "Crawling pages concurrently", 
-                total=len(urls)
+                total=len(urls) if isinstance(urls, list) else None
             )
         
         # Create semaphore for concurrency control
         semaphore = asyncio.Semaphore(self.max_concurrent)
         
-        # Create tasks for all URLs
+        counts = {"completed": 0, "successful": 0}
+        
+        async def track(url: str, depth: int):
+            # Record each result as soon as its page finishes
+            try:
+                success = await self.process_url(url, depth, semaphore)
+            except Exception as e:
+                logger.error(f"Task failed for {url}: {e}")
+                success = False
+            
+            counts["completed"] += 1
+            if success:
+                counts["successful"] += 1
+            
+            if self.progress_tracker:
+                self.progress_tracker.update_task(
+                    "crawling",
+                    advance=1,
+                    current_item=f"{'Processed' if success else 'Failed'}: {url}",
+                    success_rate=f"{counts['successful']}/{counts['completed']}"
+                )
+        
+        # Create tasks for all URLs as they arrive
         tasks = []
-        for i, url in enumerate(urls):
-            depth = 0 if url == self.root_url else 1  # Simple depth assignment
-            task = asyncio.create_task(self.process_url(url, depth, semaphore))
-            tasks.append((url, task))
+        async for url, depth in self._as_discovered(urls):
+            tasks.append(asyncio.create_task(track(url, depth)))
+        
+        await asyncio.gather(*tasks)
+        await self.writer.flush()
         
-        # Process tasks with progress updates
-        completed = 0
-        successful = 0
+        completed = counts["completed"]
+        successful = counts["successful"]
+        return {
+            "total_urls": len(tasks),
+            "successful": successful,
+            "failed": completed - successful,
+            "success_rate": successful / completed if completed > 0 else 0,
+            "fetch_tiers": dict(self.fetcher.stats),
+            "concurrency_limits": self.concurrency.limits,
+            "visited_backend": self.visited_backend,
+            "visited_bytes_per_url": bytes_per_url(self.processed_urls)
+        }
+    
+    def create_frontier(self) -> CrawlFrontier:
+        """
+        Create a frontier scoped like link discovery.
         
-        for url, task in tasks:
+        Seeded with the root URL, or rebuilt from the journal when resuming.
+        Every newly queued entry is journaled.
+        """
+        frontier = CrawlFrontier(
+            max_depth=self.max_depth,
+            url_filter=self.create_link_discovery().in_scope,
+            on_put=lambda entry: self.journal.record_queued(entry.url, entry.depth, entry.parent),
+            seen=create_visited_set(self.visited_backend, self.output_dir / ".queued.sqlite")
+        )
+        if self.resume_state and self.resume_state.queued:
+            restored = frontier.restore(self.resume_state.queued, self.resume_state.completed)
+            logger.info(f"Resuming: {restored} URLs restored to the frontier")
+        else:
+            frontier.put(self.root_url, 0)
+        return frontier
+    
+    async def seed_from_sitemap(self, frontier: CrawlFrontier) -> int:
+        """
+        Queue in-scope sitemap URLs and remember their lastmod dates.
+        
+        Each URL is queued at its path depth below the root URL, so pages
+        that no crawled page links to are still found.
+        
+        Returns:
+            Number of newly queued URLs
+        """
+        reader = SitemapReader(self.root_url, fetcher=self.fetcher)
+        in_scope = self.create_link_discovery().in_scope
+        
+        added = 0
+        for url, lastmod in (await reader.read()).items():
+            if not in_scope(url):
+                continue
+            self.sitemap_lastmod[url] = lastmod
+            depth = path_depth(url, self.root_url)
+            if depth > 0 and frontier.put(url, depth):
+                added += 1
+        
+        logger.info(f"Sitemap: {len(self.sitemap_lastmod)} URLs in scope, {added} queued")
+        return added
+    
+    async def crawl_frontier(self, frontier: Optional[CrawlFrontier] = None) -> Dict[str, any]:
+        """
+        Crawl the site in a single pass driven by a priority-queue frontier.
+        
+        Workers take the shallowest pending URL, extract its content, and
+        push the page's in-scope links back into the frontier one level
+        deeper, so every URL is fetched once for both content and links.
+        
+        Args:
+            frontier: Pre-seeded frontier (default: seeded with root_url)
+        
+        Returns:
+            Crawl statistics in the same shape as crawl_all_concurrent()
+        """
+        frontier = frontier or self.create_frontier()
+        
+        if self.progress_tracker:
+            self.progress_tracker.create_task(
+                "crawling", 
+                "Crawling pages from frontier", 
+                total=None
+            )
+        
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        counts = {"completed": 0, "successful": 0}
+        
+        async def handle(entry: FrontierEntry):
             try:
-                success = await task
-                if success:
-                    successful += 1
-                completed += 1
-                
-                if self.progress_tracker:
-                    self.progress_tracker.update_task(
-                        "crawling",
-                        advance=1,
-                        current_item=f"Processed: {url}",
-                        success_rate=f"{successful}/{completed}"
-                    )
-                    
+                success = await self.process_url(entry.url, entry.depth, semaphore, entry.parent)
             except Exception as e:
-                logger.error(f"Task failed for {url}: {e}")
-                completed += 1
-                
-                if self.progress_tracker:
-                    self.progress_tracker.update_task(
-                        "crawling",
-                        advance=1,
-                        current_item=f"Failed: {url}",
-                        success_rate=f"{successful}/{completed}"
-                    )
+                logger.error(f"Task failed for {entry.url}: {e}")
+                success = False
+            
+            added = frontier.put_links(self.page_links.pop(entry.url, []), entry)
+            
+            counts["completed"] += 1
+            if success:
+                counts["successful"] += 1
+            
+            if self.progress_tracker:
+                self.progress_tracker.update_task(
+                    "crawling",
+                    advance=1,
+                    current_item=f"{'Processed' if success else 'Failed'}: {entry.url}",
+                    success_rate=f"{counts['successful']}/{counts['completed']}",
+                    queued=added
+                )
         
+        async def worker():
+            while True:
+                entry = await frontier.get()
+                try:
+                    await handle(entry)
+                finally:
+                    frontier.task_done()
+        
+        workers = [asyncio.create_task(worker()) for _ in range(self.max_concurrent)]
+        try:
+            await frontier.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        await self.writer.flush()
+        
+        completed = counts["completed"]
+        successful = counts["successful"]
         return {
-            "total_urls": len(urls),
+            "total_urls": completed,
+            "resumed_completed": len(self.resume_state.completed) if self.resume_state else 0,
+            "duplicates": len(self.duplicates.alias_of) if self.duplicates else 0,
+            "sitemap_urls": len(self.sitemap_lastmod),
+            "boilerplate_chars_removed": self.boilerplate.stats['chars_removed'] if self.boilerplate else 0,
             "successful": successful,
             "failed": completed - successful,
-            "success_rate": successful / completed if completed > 0 else 0
+            "success_rate": successful / completed if completed > 0 else 0,
+            "fetch_tiers": dict(self.fetcher.stats),
+            "concurrency_limits": self.concurrency.limits,
+            "visited_backend": self.visited_backend,
+            "visited_bytes_per_url": bytes_per_url(self.processed_urls)
         }
     
     def create_summary_document(self, stats: Dict[str, any]) -> Path:
@@ -403,11 +801,20 @@ description: {self.extract_description_from_content(content)}
 - **Successfully Crawled**: {stats['successful']}
 - **Failed**: {stats['failed']}
 - **Success Rate**: {stats['success_rate']:.1%}
+- **Completed in Earlier Runs**: {stats.get('resumed_completed', 0)}
+- **URLs Listed in Sitemaps**: {stats.get('sitemap_urls', 0)}
+- **Duplicates Recorded as Aliases**: {stats.get('duplicates', 0)}
+- **Boilerplate Removed**: {stats.get('boilerplate_chars_removed', 0):,} characters
+- **Served over HTTP**: {stats.get('fetch_tiers', {}).get('http', 0)}
+- **Rendered in Browser**: {stats.get('fetch_tiers', {}).get('browser', 0)}
+- **Reused from Cache**: {stats.get('fetch_tiers', {}).get('cache', 0)}
+- **Visited Set**: {stats.get('visited_backend', self.visited_backend)}, {stats.get('visited_bytes_per_url', 0):.1f} bytes per URL
+- **Final Concurrency Limits**: {', '.join(f'{host}: {limit}' for host, limit in stats.get('concurrency_limits', {}).items()) or 'n/a'}
 
 ## Optimization Features
 
-✅ **RecursiveUrlLoader**: Fast URL discovery
-✅ **Concurrent Processing**: {self.max_concurrent} simultaneous crawls
+✅ **Single-Pass Frontier**: Links from crawled pages feed the crawl with true depth
+✅ **Adaptive Concurrency**: Up to {self.max_concurrent} simultaneous crawls per host, backing off on throttling
 ✅ **CSS Selector Optimization**: Targeted main content extraction
 ✅ **Streamlined Pipeline**: Reduced processing overhead
 
@@ -436,11 +843,29 @@ All crawled content saved to: `{self.content_dir}`
         logger.info(f"Concurrency: {self.max_concurrent}")
         logger.info(f"Output: {self.output_dir}")
         
-        # Step 1: Fast URL discovery
-        urls = self.extract_urls_fast()
+        frontier = None
+        try:
+            # Steps 1+2: Each fetched page yields content and new frontier URLs
+            frontier = self.create_frontier()
+            if self.use_sitemap:
+                await self.seed_from_sitemap(frontier)
+            stats = await self.crawl_frontier(frontier)
+        finally:
+            await self.writer.close()
+            self.journal.close()
+            await self.browser_pool.close()
+            await self.fetcher.close()
+            self.processed_urls.close()
+            if frontier is not None:
+                frontier.close()
+        
+        if self.boilerplate and self.unstripped_files:
+            for filepath in self.unstripped_files:
+                self.boilerplate.strip_saved(filepath)
+            stats['boilerplate_chars_removed'] = self.boilerplate.stats['chars_removed']
         
-        # Step 2: Concurrent crawling
-        stats = await self.crawl_all_concurrent(urls)
+        if self.duplicates:
+            self.duplicates.save_aliases(self.output_dir / "aliases.json")
         
         # Step 3: Create summary
         summary_path = self.create_summary_document(stats)
@@ -473,6 +898,25 @@ async def main():
     parser.add_argument('--max-concurrent', '-c', type=int, default=10, help='Maximum concurrent crawls')
     parser.add_argument('--exclude', '-e', nargs='*', default=[], help='Patterns to exclude')
     parser.add_argument('--no-progress', action='store_true', help='Disable progress bars')
+    parser.add_argument('--browser-pool-size', type=int, default=2, help='Number of warm browsers to share')
+    parser.add_argument('--browser-recycle-after', type=int, default=100, help='Navigations before a browser is replaced')
+    parser.add_argument('--http-first', action='store_true',
+                        help='Fetch static pages over HTTP and only render JavaScript pages in a browser')
+    parser.add_argument('--refresh', choices=PageCache.REFRESH_POLICIES, default=None,
+                        help='Enable the page cache: revalidate pages (conditional), refetch all (always), '
+                             'or reuse cached pages without requests (never)')
+    parser.add_argument('--resume', action='store_true',
+                        help='Resume an interrupted crawl from the journal in the output directory')
+    parser.add_argument('--dedup-threshold', type=float, default=None,
+                        help='Record pages at least this similar (0-1, e.g. 0.9) to an earlier page as duplicates')
+    parser.add_argument('--boilerplate-threshold', type=float, default=None,
+                        help='Strip blocks and link lines repeated on more than this fraction of pages (0-1, e.g. 0.6)')
+    parser.add_argument('--sitemap', action='store_true',
+                        help="Seed the crawl from the site's sitemaps and skip pages unchanged since they were cached")
+    parser.add_argument('--visited-backend', choices=['exact', 'compact'], default='exact',
+                        help='Keep seen URLs in memory, or in Bloom filters backed by disk for very large crawls')
+    parser.add_argument('--extraction-mode', choices=['fetch_once', 'per_selector'], default='fetch_once',
+                        help='Render each page once or once per content selector')
     
     args = parser.parse_args()
     
@@ -483,7 +927,17 @@ async def main():
         output_dir=args.output_dir,
         max_concurrent=args.max_concurrent,
         exclude_patterns=args.exclude,
-        show_progress=not args.no_progress
+        show_progress=not args.no_progress,
+        browser_pool_size=args.browser_pool_size,
+        browser_recycle_after=args.browser_recycle_after,
+        extraction_mode=args.extraction_mode,
+        http_first=args.http_first,
+        refresh=args.refresh,
+        resume=args.resume,
+        dedup_threshold=args.dedup_threshold or None,
+        boilerplate_threshold=args.boilerplate_threshold or None,
+        use_sitemap=args.sitemap,
+        visited_backend=args.visited_backend
     )
     
     stats = await crawler.crawl()
@@ -207,6 +207,29 @@ Input file format (one input per line):
         default=2,
         help='Maximum crawl depth for URLs (default: 2)'
     )
+    parser.add_argument(
+        '--browser-pool-size',
+        type=int,
+        default=2,
+        help='Number of warm browsers shared by URL fetches (default: 2)'
+    )
+    parser.add_argument(
+        '--http-first',
+        action='store_true',
+        help='Fetch static pages over HTTP; render only JavaScript pages in a browser'
+    )
+    parser.add_argument(
+        '--refresh',
+        choices=['conditional', 'always', 'never'],
+        default=None,
+        help='Enable the page cache: revalidate cached pages (conditional), '
+             'refetch everything (always), or reuse cached pages without requests (never)'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Resume an interrupted run from the crawl journal in the output directory'
+    )
     
     # Filtering options
     parser.add_argument(
@@ -290,7 +313,11 @@ async def main() -> int:
             max_concurrent=args.max_concurrent,
             max_depth=args.max_depth,
             exclude_patterns=args.exclude,
-            show_progress=not args.no_progress
+            show_progress=not args.no_progress,
+            browser_pool_size=args.browser_pool_size,
+            http_first=args.http_first,
+            refresh=args.refresh,
+            resume=args.resume
         )
         
         # Process inputs
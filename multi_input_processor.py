@@ -382,7 +382,13 @@ class MultiInputProcessor(FastOrderedCrawler):
         
         # Process URLs (can be done concurrently)
         if url_inputs:
-            url_results = await self._process_urls(url_inputs)
+            try:
+                url_results = await self._process_urls(url_inputs)
+            finally:
+                await self.writer.close()
+                self.journal.close()
+                await self.browser_pool.close()
+                await self.fetcher.close()
             all_results.extend(url_results)
         
         # Process PDFs (sequential for resource management)
@@ -430,7 +436,13 @@ class MultiInputProcessor(FastOrderedCrawler):
         return stats
     
     async def _process_urls(self, url_inputs: List[Tuple[int, str]]) -> List[ProcessingResult]:
-        """Process URL inputs using existing FastOrderedCrawler functionality."""
+        """
+        Process URL inputs using existing FastOrderedCrawler functionality.
+        
+        All fetches draw from the crawler's shared browser pool, so the
+        browsers are launched once for the whole batch. URLs completed in an
+        earlier, interrupted run are loaded from disk when resuming.
+        """
         results = []
         
         # Use existing concurrent crawling capability
@@ -439,7 +451,7 @@ class MultiInputProcessor(FastOrderedCrawler):
         
         if len(urls) == 1:
             # Single URL - use existing method
-            content = await self.crawl_with_optimized_selector(urls[0])
+            content = await self._crawl_url_resumable(urls[0])
             if content:
                 title = self.extract_title_from_content(content)
                 description = self.extract_description_from_content(content)
@@ -466,7 +478,7 @@ class MultiInputProcessor(FastOrderedCrawler):
             # This is more complex and would require adapting the existing crawl_all_concurrent method
             # For now, process sequentially
             for url in urls:
-                content = await self.crawl_with_optimized_selector(url)
+                content = await self._crawl_url_resumable(url)
                 if content:
                     title = self.extract_title_from_content(content)
                     description = self.extract_description_from_content(content)
@@ -491,6 +503,31 @@ class MultiInputProcessor(FastOrderedCrawler):
         
         return results
     
+    async def _crawl_url_resumable(self, url: str) -> Optional[str]:
+        """
+        Crawl a URL input, reusing output completed in an earlier run.
+        
+        Fresh content is saved to the content directory and journaled, so an
+        interrupted run can resume without crawling the URL again.
+        """
+        if self.resume_state and url in self.resume_state.completed:
+            path = self.resume_state.completed[url].get('path')
+            if path and Path(path).exists():
+                self.logger.info(f"Resuming: reusing {path}")
+                return Path(path).read_text(encoding='utf-8')
+        
+        content = await self.crawl_with_optimized_selector(url)
+        if content:
+            filepath = self.content_dir / self.sanitize_filename(url)
+            await self.writer.write(
+                filepath,
+                content,
+                on_written=lambda: self.journal.record_done(url, str(filepath))
+            )
+        else:
+            self.journal.record_failed(url, "No content extracted")
+        return content
+    
     async def _process_pdfs(self, pdf_inputs: List[Tuple[int, str]]) -> List[ProcessingResult]:
         """Process PDF inputs sequentially."""
         results = []
@@ -61,6 +61,18 @@ Examples:
         default=10,
         help='Maximum concurrent operations (default: 10)'
     )
+    parser.add_argument(
+        '--refresh',
+        choices=['conditional', 'always', 'never'],
+        default=None,
+        help='Enable the page cache for URLs: revalidate (conditional), refetch all (always), '
+             'or reuse cached pages without requests (never)'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Skip inputs completed by an interrupted run in the same output directory'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -147,7 +159,9 @@ async def main():
         # Initialize processor
         processor = SimpleMultiProcessor(
             output_dir=args.output_dir,
-            max_concurrent=args.max_concurrent
+            max_concurrent=args.max_concurrent,
+            refresh=args.refresh,
+            resume=args.resume
         )
         
         print(f"\n🚀 Starting processing...")
@@ -20,6 +20,10 @@ from crawl4ai import AsyncWebCrawler, CrawlerRunConfig
 
 # Import our simplified type detection
 from simple_input_types import detect_input_type, validate_inputs, validate_file_exists
+from crawlers.concurrency import AdaptiveConcurrencyController
+from crawlers.page_cache import PageCache
+from crawlers.tiered_fetcher import TieredFetcher
+from crawlers.crawl_journal import CrawlJournal
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -35,7 +39,9 @@ class SimpleMultiProcessor:
     def __init__(
         self, 
         output_dir: str = "./simple_output",
-        max_concurrent: int = 10
+        max_concurrent: int = 10,
+        refresh: Optional[str] = None,
+        resume: bool = False
     ):
         """
         Initialize the processor.
@@ -43,6 +49,10 @@ class SimpleMultiProcessor:
         Args:
             output_dir: Directory for output files
             max_concurrent: Maximum concurrent operations
+            refresh: Page cache refresh policy for URLs ('conditional',
+                'always' or 'never'); None disables the cache
+            resume: Skip inputs completed by an earlier, interrupted run
+                according to the journal in output_dir
         """
         self.output_dir = Path(output_dir)
         self.max_concurrent = max_concurrent
@@ -56,6 +66,19 @@ class SimpleMultiProcessor:
         # Initialize Docling for high-quality PDF processing
         self.docling_converter = DocumentConverter()
         
+        # Per-host limits so many URLs on one site back off on throttling
+        self.concurrency = AdaptiveConcurrencyController(max_limit=max_concurrent)
+        
+        # Conditional-GET cache so unchanged pages are not re-rendered
+        self.page_cache = PageCache(self.output_dir / ".page_cache", refresh) if refresh else None
+        self.fetcher = TieredFetcher(max_connections=max_concurrent, controller=self.concurrency)
+        
+        # Completed inputs are journaled so an interrupted run can resume
+        self.journal = CrawlJournal(self.output_dir)
+        self.completed = self.journal.load().completed if resume else {}
+        if not resume:
+            self.journal.reset()
+        
         logger.info(f"SimpleMultiProcessor initialized with output_dir: {output_dir}")
     
     async def process_inputs(
@@ -96,7 +119,11 @@ class SimpleMultiProcessor:
                 for position, input_str, input_type in validated_inputs
             ]
             
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            try:
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+            finally:
+                await self.fetcher.close()
+                self.journal.close()
             
             # Separate successful results from exceptions
             successful_results = []
@@ -151,6 +178,12 @@ class SimpleMultiProcessor:
         semaphore: asyncio.Semaphore
     ) -> Dict[str, Any]:
         """Process a single input with concurrency control."""
+        key = f"{position}:{input_str}"
+        resumed = self._load_completed(key)
+        if resumed is not None:
+            logger.info(f"Resuming: reusing output for input {position + 1}: {input_str[:50]}...")
+            return resumed
+        
         async with semaphore:
             start_time = time.time()
             
@@ -167,13 +200,43 @@ class SimpleMultiProcessor:
                 processing_time = time.time() - start_time
                 result["processing_time"] = round(processing_time, 2)
                 
+                self.journal.record_done(
+                    key,
+                    result["output_file"],
+                    input_type=result["input_type"],
+                    source=result["source"],
+                    title=result["title"]
+                )
+                
                 logger.info(f"Processed {input_type} input {position + 1}: {input_str[:50]}...")
                 return result
                 
             except Exception as e:
                 logger.error(f"Failed to process {input_str}: {str(e)}")
+                self.journal.record_failed(key, str(e))
                 raise e
     
+    def _load_completed(self, key: str) -> Optional[Dict[str, Any]]:
+        """Rebuild the result of an input completed in an earlier run."""
+        record = self.completed.get(key)
+        if not record or not record.get('path') or not Path(record['path']).exists():
+            return None
+        
+        position = int(key.split(':', 1)[0])
+        with open(record['path'], 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        return {
+            "position": position,
+            "input_type": record.get('input_type'),
+            "source": record.get('source'),
+            "title": record.get('title'),
+            "content": content,
+            "output_file": record['path'],
+            "success": True,
+            "processing_time": 0.0
+        }
+    
     async def _process_pdf(self, pdf_path: str, position: int) -> Dict[str, Any]:
         """Process PDF using Docling for high quality."""
         # Handle PDF URLs by downloading first
@@ -213,8 +276,15 @@ class SimpleMultiProcessor:
             word_count_threshold=10
         )
         
-        async with AsyncWebCrawler() as crawler:
-            result = await crawler.arun(url=url, config=config)
+        cached, response = await self._check_cache(url)
+        if cached is not None:
+            content = cached.markdown
+            title = cached.metadata.get('title', f"Web Page {position + 1}")
+        else:
+            async with AsyncWebCrawler() as crawler:
+                async with self.concurrency.slot(url):
+                    result = await crawler.arun(url=url, config=config)
+                    self.concurrency.observe(url, result.status_code, result.response_headers)
             
             if not result.success:
                 raise Exception(f"Failed to crawl URL: {result.error_message}")
@@ -222,22 +292,45 @@ class SimpleMultiProcessor:
             content = result.markdown or result.cleaned_html or "No content extracted"
             title = result.metadata.get('title', f"Web Page {position + 1}")
             
-            # Save individual file
-            filename = self._generate_filename(url, position, "url")
-            output_path = self.content_dir / filename
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            return {
-                "position": position,
-                "input_type": "url",
-                "source": url,
-                "title": title,
-                "content": content,
-                "output_file": str(output_path),
-                "success": True
-            }
+            if self.page_cache:
+                self.page_cache.store(url, content, response, metadata={'title': title})
+        
+        # Save individual file
+        filename = self._generate_filename(url, position, "url")
+        output_path = self.content_dir / filename
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        
+        return {
+            "position": position,
+            "input_type": "url",
+            "source": url,
+            "title": title,
+            "content": content,
+            "output_file": str(output_path),
+            "success": True
+        }
+
+    async def _check_cache(self, url: str):
+        """
+        Revalidate a cached URL with a conditional GET.
+        
+        Returns:
+            Tuple of (cached page if unchanged, revalidation response)
+        """
+        if not self.page_cache:
+            return None, None
+        
+        entry = self.page_cache.lookup(url)
+        response = None
+        if not self.page_cache.serves_without_request(entry):
+            response = await self.fetcher.fetch_response(url, self.page_cache.request_headers(entry))
+            if not self.page_cache.is_unchanged(entry, response):
+                self.page_cache.stats['misses'] += 1
+                return None, response
+        
+        return self.page_cache.touch(entry, response), response
     
     async def _process_markdown(self, md_path: str, position: int) -> Dict[str, Any]:
         """Process markdown file."""
@@ -0,0 +1,87 @@
+"""
+Unit tests for the streaming repetition analyzer.
+
+Tests rolling-hash detection of repeated spans and the bytes-saved report.
+"""
+
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from analyze_repetitive_content import CountMinSketch, analyze_repetitive_content, find_repeated_blocks
+
+
+NAV = "".join(f"* [Navigation entry {i}](https://example.com/docs/{i})\n" for i in range(8))
+
+
+class TestRepetitionAnalyzer:
+    """Test suite for find_repeated_blocks."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for test files."""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    def write(self, temp_dir, sections):
+        path = Path(temp_dir) / "compiled.md"
+        path.write_text("".join(sections), encoding='utf-8')
+        return path
+
+    def test_repeated_navigation_is_reported(self, temp_dir):
+        """Test that a block repeated in every section is found once with its savings."""
+        path = self.write(temp_dir, [
+            f"<!-- Source: page{n}.md -->\n# Page {n}\n\n{NAV}\nBody text unique to page {n}.\n\n"
+            for n in range(4)
+        ])
+
+        repeated, totals = find_repeated_blocks(str(path), min_bytes=100)
+
+        assert totals['sections'] == 5
+        assert len(repeated) == 1
+        block = repeated[0]
+        assert block['occurrences'] == 4
+        assert block['size'] >= len(NAV)
+        assert block['bytes_saved'] == block['size'] * 3
+        assert "Navigation entry 0" in block['preview']
+
+    def test_unique_content_has_no_repeats(self, temp_dir):
+        """Test that a file without repeated spans reports nothing."""
+        path = self.write(temp_dir, [f"Line {n} has its own text.\n" for n in range(100)])
+
+        repeated, totals = find_repeated_blocks(str(path), min_bytes=10)
+
+        assert repeated == []
+        assert totals['lines'] == 100
+
+    def test_short_repeats_are_ignored(self, temp_dir):
+        """Test that spans below min_bytes are not reported."""
+        path = self.write(temp_dir, [f"Search... ⌘K\nA\nB\nUnique {n}\n" for n in range(5)])
+
+        repeated, _ = find_repeated_blocks(str(path), min_bytes=200)
+
+        assert repeated == []
+
+    def test_report_totals(self, temp_dir):
+        """Test that the report sums bytes saved across blocks."""
+        path = self.write(temp_dir, [f"{NAV}\nSection {n}\n\n" for n in range(3)])
+
+        results = analyze_repetitive_content(str(path), min_bytes=100)
+
+        assert results['current_size'] == path.stat().st_size
+        assert results['potential_savings'] == sum(b['bytes_saved'] for b in results['repeated_blocks'])
+        assert results['potential_savings'] > 0
+
+    def test_count_min_sketch_never_undercounts(self):
+        """Test that sketch estimates are at least the true counts."""
+        sketch = CountMinSketch(width_bits=4)
+        for key in range(100):
+            for _ in range(key % 3):
+                sketch.add(key)
+
+        assert all(sketch.estimate(key) >= key % 3 for key in range(100))
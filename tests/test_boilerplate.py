@@ -0,0 +1,164 @@
+"""
+Unit tests for BoilerplateStripper module.
+
+Tests incremental cross-page frequency counting and block/line stripping.
+"""
+
+import asyncio
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawlers.boilerplate import BoilerplateStripper
+
+
+NAV = "* [Welcome](/welcome)\n* [Quickstart](/quickstart)\n* [Release Notes](/release-notes)"
+SEARCH = "Search... ⌘K"
+
+
+def page(n, nav=NAV):
+    return f"""{SEARCH}
+
+{nav}
+
+# Page {n}
+
+Unique paragraph number {n} explains topic {n} in detail.
+
+```bash
+echo "{SEARCH}"
+```
+
+---
+"""
+
+
+class TestBoilerplateStripper:
+    """Test suite for BoilerplateStripper class."""
+
+    def test_nothing_stripped_before_min_pages(self):
+        """Test that early pages are saved unchanged."""
+        stripper = BoilerplateStripper(min_pages=3)
+
+        assert stripper.strip(page(1)) == page(1)
+        assert stripper.strip(page(2)) == page(2)
+        assert stripper.stats['chars_removed'] == 0
+
+    def test_repeated_blocks_are_stripped(self):
+        """Test that navigation and search widgets are removed once frequent."""
+        stripper = BoilerplateStripper(min_pages=3)
+        for n in range(1, 3):
+            stripper.strip(page(n))
+
+        stripped = stripper.strip(page(3))
+
+        assert "Quickstart" not in stripped
+        # Single lines that are not link lists are never stripped
+        assert stripped.startswith(SEARCH)
+        assert "# Page 3" in stripped
+        assert "Unique paragraph number 3" in stripped
+        assert stripper.stats['blocks_removed'] == 1
+        assert stripper.stats['pages_stripped'] == 1
+
+    def test_code_blocks_and_rules_are_kept(self):
+        """Test that fenced code and separators are never stripped."""
+        stripper = BoilerplateStripper(min_pages=2)
+        stripper.strip(page(1))
+
+        stripped = stripper.strip(page(2))
+
+        assert f'echo "{SEARCH}"' in stripped
+        assert "```bash" in stripped
+        assert "---" in stripped
+
+    def test_repeated_lines_in_varying_blocks(self):
+        """Test that frequent lines are removed from blocks that differ per page."""
+        stripper = BoilerplateStripper(min_pages=3)
+        for n in range(1, 4):
+            stripped = stripper.strip(page(n, nav=f"{NAV}\n* [Current page {n}](/page-{n})"))
+
+        assert "Welcome" not in stripped
+        assert "* [Current page 3](/page-3)" in stripped
+
+    def test_rare_blocks_are_kept(self):
+        """Test that blocks below the threshold fraction survive."""
+        stripper = BoilerplateStripper(threshold=0.6, min_pages=2)
+        stripper.strip(page(1))
+        stripper.strip("# Other\n\nA page without navigation.")
+
+        stripped = stripper.strip(page(3))
+
+        # The navigation has been seen on 2 of 3 pages, which exceeds 0.6
+        assert "Quickstart" not in stripped
+        assert stripper.is_boilerplate(NAV)
+        assert not stripper.is_boilerplate("A page without navigation.")
+
+    def test_repeated_labels_are_content(self):
+        """Test that labels recurring on every API page survive."""
+        stripper = BoilerplateStripper(min_pages=3)
+        for n in range(1, 7):
+            stripped = stripper.strip(
+                f"# method_{n}()\n\n**Parameters:**\n- `arg{n}`: value {n}\n\n"
+                f"**Returns:**\n\nResult {n}.\n\nExample:\n\n```python\nmethod_{n}()\n```\n"
+            )
+
+        for label in ("**Parameters:**", "**Returns:**", "Example:"):
+            assert label in stripped
+        assert stripper.stats['chars_removed'] == 0
+
+    def test_spacing_is_preserved(self):
+        """Test that blank lines around kept blocks are not rewritten."""
+        stripper = BoilerplateStripper(min_pages=2)
+        stripper.strip(page(1))
+
+        stripped = stripper.strip("\n" + page(2).replace("# Page 2\n\n", "# Page 2\n\n\n"))
+
+        assert stripped == f"\n{SEARCH}\n\n# Page 2\n\n\nUnique paragraph number 2 explains topic 2 in detail.\n\n" \
+            f"```bash\necho \"{SEARCH}\"\n```\n\n---\n"
+
+    def test_pages_saved_while_warming_up(self, tmp_path):
+        """Test that early pages are stripped once enough pages are seen, keeping frontmatter."""
+        stripper = BoilerplateStripper(min_pages=3)
+        saved = tmp_path / "page1.md"
+        saved.write_text("---\nurl: https://example.com/1\n---\n\n" + stripper.strip(page(1)))
+        assert stripper.strip_saved(saved) == 0
+
+        for n in range(2, 4):
+            stripper.strip(page(n))
+
+        assert stripper.strip_saved(saved) > 0
+        text = saved.read_text()
+        assert text.startswith("---\nurl: https://example.com/1\n---\n\n")
+        assert "Quickstart" not in text and "Unique paragraph number 1" in text
+
+    def test_invalid_threshold(self):
+        """Test that thresholds outside (0, 1) are rejected."""
+        with pytest.raises(ValueError):
+            BoilerplateStripper(threshold=0)
+        with pytest.raises(ValueError):
+            BoilerplateStripper(threshold=1.0)
+
+
+class TestCrawlerBoilerplate:
+    """Test boilerplate stripping in the crawlers."""
+
+    @pytest.mark.asyncio
+    async def test_fast_crawler_tracks_pages_saved_while_warming_up(self, tmp_path):
+        """Test that stripping is opt-in and early pages are remembered for later."""
+        from fast_ordered_crawler import FastOrderedCrawler
+
+        assert FastOrderedCrawler("https://example.com", output_dir=str(tmp_path / "off"),
+                                  show_progress=False).boilerplate is None
+
+        crawler = FastOrderedCrawler("https://example.com/docs", output_dir=str(tmp_path / "on"),
+                                     show_progress=False, boilerplate_threshold=0.6)
+        with patch.object(crawler, 'crawl_with_optimized_selector', return_value=page(1)):
+            await crawler.process_url("https://example.com/docs/a", 1, asyncio.Semaphore(1))
+        await crawler.writer.close()
+        crawler.journal.close()
+
+        assert len(crawler.unstripped_files) == 1
+        assert crawler.unstripped_files[0].exists()
@@ -0,0 +1,97 @@
+"""
+Unit tests for BrowserPool module.
+
+Tests lazy browser launch, lease distribution, recycling and shutdown.
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawlers.browser_pool import BrowserPool
+
+
+def make_mock_crawler(*args, **kwargs):
+    """Create a mock AsyncWebCrawler with async lifecycle methods."""
+    crawler = AsyncMock()
+    crawler.arun.return_value = "result"
+    return crawler
+
+
+class TestBrowserPool:
+    """Test suite for BrowserPool class."""
+
+    def test_invalid_size(self):
+        """Test that a pool needs at least one browser."""
+        with pytest.raises(ValueError):
+            BrowserPool(size=0)
+
+    @pytest.mark.asyncio
+    async def test_browsers_launched_lazily_and_reused(self):
+        """Test that browsers start on demand and are shared afterwards."""
+        with patch('crawlers.browser_pool.AsyncWebCrawler', side_effect=make_mock_crawler):
+            pool = BrowserPool(size=2)
+            assert pool.live_browsers == 0
+
+            for _ in range(5):
+                async with pool.acquire() as browser:
+                    await browser.arun("https://example.com")
+
+            # Sequential leases never need a second browser
+            assert pool.stats['launched'] == 1
+            assert pool.stats['navigations'] == 5
+
+            await pool.close()
+            assert pool.live_browsers == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_leases_spread_over_pool(self):
+        """Test that concurrent leases launch up to the pool size."""
+        with patch('crawlers.browser_pool.AsyncWebCrawler', side_effect=make_mock_crawler):
+            pool = BrowserPool(size=2)
+
+            async with pool.acquire() as first:
+                async with pool.acquire() as second:
+                    async with pool.acquire() as third:
+                        assert first.crawler is not second.crawler
+                        assert third.crawler in (first.crawler, second.crawler)
+
+            assert pool.stats['launched'] == 2
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_recycle_after_navigations(self):
+        """Test that a browser is replaced after the navigation limit."""
+        with patch('crawlers.browser_pool.AsyncWebCrawler', side_effect=make_mock_crawler):
+            pool = BrowserPool(size=1, recycle_after=2)
+
+            async with pool.acquire() as browser:
+                first_crawler = browser.crawler
+                await browser.arun("https://example.com/a")
+                await browser.arun("https://example.com/b")
+
+            # The retired browser was closed once its lease ended
+            first_crawler.close.assert_awaited_once()
+
+            async with pool.acquire() as browser:
+                assert browser.crawler is not first_crawler
+
+            assert pool.stats['launched'] == 2
+            assert pool.stats['recycled'] == 1
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_busy_browser(self):
+        """Test that close() defers shutdown of browsers still in use."""
+        with patch('crawlers.browser_pool.AsyncWebCrawler', side_effect=make_mock_crawler):
+            pool = BrowserPool(size=1)
+
+            async with pool.acquire() as browser:
+                await pool.close()
+                browser.crawler.close.assert_not_awaited()
+
+            browser.crawler.close.assert_awaited_once()
+            assert pool.live_browsers == 0
@@ -0,0 +1,132 @@
+"""
+Unit tests for AdaptiveConcurrencyController module.
+
+Tests AIMD limit changes, Retry-After handling, and progress reporting.
+"""
+
+import asyncio
+import time
+import pytest
+from pathlib import Path
+from unittest.mock import Mock
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawlers.concurrency import AdaptiveConcurrencyController
+
+
+URL = "https://example.com/docs/page"
+
+
+class TestAdaptiveConcurrencyController:
+    """Test suite for AdaptiveConcurrencyController class."""
+
+    @pytest.fixture
+    def controller(self):
+        """Create a controller with a small, predictable limit range."""
+        return AdaptiveConcurrencyController(initial_limit=4, max_limit=8)
+
+    def test_healthy_responses_increase_limit(self, controller):
+        """Test additive increase of about one per limit's worth of successes."""
+        for _ in range(5):
+            controller.record_latency(URL, 0.1)
+        assert controller.limit_for(URL) == 5
+
+    def test_throttling_halves_limit(self, controller):
+        """Test multiplicative decrease on 429."""
+        controller.observe(URL, 429)
+        assert controller.limit_for(URL) == 2
+
+    def test_burst_of_failures_decreases_once(self, controller):
+        """Test that failures from the same moment only cut the limit once."""
+        controller.observe(URL, 503)
+        controller.observe(URL, 503)
+        controller.record_failure(URL)
+        assert controller.limit_for(URL) == 2
+
+    def test_latency_spike_decreases_limit(self, controller):
+        """Test that a response far slower than average counts as congestion."""
+        controller.record_latency(URL, 0.1)
+        controller.record_latency(URL, 1.0)
+        assert controller.limit_for(URL) == 2
+
+    def test_limits_are_per_host(self, controller):
+        """Test that throttling one host leaves others untouched."""
+        controller.observe(URL, 429)
+        assert controller.limit_for("https://other.com/") == 4
+        assert controller.limits == {"example.com": 2, "other.com": 4}
+
+    def test_non_integer_status_is_ignored(self, controller):
+        """Test that missing statuses do not change the limit."""
+        controller.observe(URL, None)
+        controller.observe(URL, Mock())
+        assert controller.limit_for(URL) == 4
+
+    def test_parse_retry_after(self, controller):
+        """Test Retry-After in seconds and as an HTTP date."""
+        assert controller._parse_retry_after("7") == 7.0
+        assert controller._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert controller._parse_retry_after("soon") is None
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_host(self, controller):
+        """Test that a slot waits until the Retry-After pause has passed."""
+        controller.max_retry_after = 0.05
+        controller.observe(URL, 429, {"Retry-After": "30"})
+
+        start = time.monotonic()
+        async with controller.slot(URL):
+            pass
+        assert time.monotonic() - start >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_slot_enforces_limit(self):
+        """Test that no more than the limit of requests run per host."""
+        controller = AdaptiveConcurrencyController(initial_limit=2, max_limit=2)
+        running = 0
+        peak = 0
+
+        async def request():
+            nonlocal running, peak
+            async with controller.slot(URL):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(request() for _ in range(6)))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_slot_exception_counts_as_failure(self, controller):
+        """Test that an exception inside a slot lowers the limit."""
+        with pytest.raises(RuntimeError):
+            async with controller.slot(URL):
+                raise RuntimeError("boom")
+        assert controller.limit_for(URL) == 2
+
+    def test_reports_limit_changes(self):
+        """Test that limit changes reach the progress tracker."""
+        tracker = Mock()
+        controller = AdaptiveConcurrencyController(progress_tracker=tracker)
+        controller.observe(URL, 429)
+        tracker.update_concurrency.assert_called_once_with("example.com", 2)
+
+    @pytest.mark.parametrize("max_concurrent, start", [(2, 2), (4, 4), (8, 4)])
+    def test_crawlers_start_within_and_ramp_to_max_concurrent(self, tmp_path, max_concurrent, start):
+        """Test that crawler limits start at most at max_concurrent and grow to exactly it."""
+        from crawlers.depth_crawler import DepthCrawler
+        from fast_ordered_crawler import FastOrderedCrawler
+
+        depth = DepthCrawler("https://example.com", output_dir=str(tmp_path / "depth"),
+                             max_concurrent=max_concurrent)
+        depth.journal.close()
+        fast = FastOrderedCrawler("https://example.com", output_dir=str(tmp_path / "fast"),
+                                  max_concurrent=max_concurrent, show_progress=False)
+
+        for controller in (depth.concurrency, fast.concurrency):
+            assert controller.limit_for(URL) == start
+            for _ in range(200):
+                controller.record_latency(URL, 0.1)
+            assert controller.limit_for(URL) == max_concurrent
@@ -0,0 +1,153 @@
+"""
+Unit tests for CrawlJournal module.
+
+Tests journal replay, crash tolerance, and crawler resume behavior.
+"""
+
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawlers.crawl_journal import CrawlJournal
+from crawlers.depth_crawler import DepthCrawler
+from crawlers.frontier import CrawlFrontier
+
+
+class TestCrawlJournal:
+    """Test suite for CrawlJournal class."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for test outputs."""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    def test_replay_rebuilds_state(self, temp_dir):
+        """Test that queued, completed and failed URLs are replayed."""
+        journal = CrawlJournal(temp_dir)
+        journal.record_queued("https://example.com", 0)
+        journal.record_queued("https://example.com/a", 1, "https://example.com")
+        journal.record_queued("https://example.com/b", 1, "https://example.com")
+        journal.record_done("https://example.com", "/out/index.md", depth=0)
+        journal.record_failed("https://example.com/b", "timeout")
+        journal.close()
+
+        state = CrawlJournal(temp_dir).load()
+
+        assert state.completed["https://example.com"]["path"] == "/out/index.md"
+        assert state.failed == {"https://example.com/b": "timeout"}
+        assert state.pending == {
+            "https://example.com/a": (1, "https://example.com"),
+            "https://example.com/b": (1, "https://example.com"),
+        }
+
+    def test_torn_final_line_is_ignored(self, temp_dir):
+        """Test that a partial record from a crash does not break replay or appends."""
+        journal = CrawlJournal(temp_dir)
+        journal.record_done("https://example.com/a", "a.md")
+        journal.close()
+        with open(journal.path, 'a', encoding='utf-8') as f:
+            f.write('{"event": "done", "url": "https://exa')
+
+        journal = CrawlJournal(temp_dir)
+        journal.record_done("https://example.com/b", "b.md")
+        journal.close()
+
+        assert set(journal.load().completed) == {"https://example.com/a", "https://example.com/b"}
+
+    def test_records_are_synced_in_batches(self, temp_dir):
+        """Test that records are fsynced once the batch size is reached."""
+        journal = CrawlJournal(temp_dir, sync_every=3, sync_interval=60)
+        with patch('crawlers.crawl_journal.os.fsync') as fsync:
+            journal.record_queued("https://example.com/1", 1)
+            journal.record_queued("https://example.com/2", 1)
+            assert fsync.call_count == 0
+            journal.record_queued("https://example.com/3", 1)
+            assert fsync.call_count == 1
+        journal.close()
+
+    def test_frontier_restore(self):
+        """Test that only unfinished URLs return to the frontier."""
+        frontier = CrawlFrontier(max_depth=2)
+        restored = frontier.restore(
+            {"https://example.com": (0, None), "https://example.com/a": (1, "https://example.com")},
+            ["https://example.com"]
+        )
+
+        assert restored == 1
+        assert not frontier.put("https://example.com", 0)
+        assert frontier.pending == 1
+
+
+class TestResume:
+    """Test resuming crawlers from the journal."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for test outputs."""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    @pytest.mark.asyncio
+    async def test_fast_crawler_resumes_frontier(self, temp_dir):
+        """Test that a resumed crawl only fetches unfinished URLs."""
+        from fast_ordered_crawler import FastOrderedCrawler
+
+        journal = CrawlJournal(temp_dir)
+        journal.record_queued("https://example.com/docs", 0)
+        journal.record_queued("https://example.com/docs/a", 1, "https://example.com/docs")
+        journal.record_done("https://example.com/docs", "done.md", depth=0)
+        journal.close()
+
+        crawler = FastOrderedCrawler("https://example.com/docs", output_dir=temp_dir,
+                                     show_progress=False, resume=True)
+        crawled = []
+
+        async def fake_crawl(url, depth=0):
+            crawled.append((url, depth))
+            return "# Page\n\n" + "Enough text for the page. " * 10
+
+        with patch.object(crawler, 'crawl_with_optimized_selector', side_effect=fake_crawl):
+            stats = await crawler.crawl_frontier()
+        crawler.journal.close()
+
+        assert crawled == [("https://example.com/docs/a", 1)]
+        assert stats['resumed_completed'] == 1
+        assert "https://example.com/docs/a" in CrawlJournal(temp_dir).load().completed
+
+    @pytest.mark.asyncio
+    async def test_depth_crawler_resumes_pending_level(self, temp_dir):
+        """Test that DepthCrawler continues at the first unfinished depth."""
+        journal = CrawlJournal(temp_dir)
+        journal.record_queued("https://example.com", 0)
+        journal.record_queued("https://example.com/page1", 1, "https://example.com")
+        journal.record_done("https://example.com", str(Path(temp_dir) / "depth0_index.md"), depth=0)
+        journal.close()
+
+        crawler = DepthCrawler("https://example.com", max_depth=1, output_dir=temp_dir, resume=True)
+
+        with patch('crawlers.depth_crawler.AsyncWebCrawler') as MockCrawler:
+            mock_crawler_instance = AsyncMock()
+            MockCrawler.return_value.__aenter__.return_value = mock_crawler_instance
+
+            mock_result = Mock()
+            mock_result.success = True
+            mock_result.url = "https://example.com/page1"
+            mock_result.markdown = "Page 1 content " * 20
+            mock_result.metadata = {'title': 'Page 1', 'description': 'First page'}
+            mock_result.links = {'internal': []}
+            mock_crawler_instance.arun_many.return_value = [mock_result]
+
+            results = await crawler.crawl()
+
+        urls = mock_crawler_instance.arun_many.await_args.kwargs['urls']
+        assert urls == ["https://example.com/page1"]
+        assert results['resumed'] == 1
+        assert len(results['files_created']) == 2
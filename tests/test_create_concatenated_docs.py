@@ -0,0 +1,74 @@
+"""
+Unit tests for create_concatenated_docs script.
+
+Tests single-pass frontmatter scanning, streamed bodies and the sidecar
+offset index.
+"""
+
+import json
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+import create_concatenated_docs as concat
+
+
+class TestCreateConcatenatedDocs:
+    """Test suite for create_concatenated_docs."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a content directory with a main page and two others."""
+        temp_dir = Path(tempfile.mkdtemp())
+        content = temp_dir / "content"
+        content.mkdir()
+        (content / "depth0_index.md").write_text(
+            "---\nurl: https://example.com/\ntitle: Home\n---\n\n# Home\n\nWelcome\n\n", encoding='utf-8'
+        )
+        (content / "depth1_setup.md").write_text(
+            "---\nurl: https://example.com/setup\ntitle: 'Setup: Linux'\n---\n\n# Other\n\nSteps\n", encoding='utf-8'
+        )
+        (content / "notes.md").write_text("\n# Notes\n\nText\n", encoding='utf-8')
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    def test_scan_reads_frontmatter_and_first_h1(self, temp_dir):
+        """Test that titles come from frontmatter, falling back to the first H1."""
+        title, url, offset = concat.scan_markdown_file(temp_dir / "content" / "depth1_setup.md")
+        assert (title, url) == ("Setup: Linux", "https://example.com/setup")
+        assert b"".join(concat.iter_body(temp_dir / "content" / "depth1_setup.md", offset)) == b"# Other\n\nSteps"
+
+        assert concat.scan_markdown_file(temp_dir / "content" / "notes.md") == ("Notes", "", 0)
+
+    def test_each_file_read_once_with_index(self, temp_dir):
+        """Test that pages are opened once for scanning and once for streaming, never buffered whole."""
+        output = temp_dir / "all.md"
+        with patch.object(concat, 'iter_body', wraps=concat.iter_body) as bodies, \
+                patch('builtins.print'):
+            concat.create_concatenated_docs(str(temp_dir / "content"), str(output), write_index=True)
+
+        assert bodies.call_count == 3
+        text = output.read_text(encoding='utf-8')
+        assert text.index("1. [Home](#home)") < text.index("2. [Setup: Linux](#setup-linux)")
+        assert "3. [Notes](#notes)" in text
+
+        index = json.loads((temp_dir / "all.md.index.json").read_text())
+        data = output.read_bytes()
+        sections = [data[page['offset']:page['offset'] + page['length']] for page in index['pages']]
+        assert [page['file'] for page in index['pages']] == ["depth0_index.md", "depth1_setup.md", "notes.md"]
+        assert sections == [b"# Home\n\nWelcome", b"# Other\n\nSteps", b"# Notes\n\nText"]
+
+    def test_crlf_bodies_are_normalized(self, temp_dir):
+        """Test that \r\n line endings become \n, as with a text-mode read."""
+        (temp_dir / "content" / "notes.md").write_bytes(b"---\r\nurl: https://example.com/n\r\n---\r\n\r\n# Notes\r\n\r\nText\r\n")
+        output = temp_dir / "all.md"
+        with patch('builtins.print'):
+            concat.create_concatenated_docs(str(temp_dir / "content"), str(output))
+
+        assert b"\r" not in output.read_bytes()
+        assert b"<!-- Source: https://example.com/n -->\n\n# Notes\n\nText\n" in output.read_bytes()
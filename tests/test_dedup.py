@@ -0,0 +1,210 @@
+"""
+Unit tests for DuplicateDetector module.
+
+Tests SimHash near-duplicate detection and alias recording in the crawlers.
+"""
+
+import asyncio
+import json
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawlers.dedup import DuplicateDetector
+
+
+ARTICLE = (
+    "Installing the command line tool requires a recent Python interpreter and a "
+    "working network connection. Download the package from the release page, "
+    "unpack it into a directory on your path and run the setup command once. "
+    "The setup command creates a configuration file in your home directory, "
+    "which you can edit later to change the default output format, the number "
+    "of parallel workers and the location of the cache used between runs."
+)
+OTHER_ARTICLE = (
+    "Authentication tokens are issued by the account dashboard and expire after "
+    "thirty days. Store each token in an environment variable rather than in "
+    "source control, rotate tokens whenever a team member leaves, and scope them "
+    "to the smallest set of projects they need. Requests without a valid token "
+    "receive an error response that explains how to obtain a new one quickly."
+)
+
+
+class TestDuplicateDetector:
+    """Test suite for DuplicateDetector class."""
+
+    def test_identical_page_is_alias(self):
+        """Test that an identical page is recorded as an alias."""
+        detector = DuplicateDetector()
+
+        assert detector.check("https://example.com/a", ARTICLE) is None
+        assert detector.check("https://example.com/a?lang=en", ARTICLE) == "https://example.com/a"
+        assert detector.alias_of == {"https://example.com/a?lang=en": "https://example.com/a"}
+
+    def test_near_duplicate_is_alias(self):
+        """Test that a page differing in a small footer is still a duplicate."""
+        detector = DuplicateDetector()
+        detector.check("https://example.com/a", ARTICLE)
+
+        variant = ARTICLE + " Last updated yesterday."
+        assert detector.check("https://example.com/b", variant) == "https://example.com/a"
+
+    def test_different_pages_are_kept(self):
+        """Test that unrelated pages are both canonical."""
+        detector = DuplicateDetector()
+
+        assert detector.check("https://example.com/a", ARTICLE) is None
+        assert detector.check("https://example.com/b", OTHER_ARTICLE) is None
+        assert detector.alias_of == {}
+
+    def test_exact_threshold_ignores_near_duplicates(self):
+        """Test that threshold 1.0 only matches identical fingerprints."""
+        detector = DuplicateDetector(threshold=1.0)
+        detector.check("https://example.com/a", ARTICLE)
+
+        assert detector.max_distance == 0
+        assert detector.check("https://example.com/b", ARTICLE) == "https://example.com/a"
+        assert detector.check("https://example.com/c", OTHER_ARTICLE) is None
+
+    def test_short_and_repeated_pages_are_ignored(self):
+        """Test that short pages and re-checked URLs are never aliases."""
+        detector = DuplicateDetector()
+
+        assert detector.check("https://example.com/a", "Content") is None
+        assert detector.check("https://example.com/b", "Content") is None
+        detector.check("https://example.com/c", ARTICLE)
+        assert detector.check("https://example.com/c", ARTICLE) is None
+
+    def test_shared_navigation_is_not_a_duplicate(self):
+        """Test that distinct short pages sharing a large sidebar are all kept."""
+        sidebar = "\n".join(f"* [Guide topic {i}](/docs/topic-{i})" for i in range(60))
+        detector = DuplicateDetector()
+        bodies = [ARTICLE[:120], OTHER_ARTICLE[:120], ARTICLE[120:240], OTHER_ARTICLE[120:240]]
+
+        for i, body in enumerate(bodies):
+            assert detector.check(f"https://example.com/p{i}", f"{sidebar}\n\n# Page {i}\n\n{body}") is None
+        assert detector.alias_of == {}
+
+    def test_candidates_are_confirmed_by_shingle_similarity(self):
+        """Test that an LSH candidate below the exact similarity is kept."""
+        detector = DuplicateDetector()
+        detector.check("https://example.com/a", ARTICLE)
+
+        with patch.object(DuplicateDetector, '_simhash', return_value=detector.fingerprints["https://example.com/a"]):
+            assert detector.check("https://example.com/b", OTHER_ARTICLE) is None
+            assert detector.check("https://example.com/c", ARTICLE) == "https://example.com/a"
+
+    def test_signatures_are_constant_size(self):
+        """Test that long pages keep only a fixed-size MinHash signature."""
+        detector = DuplicateDetector(signature_size=64)
+        long_page = " ".join(f"word{i}" for i in range(5000))
+
+        detector.check("https://example.com/long", long_page)
+
+        assert len(detector.signatures["https://example.com/long"]) == 64
+        assert detector.similarity(detector.signatures["https://example.com/long"],
+                                   detector.signature(detector.shingle_set(long_page))) == 1.0
+        assert detector.check("https://example.com/long-copy", long_page) == "https://example.com/long"
+
+    def test_crawlers_disable_dedup_by_default(self):
+        """Test that duplicate detection is opt-in."""
+        from fast_ordered_crawler import FastOrderedCrawler
+        from crawlers.depth_crawler import DepthCrawler
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            assert FastOrderedCrawler("https://example.com", output_dir=temp_dir, show_progress=False).duplicates is None
+            crawler = DepthCrawler("https://example.com", output_dir=temp_dir)
+            assert crawler.duplicates is None
+            crawler.journal.close()
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_invalid_threshold(self):
+        """Test that thresholds outside (0, 1] are rejected."""
+        with pytest.raises(ValueError):
+            DuplicateDetector(threshold=0)
+        with pytest.raises(ValueError):
+            DuplicateDetector(threshold=1.5)
+
+    def test_save_aliases(self):
+        """Test that aliases are grouped by canonical URL."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            detector = DuplicateDetector()
+            assert detector.save_aliases(Path(temp_dir) / "aliases.json") is None
+
+            detector.check("https://example.com/a", ARTICLE)
+            detector.check("https://example.com/b", ARTICLE)
+            detector.check("https://example.com/c", ARTICLE)
+            path = detector.save_aliases(Path(temp_dir) / "aliases.json")
+
+            assert json.loads(path.read_text()) == {
+                "https://example.com/a": ["https://example.com/b", "https://example.com/c"]
+            }
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+class TestCrawlerDeduplication:
+    """Test duplicate pages in the crawlers."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for test outputs."""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    @pytest.mark.asyncio
+    async def test_fast_crawler_skips_duplicate(self, temp_dir):
+        """Test that a duplicate page is journaled as an alias, not written."""
+        from fast_ordered_crawler import FastOrderedCrawler
+        from crawlers.crawl_journal import CrawlJournal
+
+        crawler = FastOrderedCrawler(
+            "https://example.com/docs", output_dir=temp_dir, show_progress=False, dedup_threshold=0.9
+        )
+        crawler.duplicates.check("https://example.com/docs/a", ARTICLE)
+
+        with patch.object(crawler, 'crawl_with_optimized_selector', return_value=ARTICLE):
+            success = await crawler.process_url("https://example.com/docs/b", 1, asyncio.Semaphore(1))
+        await crawler.writer.close()
+        crawler.journal.close()
+
+        assert success
+        assert not list(Path(temp_dir).glob("*.md"))
+        record = CrawlJournal(temp_dir).load().completed["https://example.com/docs/b"]
+        assert record['alias_of'] == "https://example.com/docs/a"
+
+    @pytest.mark.asyncio
+    async def test_fast_crawler_journals_duplicate_after_its_links(self, temp_dir):
+        """Test that a duplicate is journaled done only once its links are queued."""
+        from fast_ordered_crawler import FastOrderedCrawler
+
+        crawler = FastOrderedCrawler(
+            "https://example.com/docs", output_dir=temp_dir, show_progress=False, dedup_threshold=0.9
+        )
+        crawler.duplicates.check("https://example.com/docs/a", ARTICLE)
+        events = []
+
+        async def fake_crawl(url, depth=0):
+            crawler.page_links[url] = ["https://example.com/docs/c"] if url.endswith("/docs") else []
+            return ARTICLE if url.endswith("/docs") else None
+
+        with patch.object(crawler, 'crawl_with_optimized_selector', side_effect=fake_crawl), \
+                patch.object(crawler.journal, 'record_queued',
+                             side_effect=lambda url, *args: events.append(("queued", url))), \
+                patch.object(crawler.journal, 'record_done',
+                             side_effect=lambda url, *args, **kwargs: events.append(("done", url))):
+            await crawler.crawl_frontier()
+        await crawler.writer.close()
+        crawler.journal.close()
+
+        assert events.index(("queued", "https://example.com/docs/c")) < \
+            events.index(("done", "https://example.com/docs"))
@@ -131,6 +131,69 @@ class TestDepthCrawler:
         assert filepath1.exists()
         assert filepath2.exists()
     
+    def test_save_markdown_content_addressed(self, temp_dir):
+        """Test that content-addressed names depend only on the page content."""
+        crawler = DepthCrawler(
+            root_url="https://example.com",
+            output_dir=temp_dir,
+            content_addressed=True
+        )
+        metadata = {'title': 'Test'}
+        
+        filepath1 = crawler._save_markdown("https://example.com/a/page", "Same", 1, metadata)
+        filepath2 = crawler._save_markdown("https://example.com/b/page", "Same", 1, metadata)
+        filepath3 = crawler._save_markdown("https://example.com/c/page", "Other", 1, metadata)
+        
+        assert filepath1.name.startswith("depth1_a_page_")
+        assert filepath1.stem.rsplit('_', 1)[1] == filepath2.stem.rsplit('_', 1)[1]
+        assert filepath1.stem.rsplit('_', 1)[1] != filepath3.stem.rsplit('_', 1)[1]
+        assert filepath3.exists()
+    
+    def test_content_addressed_collision_is_alias(self, temp_dir):
+        """Test that a second URL with the same file name and content does not overwrite the first."""
+        crawler = DepthCrawler(
+            root_url="https://example.com",
+            output_dir=temp_dir,
+            content_addressed=True
+        )
+        results = {'total_crawled': 0, 'successful': 0, 'failed': 0, 'duplicates': 0,
+                   'files_created': [], 'errors': []}
+        
+        def page(url):
+            result = Mock()
+            result.success = True
+            result.url = url
+            result.redirected_url = None
+            result.markdown = " ".join(f"word{i}" for i in range(60))
+            result.metadata = {'title': 'Page', 'description': ''}
+            result.links = {'internal': []}
+            return result
+        
+        for url in ("https://example.com/docs/page", "https://example.com/docs/page?lang=en"):
+            crawler._process_result(page(url), 1, results, set(), "task", set(), {})
+        crawler.journal.close()
+        
+        assert results['successful'] == 1
+        assert results['duplicates'] == 1
+        assert len(results['files_created']) == 1
+        assert "url: https://example.com/docs/page\n" in Path(results['files_created'][0]).read_text()
+        assert crawler.content_aliases == {
+            "https://example.com/docs/page?lang=en": "https://example.com/docs/page"
+        }
+    
+    def test_redirects_recorded(self, crawler):
+        """Test that browser redirects are kept for the stitcher's alias table."""
+        result = Mock()
+        result.success = False
+        result.url = "https://example.com/old/"
+        result.redirected_url = "https://example.com/new#top"
+        result.error_message = "Not found"
+        
+        crawler._process_result(result, 1, {'total_crawled': 0, 'failed': 0, 'errors': []},
+                                set(), "depth_1", set(), {})
+        
+        assert crawler.redirects == {"https://example.com/old": "https://example.com/new"}
+    
     @pytest.mark.asyncio
     async def test_crawl_basic(self, crawler):
         """Test basic crawling functionality."""
@@ -268,6 +331,65 @@ class TestDepthCrawler:
             assert "https://example.com/admin/panel" not in crawler.visited_urls
             assert "https://example.com/login" not in crawler.visited_urls
     
+    @pytest.mark.asyncio
+    async def test_streaming_crawl_is_not_level_synchronous(self, temp_dir):
+        """Test that a slow page does not hold back deeper pages in streaming mode."""
+        crawler = DepthCrawler(
+            root_url="https://example.com",
+            max_depth=2,
+            output_dir=temp_dir,
+            max_concurrent=3,
+            streaming=True
+        )
+        site = {
+            "https://example.com": ["/slow", "/fast"],
+            "https://example.com/slow": [],
+            "https://example.com/fast": ["/fast/child"],
+            "https://example.com/fast/child": ["/fast/child/too-deep"],
+        }
+        child_requested = asyncio.Event()
+        requested = []
+        
+        def page(url):
+            result = Mock()
+            result.success = True
+            result.url = url
+            name = url.rsplit('/', 1)[-1].replace('.', '')
+            result.markdown = " ".join(f"{name}{i}" for i in range(60))
+            result.metadata = {'title': name, 'description': ''}
+            result.links = {'internal': [{'href': f"https://example.com{path}"} for path in site[url]]}
+            result.status_code = 200
+            result.response_headers = {}
+            result.dispatch_result = None
+            return result
+        
+        async def arun_many(urls, config, dispatcher):
+            assert config.stream
+            requested.extend(urls)
+            if "https://example.com/fast/child" in urls:
+                child_requested.set()
+            
+            async def stream():
+                for url in sorted(urls, key=lambda url: url.endswith("/slow")):
+                    if url.endswith("/slow"):
+                        # Only finishes once a depth-2 page has been started
+                        await asyncio.wait_for(child_requested.wait(), timeout=2)
+                    yield page(url)
+            return stream()
+        
+        with patch('crawlers.depth_crawler.AsyncWebCrawler') as MockCrawler:
+            mock_crawler_instance = AsyncMock()
+            mock_crawler_instance.arun_many.side_effect = arun_many
+            MockCrawler.return_value.__aenter__.return_value = mock_crawler_instance
+            
+            results = await crawler.crawl()
+        
+        assert results['total_crawled'] == 4
+        assert results['successful'] == 4
+        assert child_requested.is_set()
+        assert "https://example.com/fast/child/too-deep" not in requested
+        assert len(requested) == len(set(requested))
+    
     def test_generate_summary(self, crawler, temp_dir):
         """Test summary generation."""
         # Create some mock results
@@ -0,0 +1,315 @@
+"""
+Unit tests for DocumentStitcher module.
+
+Tests indexed navigation matching, redirect and duplicate aliases, and
+matching by path across hosts.
+"""
+
+import gzip
+import json
+import pytest
+import tracemalloc
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawlers.document_stitcher import DocumentStitcher, stitch_crawled_content
+
+
+def write_page(directory, name, url, title):
+    (Path(directory) / name).write_text(
+        f"---\nurl: {url}\ncrawled_at: '2024-01-01'\ndepth: 1\ntitle: {title}\n---\n\n# {title}\n\nBody\n",
+        encoding='utf-8'
+    )
+
+
+def nav(*urls):
+    return [
+        {'url': url, 'title': url, 'order': i, 'breadcrumb': ['Docs'], 'level': 1}
+        for i, url in enumerate(urls)
+    ]
+
+
+class TestDocumentStitcher:
+    """Test suite for DocumentStitcher class."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary content directory."""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    def test_exact_and_path_matches(self, temp_dir):
+        """Test exact URL matches and same-path matches on another host."""
+        write_page(temp_dir, "a.md", "https://example.com/docs/a", "A")
+        write_page(temp_dir, "b.md", "https://www.example.com/docs/b/", "B")
+        write_page(temp_dir, "c.md", "https://example.com/docs/c", "C")
+        stitcher = DocumentStitcher(temp_dir)
+        stitcher.load_content()
+
+        matched, unmatched = stitcher.match_to_navigation(
+            nav("https://example.com/docs/a/", "https://example.com/docs/b")
+        )
+
+        assert [(page.title, page.nav_position) for page in matched] == [("A", 0), ("B", 1)]
+        assert [page.title for page in unmatched] == ["C"]
+
+    def test_redirect_chains_and_duplicates_resolve(self, temp_dir):
+        """Test that aliases written by the crawler are followed in both directions."""
+        write_page(temp_dir, "new.md", "https://example.com/docs/new", "New")
+        write_page(temp_dir, "moved.md", "https://example.com/docs/moved", "Moved")
+        write_page(temp_dir, "canonical.md", "https://example.com/docs/en/intro", "Intro")
+        # /old -> /older-redirect -> /new; /moved itself redirected to /final
+        (Path(temp_dir) / "redirects.json").write_text(json.dumps({
+            "https://example.com/docs/old": "https://example.com/docs/older-redirect",
+            "https://example.com/docs/older-redirect/": "https://example.com/docs/new",
+            "https://example.com/docs/moved": "https://example.com/docs/final",
+        }))
+        (Path(temp_dir) / "aliases.json").write_text(json.dumps({
+            "https://example.com/docs/en/intro": ["https://example.com/docs/intro"]
+        }))
+        stitcher = DocumentStitcher(temp_dir)
+        stitcher.load_content()
+
+        matched, unmatched = stitcher.match_to_navigation(nav(
+            "https://example.com/docs/old",
+            "https://example.com/docs/final",
+            "https://example.com/docs/intro",
+        ))
+
+        assert [page.title for page in matched] == ["New", "Moved", "Intro"]
+        assert unmatched == []
+
+    def test_matching_parses_each_url_once(self, temp_dir):
+        """Test that matching no longer compares every nav item with every page."""
+        for i in range(50):
+            write_page(temp_dir, f"p{i}.md", f"https://example.com/docs/p{i}", f"P{i}")
+        stitcher = DocumentStitcher(temp_dir, aliases={})
+        stitcher.load_content()
+        ordered = nav(*[f"https://other.com/missing/{i}" for i in range(50)])
+
+        with patch('crawlers.document_stitcher.urlparse', wraps=urlparse) as parse:
+            matched, unmatched = stitcher.match_to_navigation(ordered)
+
+        assert matched == []
+        assert len(unmatched) == 50
+        assert parse.call_count == 50
+
+
+class TestContentLoading:
+    """Test frontmatter-only loading and lazy page bodies."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary content directory."""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    def test_bodies_are_read_lazily(self, temp_dir):
+        """Test that loading keeps only metadata and the body offset."""
+        write_page(temp_dir, "a.md", "https://example.com/a", "A")
+        stitcher = DocumentStitcher(temp_dir)
+
+        assert stitcher.load_content(max_workers=2) == 1
+
+        page = stitcher.pages[0]
+        assert page.content is None
+        assert page.depth == 1
+        assert page.crawled_at == "2024-01-01"
+        assert page.body() == "# A\n\nBody"
+        assert "Body" in stitcher._create_page_section(page)
+
+    def test_crawler_frontmatter_skips_yaml(self, temp_dir):
+        """Test that the fixed key set is parsed without YAML, even with colons in values."""
+        (Path(temp_dir) / "a.md").write_text(
+            "---\nurl: https://example.com/a\ncrawled_at: 2024-01-01T10:00:00\ndepth: 2\n"
+            "title: Setup: Linux\ndescription: \nparent: https://example.com\n---\n\nBody\n",
+            encoding='utf-8'
+        )
+
+        with patch('crawlers.document_stitcher.yaml.safe_load', side_effect=AssertionError("YAML used")):
+            stitcher = DocumentStitcher(temp_dir, aliases={})
+            stitcher.load_content()
+
+        page = stitcher.pages[0]
+        assert (page.title, page.depth, page.url) == ("Setup: Linux", 2, "https://example.com/a")
+
+    def test_other_frontmatter_falls_back_to_yaml(self, temp_dir):
+        """Test that unknown keys are parsed by YAML and files without frontmatter are skipped."""
+        (Path(temp_dir) / "a.md").write_text(
+            "---\nurl: https://example.com/a\ntags:\n  - one\ntitle: A\n---\nBody\n", encoding='utf-8'
+        )
+        (Path(temp_dir) / "notes.md").write_text("# Notes\n", encoding='utf-8')
+        (Path(temp_dir) / "open.md").write_text("---\nurl: https://example.com/b\n", encoding='utf-8')
+        stitcher = DocumentStitcher(temp_dir, aliases={})
+
+        assert stitcher.load_content() == 1
+        assert stitcher.pages[0].title == "A"
+        assert stitcher.pages[0].body() == "Body"
+
+
+class TestStreamingWriter:
+    """Test the bounded-memory stitched-document writer."""
+
+    @pytest.fixture
+    def stitcher(self):
+        """Create a stitcher over a few pages, two of them in the navigation."""
+        temp_dir = tempfile.mkdtemp()
+        for i in range(4):
+            (Path(temp_dir) / f"p{i}.md").write_text(
+                f"---\nurl: https://example.com/p{i}\ndepth: 1\ntitle: P{i}\n---\n\n  "
+                + f"Line {i}\n" * 50 + "\n   \n",
+                encoding='utf-8'
+            )
+        stitcher = DocumentStitcher(temp_dir, aliases={})
+        stitcher.load_content()
+        yield stitcher
+        shutil.rmtree(temp_dir)
+
+    def test_streamed_matches_in_memory(self, stitcher):
+        """Test that streaming writes exactly the in-memory document, compressed or not."""
+        matched, unmatched = stitcher.match_to_navigation(nav("https://example.com/p2", "https://example.com/p0"))
+        with patch('crawlers.document_stitcher.datetime') as clock:
+            clock.now.return_value.strftime.return_value = "2024-01-01 00:00:00"
+            expected = stitcher.stitch_document(matched, unmatched)
+            plain = stitcher.write_stitched_document(matched, unmatched)
+            compressed = stitcher.write_stitched_document(matched, unmatched, compression='gzip')
+
+        assert plain.read_text(encoding='utf-8') == expected
+        assert compressed.name == "stitched_document.md.gz"
+        assert gzip.decompress(compressed.read_bytes()).decode('utf-8') == expected
+        with pytest.raises(ValueError):
+            stitcher.write_stitched_document(matched, unmatched, compression='bz2')
+
+    def test_body_chunks_strip_like_full_read(self, stitcher):
+        """Test that chunked bodies are stripped exactly like a full read."""
+        page = stitcher.pages[0]
+
+        for chunk_size in (1, 3, 7, 1000):
+            assert "".join(page.iter_body(chunk_size)) == page.body()
+        assert page.body().startswith("Line 0") and page.body().endswith("Line 0")
+
+    def test_memory_does_not_grow_with_corpus(self, tmp_path):
+        """Test that peak memory stays far below the corpus size."""
+        big = DocumentStitcher(tmp_path, aliases={})
+        for i in range(20):
+            (tmp_path / f"big{i}.md").write_text(
+                f"---\nurl: https://example.com/big{i}\ndepth: 1\ntitle: Big {i}\n---\n"
+                + ("word " * 20 + "\n") * 5000,
+                encoding='utf-8'
+            )
+        big.load_content()
+        corpus_size = sum(path.stat().st_size for path in tmp_path.glob("*.md"))
+
+        tracemalloc.start()
+        big.write_stitched_document(big.pages, [], False)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert corpus_size > 10_000_000
+        assert peak < corpus_size / 20
+
+
+class TestIncrementalStitching:
+    """Test manifest-driven re-stitching with spliced sections."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary content directory with a few pages."""
+        temp_dir = tempfile.mkdtemp()
+        for i in range(5):
+            write_page(temp_dir, f"p{i}.md", f"https://example.com/p{i}", f"P{i}")
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir)
+
+    def stitch(self, temp_dir):
+        stitcher = DocumentStitcher(temp_dir, aliases={})
+        stitcher.load_content()
+        matched, unmatched = stitcher.match_to_navigation(
+            nav(*[f"https://example.com/p{i}" for i in (3, 0, 1)])
+        )
+        with patch('crawlers.document_stitcher.datetime') as clock:
+            clock.now.return_value.strftime.return_value = "2024-01-01 00:00:00"
+            output = stitcher.write_stitched_document(matched, unmatched)
+            expected = stitcher.stitch_document(matched, unmatched)
+        return stitcher, output, expected
+
+    def test_restitch_renders_only_changed_sections(self, temp_dir):
+        """Test that unchanged sections are spliced and the result equals a full stitch."""
+        stitcher, output, expected = self.stitch(temp_dir)
+        assert stitcher.stitch_stats == {'sections_reused': 0, 'sections_rendered': 5, 'bytes_spliced': 0}
+        assert output.read_text(encoding='utf-8') == expected
+        assert (temp_dir / "stitched_document.md.manifest.json").exists()
+
+        (temp_dir / "p1.md").write_text(
+            "---\nurl: https://example.com/p1\ntitle: P1\n---\n\nChanged body\n", encoding='utf-8'
+        )
+        stitcher, output, expected = self.stitch(temp_dir)
+
+        assert stitcher.stitch_stats['sections_rendered'] == 1
+        assert stitcher.stitch_stats['sections_reused'] == 4
+        assert output.read_text(encoding='utf-8') == expected
+        assert "Changed body" in expected
+
+    def test_edited_output_invalidates_manifest(self, temp_dir):
+        """Test that a document changed since the manifest was written is rebuilt in full."""
+        _, output, _ = self.stitch(temp_dir)
+        with open(output, 'a', encoding='utf-8') as f:
+            f.write("edited by hand\n")
+
+        stitcher, output, expected = self.stitch(temp_dir)
+
+        assert stitcher.stitch_stats['sections_reused'] == 0
+        assert output.read_text(encoding='utf-8') == expected
+        assert not (temp_dir / "stitched_document.md.tmp").exists()
+
+    def test_crlf_pages_are_normalized(self, temp_dir):
+        """Test that \r\n line endings in saved pages become \n, as with a text-mode read."""
+        (temp_dir / "p0.md").write_bytes(
+            b"---\r\nurl: https://example.com/p0\r\ntitle: P0\r\n---\r\n\r\n# P0\r\n\r\nLine one\r\nLine two\r\n"
+        )
+
+        _, output, expected = self.stitch(temp_dir)
+
+        assert b"\r" not in output.read_bytes()
+        assert "# P0\n\nLine one\nLine two\n" in expected
+
+    def test_failed_stitch_leaves_no_temp_file(self, temp_dir):
+        """Test that the temporary output is removed when rendering fails."""
+        stitcher = DocumentStitcher(temp_dir, aliases={})
+        stitcher.load_content()
+
+        with patch.object(DocumentStitcher, '_iter_page_section', side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                stitcher.write_stitched_document(stitcher.pages, [])
+
+        assert not (temp_dir / "stitched_document.md.tmp").exists()
+        assert not (temp_dir / "stitched_document.md").exists()
+
+    def test_default_entry_point_reuses_sections(self, temp_dir):
+        """Test that stitch_crawled_content re-stitches incrementally by default."""
+        stitchers = []
+
+        def track(*args, **kwargs):
+            stitchers.append(DocumentStitcher(*args, **kwargs))
+            return stitchers[-1]
+
+        ordered = nav(*[f"https://example.com/p{i}" for i in range(5)])
+        with patch('crawlers.document_stitcher.DocumentStitcher', side_effect=track), patch('builtins.print'):
+            first = stitch_crawled_content(str(temp_dir), ordered_urls=ordered)
+            (temp_dir / "p2.md").write_text(
+                "---\nurl: https://example.com/p2\ntitle: P2\n---\n\nNew text\n", encoding='utf-8'
+            )
+            second = stitch_crawled_content(str(temp_dir), ordered_urls=ordered)
+
+        assert first == second
+        assert stitchers[1].stitch_stats['sections_reused'] > 0
+        assert stitchers[1].stitch_stats['sections_rendered'] == 1
+        assert "New text" in second.read_text(encoding='utf-8')
@@ -0,0 +1,181 @@
+"""
+Unit tests for FastOrderedCrawler module.
+
+Tests content extraction and crawl orchestration without launching a browser.
+"""
+
+import asyncio
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fast_ordered_crawler import FastOrderedCrawler
+
+
+LONG_TEXT = "This paragraph carries enough words to pass the content threshold. " * 3
+
+
+class TestFastOrderedCrawler:
+    """Test suite for FastOrderedCrawler class."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for test outputs."""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    @pytest.fixture
+    def crawler(self, temp_dir):
+        """Create a FastOrderedCrawler instance for testing."""
+        return FastOrderedCrawler(
+            root_url="https://example.com/docs",
+            output_dir=temp_dir,
+            show_progress=False
+        )
+
+    def test_invalid_extraction_mode(self, temp_dir):
+        """Test that unknown extraction modes are rejected."""
+        with pytest.raises(ValueError):
+            FastOrderedCrawler("https://example.com", output_dir=temp_dir, extraction_mode="bogus")
+
+    def test_select_main_content_prefers_main(self, crawler):
+        """Test that the first matching selector with enough text wins."""
+        html = f"""
+        <html><body>
+            <nav>Navigation links</nav>
+            <main><h1>Guide</h1><p>{LONG_TEXT}</p></main>
+            <footer>Footer</footer>
+        </body></html>
+        """
+        content = crawler.select_main_content(html, "https://example.com/docs/guide")
+
+        assert content is not None
+        assert "# Guide" in content
+        assert "Navigation links" not in content
+        assert "Footer" not in content
+
+    def test_select_main_content_falls_through_to_body(self, crawler):
+        """Test that short main content falls through the cascade."""
+        html = f"""
+        <html><body>
+            <main><p>Too short</p></main>
+            <div><p>{LONG_TEXT}</p></div>
+            <script>var tracking = true;</script>
+        </body></html>
+        """
+        content = crawler.select_main_content(html, "https://example.com/docs/guide")
+
+        assert content is not None
+        assert "content threshold" in content
+        assert "tracking" not in content
+
+    def test_select_main_content_skips_nested_matches(self, crawler):
+        """Test that nested matches are not extracted twice."""
+        html = f"<html><body><main><article><p>{LONG_TEXT}</p></article></main></body></html>"
+        content = crawler.select_main_content(html, "https://example.com/docs")
+
+        assert content.count("content threshold") == 3
+
+    @pytest.mark.asyncio
+    async def test_fetch_once_uses_single_navigation(self, crawler):
+        """Test that fetch_once mode loads the page exactly once."""
+        result = Mock()
+        result.success = True
+        result.html = "<html><body><p>Short</p></body></html>"
+        result.markdown = "Short"
+
+        browser = Mock()
+        browser.arun = AsyncMock(return_value=result)
+
+        content = await crawler._crawl_fetch_once(browser, "https://example.com/docs")
+
+        assert browser.arun.await_count == 1
+        assert content == "Short"
+
+    @pytest.mark.asyncio
+    async def test_crawl_all_concurrent_consumes_stream(self, crawler):
+        """Test that streamed URLs are crawled with their discovered depth."""
+        async def stream():
+            yield "https://example.com/docs", 0
+            yield "https://example.com/docs/a", 1
+            yield "https://example.com/docs/a/b", 2
+
+        seen = {}
+
+        async def fake_process_url(url, depth, semaphore):
+            seen[url] = depth
+            return True
+
+        with patch.object(crawler, 'process_url', side_effect=fake_process_url):
+            stats = await crawler.crawl_all_concurrent(stream())
+
+        assert stats['total_urls'] == 3
+        assert stats['successful'] == 3
+        assert seen["https://example.com/docs/a/b"] == 2
+
+    @pytest.mark.asyncio
+    async def test_crawl_frontier_follows_crawled_links(self, crawler):
+        """Test that links found while crawling are queued with depth and parent."""
+        site = {
+            "https://example.com/docs": ["https://example.com/docs/a", "https://example.com/blog"],
+            "https://example.com/docs/a": ["https://example.com/docs/a/b", "https://example.com/docs"],
+            "https://example.com/docs/a/b": ["https://example.com/docs/a/b/c"],
+        }
+        seen = {}
+        # Every page shares the same body; keep them all as separate files
+        crawler.duplicates = None
+
+        async def fake_crawl(url, depth=0):
+            crawler.page_links[url] = site.get(url, [])
+            return f"# Page\n\n{LONG_TEXT}"
+
+        with patch.object(crawler, 'crawl_with_optimized_selector', side_effect=fake_crawl):
+            original = crawler.process_url
+
+            async def spy(url, depth, semaphore, parent=None):
+                seen[url] = (depth, parent)
+                return await original(url, depth, semaphore, parent)
+
+            with patch.object(crawler, 'process_url', side_effect=spy):
+                stats = await crawler.crawl_frontier()
+
+        assert stats['total_urls'] == 3
+        assert stats['successful'] == 3
+        assert seen["https://example.com/docs/a/b"] == (2, "https://example.com/docs/a")
+        assert "https://example.com/blog" not in seen
+        assert "https://example.com/docs/a/b/c" not in seen
+
+        saved = (crawler.content_dir / crawler.sanitize_filename("https://example.com/docs/a", 1)).read_text()
+        assert "parent: https://example.com/docs\n" in saved
+
+    @pytest.mark.asyncio
+    async def test_crawl_all_concurrent_records_in_completion_order(self, crawler):
+        """Test that a slow page does not hold back results queued behind it."""
+        finished = []
+
+        async def fake_process_url(url, depth, semaphore):
+            if url.endswith("slow"):
+                await asyncio.sleep(0.05)
+            finished.append(url)
+            return True
+
+        updates = []
+        crawler.progress_tracker = Mock()
+        crawler.progress_tracker.update_task.side_effect = (
+            lambda name, **kwargs: updates.append(kwargs['current_item'])
+        )
+
+        with patch.object(crawler, 'process_url', side_effect=fake_process_url):
+            stats = await crawler.crawl_all_concurrent([
+                "https://example.com/docs/slow",
+                "https://example.com/docs/fast",
+            ])
+
+        assert stats['successful'] == 2
+        assert updates[0] == "Processed: https://example.com/docs/fast"
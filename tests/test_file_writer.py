@@ -0,0 +1,93 @@
+"""
+Unit tests for FileWriter module.
+
+Tests background writing, flushing, and error reporting.
+"""
+
+import asyncio
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawlers.file_writer import FileWriter
+
+
+class TestFileWriter:
+    """Test suite for FileWriter class."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for test outputs."""
+        temp_dir = tempfile.mkdtemp()
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir)
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_all_files(self, temp_dir):
+        """Test that queued documents are on disk after flush()."""
+        writer = FileWriter(max_pending=2)
+        for i in range(5):
+            await writer.write(temp_dir / f"page{i}.md", f"content {i}")
+        await writer.flush()
+
+        assert writer.stats == {'written': 5, 'failed': 0}
+        assert (temp_dir / "page4.md").read_text(encoding='utf-8') == "content 4"
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_write_errors_are_recorded(self, temp_dir):
+        """Test that a failed write is counted instead of stopping the writer."""
+        writer = FileWriter()
+        await writer.write(temp_dir / "missing" / "page.md", "lost")
+        await writer.write(temp_dir / "page.md", "kept")
+        await writer.close()
+
+        assert writer.stats == {'written': 1, 'failed': 1}
+        assert writer.errors[0][0].endswith("page.md")
+        assert (temp_dir / "page.md").exists()
+
+    @pytest.mark.asyncio
+    async def test_defer_runs_after_earlier_writes(self, temp_dir):
+        """Test that a deferred callback runs in queue order without writing a file."""
+        writer = FileWriter()
+        events = []
+        await writer.write(temp_dir / "page.md", "content", on_written=lambda: events.append("written"))
+        await writer.defer(lambda: events.append("deferred"))
+        events.append("queued")
+        await writer.close()
+
+        assert events == ["queued", "written", "deferred"]
+        assert writer.stats == {'written': 1, 'failed': 0}
+
+    @pytest.mark.asyncio
+    async def test_restarted_consumer_drains_existing_queue(self, temp_dir):
+        """Test that documents queued for a stopped consumer are still written."""
+        writer = FileWriter()
+        await writer.write(temp_dir / "first.md", "first")
+        writer._consumer.cancel()
+        await asyncio.gather(writer._consumer, return_exceptions=True)
+
+        await writer.write(temp_dir / "second.md", "second")
+        await writer.close()
+
+        assert (temp_dir / "first.md").read_text(encoding='utf-8') == "first"
+        assert (temp_dir / "second.md").read_text(encoding='utf-8') == "second"
+
+    @pytest.mark.asyncio
+    async def test_consumer_failure_is_raised(self, temp_dir):
+        """Test that an unexpected consumer error is surfaced instead of dropping writes."""
+        writer = FileWriter()
+        with patch.object(FileWriter, '_write_file', side_effect=TypeError("bad content")):
+            await writer.write(temp_dir / "page.md", "content")
+            await asyncio.sleep(0.05)
+
+        with pytest.raises(RuntimeError) as excinfo:
+            await writer.write(temp_dir / "other.md", "other")
+        assert isinstance(excinfo.value.__cause__, TypeError)
+        with pytest.raises(RuntimeError):
+            await writer.close()
@@ -0,0 +1,57 @@
+"""
+Unit tests for FilenameRegistry module.
+
+Tests in-memory unique name allocation seeded from the output directory.
+"""
+
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawlers.filename_registry import FilenameRegistry
+
+
+class TestFilenameRegistry:
+    """Test suite for FilenameRegistry class."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary output directory."""
+        temp_dir = tempfile.mkdtemp()
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir)
+
+    def test_suffixes_without_touching_disk(self, temp_dir):
+        """Test that repeated names get increasing suffixes and no stat calls."""
+        registry = FilenameRegistry(temp_dir)
+        path = temp_dir / "depth1_page.md"
+
+        with patch.object(Path, 'exists', side_effect=AssertionError("probed disk")):
+            names = [registry.allocate(path).name for _ in range(4)]
+
+        assert names == ["depth1_page.md", "depth1_page_1.md", "depth1_page_2.md", "depth1_page_3.md"]
+        assert len(registry) == 4
+
+    def test_existing_files_are_registered(self, temp_dir):
+        """Test that names left by an earlier run are not reused."""
+        (temp_dir / "depth0_index.md").write_text("old")
+        (temp_dir / "depth0_index_1.md").write_text("old")
+
+        registry = FilenameRegistry(temp_dir)
+
+        assert temp_dir / "depth0_index.md" in registry
+        assert registry.allocate(temp_dir / "depth0_index.md").name == "depth0_index_2.md"
+
+    def test_suffixed_name_requested_directly(self, temp_dir):
+        """Test that a preferred name equal to a handed-out suffix is not duplicated."""
+        registry = FilenameRegistry(temp_dir)
+        registry.allocate(temp_dir / "a.md")
+        registry.allocate(temp_dir / "a.md")
+
+        assert registry.allocate(temp_dir / "a_1.md").name == "a_1_1.md"
+        assert registry.allocate(temp_dir / "a.md").name == "a_2.md"
@@ -0,0 +1,65 @@
+"""
+Unit tests for CrawlFrontier module.
+
+Tests ordering, deduplication, and depth bounds of the crawl frontier.
+"""
+
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawlers.frontier import CrawlFrontier
+
+
+class TestCrawlFrontier:
+    """Test suite for CrawlFrontier class."""
+
+    @pytest.mark.asyncio
+    async def test_shallowest_url_first(self):
+        """Test that entries come out by depth, then in discovery order."""
+        frontier = CrawlFrontier(max_depth=3)
+        frontier.put("https://example.com/deep", 2)
+        frontier.put("https://example.com/a", 1)
+        frontier.put("https://example.com/b", 1)
+        frontier.put("https://example.com", 0)
+
+        order = [(await frontier.get()).url for _ in range(4)]
+
+        assert order == [
+            "https://example.com",
+            "https://example.com/a",
+            "https://example.com/b",
+            "https://example.com/deep",
+        ]
+
+    def test_deduplicates_normalized_urls(self):
+        """Test that fragments and trailing slashes do not create duplicates."""
+        frontier = CrawlFrontier(max_depth=2)
+
+        assert frontier.put("https://example.com/docs/", 0)
+        assert not frontier.put("https://example.com/docs#intro", 1)
+        assert frontier.pending == 1
+
+    @pytest.mark.asyncio
+    async def test_put_links_tracks_depth_and_parent(self):
+        """Test that links are queued one level below their parent page."""
+        frontier = CrawlFrontier(max_depth=1)
+        frontier.put("https://example.com", 0)
+        root = await frontier.get()
+
+        assert frontier.put_links(["https://example.com/a"], root) == 1
+        child = await frontier.get()
+
+        assert child.depth == 1
+        assert child.parent == "https://example.com"
+        assert frontier.put_links(["https://example.com/a/b"], child) == 0
+
+    def test_url_filter_skips_out_of_scope_links(self):
+        """Test that the filter applies to discovered links but not the seed."""
+        frontier = CrawlFrontier(max_depth=2, url_filter=lambda url: "/docs" in url)
+
+        assert frontier.put("https://example.com", 0)
+        assert not frontier.put("https://example.com/blog", 1)
+        assert frontier.put("https://example.com/docs/a", 1)
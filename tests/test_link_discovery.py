@@ -0,0 +1,89 @@
+"""
+Unit tests for LinkDiscovery module.
+
+Tests anchor parsing, discovery scoping and breadth-first streaming.
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawlers.link_discovery import AnchorParser, LinkDiscovery
+
+
+class TestAnchorParser:
+    """Test suite for AnchorParser class."""
+
+    def test_collects_anchors_across_chunks(self):
+        """Test that anchors split across feed() calls are parsed."""
+        parser = AnchorParser("https://example.com/docs/")
+        parser.feed('<p>Intro</p><a hr')
+        parser.feed('ef="guide">Guide</a><a href="#top">Top</a>')
+        parser.feed('<a href="mailto:x@example.com">Mail</a><a href="/docs/api">API</a>')
+        parser.close()
+
+        assert parser.pop_links() == [
+            "https://example.com/docs/guide",
+            "https://example.com/docs/api"
+        ]
+        assert parser.pop_links() == []
+
+    def test_respects_base_tag(self):
+        """Test that <base href> changes link resolution."""
+        parser = AnchorParser("https://example.com/a/b")
+        parser.feed('<base href="https://example.com/root/"><a href="page">Page</a>')
+        assert parser.pop_links() == ["https://example.com/root/page"]
+
+
+class TestLinkDiscovery:
+    """Test suite for LinkDiscovery class."""
+
+    @pytest.fixture
+    def discovery(self):
+        """Create a LinkDiscovery instance for testing."""
+        return LinkDiscovery(
+            root_url="https://example.com/docs/",
+            max_depth=2,
+            exclude_patterns=["/private"]
+        )
+
+    def test_in_scope(self, discovery):
+        """Test URL scoping rules."""
+        assert discovery.in_scope("https://example.com/docs/guide")
+        assert discovery.in_scope("https://example.com/docs")
+        assert not discovery.in_scope("https://example.com/docsearch")
+        assert not discovery.in_scope("https://example.com/blog")
+        assert not discovery.in_scope("https://other.com/docs/guide")
+        assert not discovery.in_scope("https://example.com/docs/private/page")
+        assert not discovery.in_scope("https://example.com/docs/manual.pdf")
+
+    @pytest.mark.asyncio
+    async def test_discover_breadth_first_with_depth(self, discovery):
+        """Test that discovery yields URLs with depth and stops at max_depth."""
+        site = {
+            "https://example.com/docs": ["https://example.com/docs/a", "https://example.com/docs/b"],
+            "https://example.com/docs/a": ["https://example.com/docs/a/deep", "https://example.com/docs"],
+            "https://example.com/docs/b": [],
+            "https://example.com/docs/a/deep": ["https://example.com/docs/a/deeper"],
+        }
+        fetched = []
+
+        async def fake_extract_links(url):
+            fetched.append(url)
+            return site.get(url, [])
+
+        with patch.object(discovery, 'extract_links', side_effect=fake_extract_links):
+            found = [item async for item in discovery.discover()]
+
+        assert found[0] == ("https://example.com/docs", 0)
+        assert dict(found) == {
+            "https://example.com/docs": 0,
+            "https://example.com/docs/a": 1,
+            "https://example.com/docs/b": 1,
+            "https://example.com/docs/a/deep": 2,
+        }
+        # Pages at max_depth are never downloaded for links
+        assert "https://example.com/docs/a/deep" not in fetched
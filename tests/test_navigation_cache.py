@@ -0,0 +1,100 @@
+"""
+Unit tests for NavigationCache module.
+
+Tests tree persistence, TTL expiry, structural fingerprints, and skipping
+the browser for unchanged sites.
+"""
+
+import pytest
+import tempfile
+import shutil
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawlers.navigation_cache import NavigationCache
+from crawlers.navigation_extractor import NavigationExtractor, NavigationNode
+
+
+BASE_URL = "https://example.com/docs"
+NAV_HTML = """<html><head><meta name="csrf" content="{token}"></head><body>
+<nav><ul><li><a href="/docs/intro">Intro</a><li><a href="/docs/setup">Setup</a>
+<ul><li><a href="/docs/setup/linux">Linux</a></ul></ul></nav>
+<main><p>Body {token}<a href="/docs/other">Other</a></main></body></html>"""
+
+
+def make_tree():
+    root = NavigationNode(title="Navigation (nav)", url="", level=-1, order=0)
+    intro = NavigationNode(title="Intro", url="https://example.com/docs/intro", level=1, order=0, parent=root)
+    setup = NavigationNode(title="Setup", url="https://example.com/docs/setup", level=1, order=1, parent=root)
+    linux = NavigationNode(title="Linux", url="https://example.com/docs/setup/linux", level=2, order=2, parent=setup)
+    setup.children.append(linux)
+    root.children.extend([intro, setup])
+    return root
+
+
+class TestNavigationCache:
+    """Test suite for NavigationCache class."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for the cache."""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    def test_round_trip(self, temp_dir):
+        """Test that a stored tree is restored with parents linked."""
+        cache = NavigationCache(temp_dir)
+        cache.store(BASE_URL, make_tree(), "abc")
+
+        tree = cache.load(BASE_URL, "abc")
+
+        assert tree.to_dict() == make_tree().to_dict()
+        assert tree.children[1].children[0].parent is tree.children[1]
+
+    def test_changed_fingerprint_or_expired_ttl_misses(self, temp_dir):
+        """Test that structure changes and stale entries are not reused."""
+        cache = NavigationCache(temp_dir, ttl=60)
+        cache.store(BASE_URL, make_tree(), "abc")
+
+        assert cache.load(BASE_URL, "def") is None
+        assert cache.load(BASE_URL) is not None
+
+        with patch('crawlers.navigation_cache.time.time', return_value=time.time() + 120):
+            assert cache.load(BASE_URL, "abc") is None
+
+    def test_fingerprint_ignores_volatile_markup(self):
+        """Test that only the navigation link structure is fingerprinted."""
+        first = NavigationCache.fingerprint(NAV_HTML.format(token="1234"))
+        second = NavigationCache.fingerprint(NAV_HTML.format(token="5678"))
+        moved = NavigationCache.fingerprint(
+            NAV_HTML.format(token="1234").replace('<a href="/docs/setup/linux">', '<a href="/docs/linux">')
+        )
+
+        assert first == second
+        assert first != moved
+
+    @pytest.mark.asyncio
+    async def test_extractor_skips_browser_when_unchanged(self, temp_dir):
+        """Test that a cached tree with a matching fingerprint avoids Playwright."""
+        cache = NavigationCache(temp_dir)
+        fingerprint = NavigationCache.fingerprint(NAV_HTML.format(token="1"))
+        cache.store(BASE_URL, make_tree(), fingerprint)
+
+        extractor = NavigationExtractor(BASE_URL, cache=cache)
+        with patch.object(extractor, '_fetch_fingerprint', AsyncMock(return_value=fingerprint)), \
+                patch('crawlers.navigation_extractor.async_playwright') as playwright:
+            tree = await extractor.extract()
+
+        playwright.assert_not_called()
+        assert extractor.from_cache
+        assert [url['url'] for url in extractor.get_ordered_urls()] == [
+            "https://example.com/docs/intro",
+            "https://example.com/docs/setup",
+            "https://example.com/docs/setup/linux",
+        ]
+        assert tree.children[0].title == "Intro"
@@ -0,0 +1,146 @@
+"""
+Unit tests for NavigationExtractor module.
+
+Tests single-roundtrip extraction and navigation tree building without a browser.
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawlers.navigation_extractor import NavigationExtractor
+
+
+CANDIDATE = {
+    'selector': 'nav[aria-label*="main"]',
+    'score': 20,
+    'links': [
+        {'text': 'Docs', 'href': '/docs', 'level': 1, 'order': 0},
+        {'text': 'A', 'href': '/docs/a', 'level': 2, 'order': 1},
+        {'text': '', 'href': '/docs/b/', 'level': 2, 'order': 2},
+        {'text': 'External', 'href': 'https://other.com/x', 'level': 1, 'order': 3},
+        {'text': 'Blog', 'href': '/blog#top', 'level': 1, 'order': 4},
+    ]
+}
+
+
+class TestNavigationExtractor:
+    """Test suite for NavigationExtractor class."""
+
+    @pytest.fixture
+    def extractor(self):
+        """Create a NavigationExtractor instance for testing."""
+        return NavigationExtractor("https://example.com")
+
+    @pytest.mark.asyncio
+    async def test_extraction_is_a_single_evaluate(self, extractor):
+        """Test that all strategies run in one page.evaluate call."""
+        page = Mock()
+        page.evaluate = AsyncMock(return_value=CANDIDATE)
+        page.query_selector = AsyncMock()
+
+        tree = await extractor._extract_in_page(page)
+
+        assert page.evaluate.await_count == 1
+        assert page.query_selector.await_count == 0
+        script, selectors = page.evaluate.await_args.args
+        assert script == NavigationExtractor.EXTRACTION_SCRIPT
+        assert selectors['priority'] == NavigationExtractor.PRIORITY_SELECTORS
+        assert tree.title == 'Navigation (nav[aria-label*="main"])'
+
+    def test_build_tree_nests_by_level(self, extractor):
+        """Test that nested links become children and external links are dropped."""
+        tree = extractor._build_tree(CANDIDATE)
+
+        assert [child.title for child in tree.children] == ['Docs', 'Blog']
+        docs = tree.children[0]
+        assert [child.url for child in docs.children] == [
+            "https://example.com/docs/a",
+            "https://example.com/docs/b",
+        ]
+        assert docs.children[1].title == "Page 3"
+        assert tree.children[1].url == "https://example.com/blog"
+
+    @pytest.mark.asyncio
+    async def test_no_candidate(self, extractor):
+        """Test that pages without internal navigation yield None."""
+        page = Mock()
+        page.evaluate = AsyncMock(return_value=None)
+
+        assert await extractor._extract_in_page(page) is None
+        assert extractor._build_tree({'selector': 'nav', 'links': [
+            {'text': 'X', 'href': 'https://other.com', 'level': 0, 'order': 0}
+        ]}) is None
+
+
+def reference_positions(root):
+    """The original recursive search: pre-order position and breadcrumb."""
+    found = {}
+    position = [0]
+
+    def visit(node, path):
+        if node.url and node.url not in found:
+            found[node.url] = (position[0], path + [node.title])
+        for child in node.children:
+            position[0] += 1
+            visit(child, path + [node.title] if node.title else path)
+
+    visit(root, [])
+    return found
+
+
+class TestNavigationIndex:
+    """Test the flattened navigation index."""
+
+    @pytest.fixture
+    def extractor(self):
+        """Create an extractor with a nested navigation tree."""
+        extractor = NavigationExtractor("https://example.com")
+        extractor.navigation_tree = extractor._build_tree({
+            'selector': 'nav',
+            'links': [
+                {'text': 'Docs', 'href': '/docs', 'level': 1, 'order': 0},
+                {'text': 'A', 'href': '/docs/a', 'level': 2, 'order': 1},
+                {'text': 'Deep', 'href': '/docs/a/deep', 'level': 3, 'order': 2},
+                {'text': 'B', 'href': '/docs/b', 'level': 2, 'order': 3},
+                {'text': 'Blog', 'href': '/blog', 'level': 1, 'order': 4},
+                {'text': 'A again', 'href': '/docs/a', 'level': 1, 'order': 5},
+            ]
+        })
+        return extractor
+
+    def test_find_position_matches_tree_search(self, extractor):
+        """Test that indexed lookups agree with a full tree walk."""
+        expected = reference_positions(extractor.navigation_tree)
+
+        for url, (position, breadcrumb) in expected.items():
+            assert extractor.find_position(url + "/") == (position, breadcrumb)
+        assert extractor.find_position("https://example.com/missing") is None
+        assert extractor.find_position("https://example.com/docs/a/deep")[1] == [
+            "Navigation (nav)", "Docs", "A", "Deep"
+        ]
+
+    def test_ordered_urls(self, extractor):
+        """Test navigation order, duplicates, and breadcrumbs."""
+        ordered = extractor.get_ordered_urls()
+
+        assert [item['title'] for item in ordered] == ['Docs', 'A', 'Deep', 'B', 'Blog', 'A again']
+        assert [item['order'] for item in ordered] == list(range(6))
+        assert ordered[3]['breadcrumb'] == ["Navigation (nav)", "Docs", "B"]
+        assert ordered[3]['level'] == 2
+
+    def test_index_follows_replaced_tree(self, extractor):
+        """Test that assigning a new tree rebuilds the index."""
+        assert len(extractor.get_ordered_urls()) == 6
+
+        extractor.navigation_tree = extractor._build_tree({'selector': 'nav', 'links': [
+            {'text': 'Only', 'href': '/only', 'level': 0, 'order': 0}
+        ]})
+
+        assert [item['url'] for item in extractor.get_ordered_urls()] == ["https://example.com/only"]
+        extractor.navigation_tree = None
+        assert extractor.get_ordered_urls() == []
+        assert extractor.find_position("https://example.com/only") is None
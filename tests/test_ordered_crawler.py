@@ -0,0 +1,158 @@
+"""
+Unit tests for OrderedCrawler module.
+
+Tests that navigation extraction overlaps content crawling and that
+navigation URLs seed the crawl.
+"""
+
+import asyncio
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawlers.depth_crawler import DepthCrawler
+from crawlers.navigation_extractor import NavigationExtractor
+from crawlers.ordered_crawler import OrderedCrawler
+
+
+NAV_LINKS = {
+    'selector': 'nav',
+    'links': [
+        {'text': 'Intro', 'href': '/docs/intro', 'level': 1, 'order': 0},
+        {'text': 'Linux', 'href': '/docs/setup/linux', 'level': 2, 'order': 1},
+        {'text': 'Blog', 'href': '/blog', 'level': 1, 'order': 2},
+    ]
+}
+
+
+class TestSeedUrls:
+    """Test queuing URLs into a depth crawl from outside."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for test outputs."""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    def test_seeds_queued_at_path_depth(self, temp_dir):
+        """Test that seeds use their path depth and skip known URLs."""
+        crawler = DepthCrawler("https://example.com/docs", max_depth=2, output_dir=temp_dir)
+        crawler.visited_urls.add("https://example.com/docs/done")
+
+        added = crawler.add_seed_urls([
+            "https://example.com/docs/intro/",
+            "https://example.com/docs/intro#top",
+            "https://example.com/docs/setup/linux",
+            "https://example.com/docs/a/b/c",
+            "https://example.com/docs/done",
+            "https://other.com/docs/intro",
+        ])
+        crawler.journal.close()
+
+        assert added == 2
+        assert crawler.seed_urls == {
+            1: {"https://example.com/docs/intro"},
+            2: {"https://example.com/docs/setup/linux"},
+        }
+
+    def test_late_seeds_go_to_next_level(self, temp_dir):
+        """Test that seeds for finished levels join the next level, or are dropped after the crawl."""
+        crawler = DepthCrawler("https://example.com/docs", max_depth=2, output_dir=temp_dir)
+
+        crawler.current_depth = 1
+        assert crawler.add_seed_urls(["https://example.com/docs/intro"]) == 1
+        assert crawler.seed_urls == {2: {"https://example.com/docs/intro"}}
+
+        crawler.current_depth = crawler.max_depth + 1
+        assert crawler.add_seed_urls(["https://example.com/docs/other"]) == 0
+        crawler.journal.close()
+
+
+class TestOrderedCrawler:
+    """Test suite for OrderedCrawler class."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for test outputs."""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    @pytest.mark.asyncio
+    async def test_navigation_overlaps_crawl_and_seeds_it(self, temp_dir):
+        """Test that both stages run at once and navigation URLs reach the crawler."""
+        crawl_started = asyncio.Event()
+        seen_seeds = {}
+
+        async def fake_extract(extractor):
+            # Only completes if the crawl is already running
+            await crawl_started.wait()
+            extractor.navigation_tree = extractor._build_tree(NAV_LINKS)
+            return extractor.navigation_tree
+
+        async def fake_crawl(crawler):
+            crawl_started.set()
+            while not crawler.seed_urls:
+                await asyncio.sleep(0)
+            seen_seeds.update(crawler.seed_urls)
+            return {'total_crawled': 3, 'successful': 3, 'failed': 0, 'files_created': []}
+
+        ordered = OrderedCrawler("https://example.com/docs", output_dir=temp_dir,
+                                 create_stitched=False, show_progress=False)
+        with patch.object(NavigationExtractor, 'extract', autospec=True, side_effect=fake_extract), \
+                patch.object(DepthCrawler, 'crawl', autospec=True, side_effect=fake_crawl):
+            results = await asyncio.wait_for(ordered.run(), timeout=5)
+
+        assert seen_seeds == {
+            1: {"https://example.com/docs/intro", "https://example.com/blog"},
+            2: {"https://example.com/docs/setup/linux"},
+        }
+        assert results['stages']['navigation']['pages_seeded'] == 3
+        assert results['stages']['crawling']['successful'] == 3
+        assert len(ordered.ordered_urls) == 3
+
+    @pytest.mark.asyncio
+    async def test_crawl_failure_still_joins_navigation(self, temp_dir):
+        """Test that a failed crawl returns after navigation has finished."""
+        async def fake_extract(extractor):
+            await asyncio.sleep(0.01)
+            return None
+
+        async def failing_crawl(crawler):
+            raise RuntimeError("boom")
+
+        ordered = OrderedCrawler("https://example.com/docs", output_dir=temp_dir,
+                                 show_progress=False)
+        with patch.object(NavigationExtractor, 'extract', autospec=True, side_effect=fake_extract), \
+                patch.object(DepthCrawler, 'crawl', autospec=True, side_effect=failing_crawl):
+            results = await ordered.run()
+
+        assert results['stages']['crawling'] == {'success': False, 'error': 'boom'}
+        assert results['stages']['navigation']['success'] is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("ttl, cached", [(None, False), (3600, True)])
+    async def test_navigation_cache_is_opt_in(self, temp_dir, ttl, cached):
+        """Test that navigation is re-extracted every run unless a cache TTL is given."""
+        caches = []
+
+        async def fake_extract(extractor):
+            caches.append(extractor.cache)
+            return None
+
+        async def fake_crawl(crawler):
+            return {'total_crawled': 0, 'successful': 0, 'failed': 0, 'files_created': []}
+
+        ordered = OrderedCrawler("https://example.com/docs", output_dir=temp_dir, create_stitched=False,
+                                 show_progress=False, **({'nav_cache_ttl': ttl} if ttl else {}))
+        with patch.object(NavigationExtractor, 'extract', autospec=True, side_effect=fake_extract), \
+                patch.object(DepthCrawler, 'crawl', autospec=True, side_effect=fake_crawl):
+            await ordered.run()
+
+        assert (caches[0] is not None) == cached
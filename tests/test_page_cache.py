@@ -0,0 +1,109 @@
+"""
+Unit tests for PageCache module.
+
+Tests storage, conditional revalidation, and refresh policies.
+"""
+
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawlers.page_cache import PageCache
+from crawlers.tiered_fetcher import HttpResponse
+
+
+URL = "https://example.com/docs/guide"
+HTML = "<html><body><main>Guide</main></body></html>"
+
+
+class TestPageCache:
+    """Test suite for PageCache class."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for the cache."""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    @pytest.fixture
+    def cache(self, temp_dir):
+        """Create a PageCache with the default conditional policy."""
+        return PageCache(temp_dir)
+
+    def response(self, status=200, html=HTML, **headers):
+        return HttpResponse(url=URL, status=status, headers=headers, html=html)
+
+    def test_invalid_policy(self, temp_dir):
+        """Test that unknown refresh policies are rejected."""
+        with pytest.raises(ValueError):
+            PageCache(temp_dir, refresh="sometimes")
+
+    def test_store_and_lookup_by_normalized_url(self, cache):
+        """Test that entries round-trip and ignore fragments/trailing slashes."""
+        cache.store(URL + "/#intro", "# Guide", self.response(ETag='"v1"'), links=[URL + "/a"])
+        entry = cache.lookup(URL)
+
+        assert entry.markdown == "# Guide"
+        assert entry.etag == '"v1"'
+        assert entry.links == [URL + "/a"]
+        assert cache.request_headers(entry) == {'If-None-Match': '"v1"'}
+
+    def test_not_modified_is_unchanged(self, cache):
+        """Test that a 304 reuses the cached page."""
+        entry = cache.store(URL, "# Guide", self.response(**{'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}))
+        assert cache.is_unchanged(entry, self.response(status=304, html=None))
+
+    def test_same_body_is_unchanged(self, cache):
+        """Test that an identical body reuses the cached page without validators."""
+        entry = cache.store(URL, "# Guide", self.response())
+
+        assert cache.is_unchanged(entry, self.response())
+        assert not cache.is_unchanged(entry, self.response(html=HTML + "<p>new</p>"))
+
+    def test_refresh_always_ignores_cache(self, temp_dir):
+        """Test that the 'always' policy never returns cached pages."""
+        PageCache(temp_dir).store(URL, "# Guide")
+        assert PageCache(temp_dir, refresh="always").lookup(URL) is None
+
+    def test_refresh_never_serves_without_request(self, temp_dir):
+        """Test that the 'never' policy trusts cached pages."""
+        PageCache(temp_dir).store(URL, "# Guide")
+        cache = PageCache(temp_dir, refresh="never")
+        assert cache.serves_without_request(cache.lookup(URL))
+        assert not cache.serves_without_request(cache.lookup(URL + "/missing"))
+
+
+class TestFastOrderedCrawlerCache:
+    """Test FastOrderedCrawler's use of the page cache."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for test outputs."""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_page_skips_browser(self, temp_dir):
+        """Test that a 304 on recrawl reuses cached markdown."""
+        from fast_ordered_crawler import FastOrderedCrawler
+
+        crawler = FastOrderedCrawler(URL, output_dir=temp_dir, show_progress=False, refresh="conditional")
+        crawler.page_cache.store(URL, "# Cached", HttpResponse(URL, 200, {'ETag': '"v1"'}, HTML), links=[URL + "/a"])
+
+        not_modified = HttpResponse(URL, 304)
+        with patch.object(crawler.fetcher, 'fetch_response', AsyncMock(return_value=not_modified)) as fetch, \
+                patch.object(crawler, '_crawl_fetch_once', AsyncMock()) as render:
+            content = await crawler.crawl_with_optimized_selector(URL)
+
+        assert content == "# Cached"
+        assert fetch.await_args.args[1] == {'If-None-Match': '"v1"'}
+        render.assert_not_awaited()
+        assert crawler.page_links[URL] == [URL + "/a"]
+        assert crawler.fetcher.stats['cache'] == 1
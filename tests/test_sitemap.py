@@ -0,0 +1,188 @@
+"""
+Unit tests for SitemapReader module.
+
+Tests streaming sitemap parsing, index/robots.txt discovery, gzip, and
+lastmod-driven cache reuse.
+"""
+
+import gzip
+import pytest
+import tempfile
+import shutil
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawlers.page_cache import PageCache
+from crawlers.sitemap import SitemapReader, parse_lastmod, path_depth
+
+
+URLSET = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://example.com/docs/</loc><lastmod>2024-01-02</lastmod></url>
+  <url><loc>https://example.com/docs/guide/setup</loc><lastmod>2024-03-04T10:00:00Z</lastmod></url>
+  <url><loc>https://example.com/blog/post</loc></url>
+</urlset>"""
+
+INDEX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/sitemap-docs.xml.gz</loc></sitemap>
+</sitemapindex>"""
+
+
+def chunked(data, size=17):
+    async def stream():
+        for i in range(0, len(data), size):
+            yield data[i:i + size]
+    return stream()
+
+
+def fake_site(files):
+    def stream(url):
+        return chunked(files.get(url, b""))
+    return stream
+
+
+async def collect(generator):
+    return [item async for item in generator]
+
+
+class TestSitemapReader:
+    """Test suite for SitemapReader class."""
+
+    @pytest.mark.asyncio
+    async def test_parse_urlset_incrementally(self):
+        """Test that entries and lastmod dates are parsed from small chunks."""
+        reader = SitemapReader("https://example.com/docs")
+
+        items = await collect(reader.parse(chunked(URLSET)))
+
+        assert [kind for kind, _ in items] == ['url', 'url', 'url']
+        assert items[0][1].url == "https://example.com/docs"
+        assert items[0][1].lastmod == datetime(2024, 1, 2, tzinfo=timezone.utc)
+        assert items[1][1].lastmod == datetime(2024, 3, 4, 10, tzinfo=timezone.utc)
+        assert items[2][1].lastmod is None
+
+    @pytest.mark.asyncio
+    async def test_image_and_video_locs_are_ignored(self):
+        """Test that extension <loc> elements inside an entry do not replace the page URL."""
+        reader = SitemapReader("https://example.com/docs")
+        sitemap = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:image="http://www.google.com/schemas/sitemap-image/1.1"
+        xmlns:video="http://www.google.com/schemas/sitemap-video/1.1">
+  <url><loc>https://example.com/docs/page</loc><image:image><image:loc>https://example.com/img/a.png</image:loc></image:image></url>
+  <url><video:video><video:loc>https://example.com/v.mp4</video:loc></video:video><loc>https://example.com/docs/video</loc></url>
+</urlset>"""
+
+        items = await collect(reader.parse(chunked(sitemap)))
+
+        assert [entry.url for _, entry in items] == ["https://example.com/docs/page", "https://example.com/docs/video"]
+
+    @pytest.mark.asyncio
+    async def test_parse_gzipped_sitemap(self):
+        """Test that gzipped sitemaps are inflated while streaming."""
+        reader = SitemapReader("https://example.com/docs")
+
+        items = await collect(reader.parse(chunked(gzip.compress(URLSET))))
+
+        assert len(items) == 3
+
+    @pytest.mark.asyncio
+    async def test_robots_and_index_are_followed(self):
+        """Test discovery through robots.txt and a sitemap index."""
+        files = {
+            "https://example.com/robots.txt": b"User-agent: *\nSitemap: https://example.com/sitemap-index.xml\n",
+            "https://example.com/sitemap-index.xml": INDEX,
+            "https://example.com/sitemap-docs.xml.gz": gzip.compress(URLSET),
+        }
+        reader = SitemapReader("https://example.com/docs")
+
+        with patch.object(reader, '_stream', side_effect=fake_site(files)):
+            pages = await reader.read()
+
+        assert list(pages) == [
+            "https://example.com/docs",
+            "https://example.com/docs/guide/setup",
+            "https://example.com/blog/post",
+        ]
+        assert reader.stats == {'sitemaps': 2, 'urls': 3}
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_sitemap_xml(self):
+        """Test that /sitemap.xml is used without robots.txt entries."""
+        reader = SitemapReader("https://example.com/docs")
+
+        with patch.object(reader, '_stream', side_effect=fake_site({})):
+            assert await reader.discover() == ["https://example.com/sitemap.xml"]
+
+    @pytest.mark.asyncio
+    async def test_malformed_sitemap_is_skipped(self):
+        """Test that a non-XML response does not abort the crawl."""
+        files = {"https://example.com/sitemap.xml": b"<html><body>Not found"}
+        reader = SitemapReader("https://example.com/docs")
+
+        with patch.object(reader, '_stream', side_effect=fake_site(files)):
+            assert await reader.read() == {}
+
+    def test_parse_lastmod_and_path_depth(self):
+        """Test W3C datetime parsing and depth below the root path."""
+        assert parse_lastmod("2024-05-06T07:08:09+02:00").utcoffset() == timedelta(hours=2)
+        assert parse_lastmod("not a date") is None
+        assert parse_lastmod(None) is None
+
+        assert path_depth("https://example.com/docs", "https://example.com/docs") == 0
+        assert path_depth("https://example.com/docs/guide/setup", "https://example.com/docs") == 2
+
+
+class TestSitemapSeeding:
+    """Test sitemap seeding and lastmod cache reuse in the crawlers."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for test outputs."""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    def test_cache_served_when_unchanged_since_lastmod(self, temp_dir):
+        """Test that a page cached after its lastmod needs no request."""
+        cache = PageCache(temp_dir)
+        entry = cache.store("https://example.com/docs", "# Docs")
+        now = datetime.now(timezone.utc)
+
+        assert cache.serves_without_request(entry, now - timedelta(days=1))
+        assert not cache.serves_without_request(entry, now + timedelta(days=1))
+        assert not cache.serves_without_request(entry)
+
+    @pytest.mark.asyncio
+    async def test_fast_crawler_seeds_frontier(self, temp_dir):
+        """Test that in-scope sitemap URLs are queued at their path depth."""
+        from fast_ordered_crawler import FastOrderedCrawler
+
+        crawler = FastOrderedCrawler("https://example.com/docs", output_dir=temp_dir,
+                                     max_depth=2, show_progress=False)
+        frontier = crawler.create_frontier()
+        pages = {
+            "https://example.com/docs": None,
+            "https://example.com/docs/guide/setup": parse_lastmod("2024-03-04"),
+            "https://example.com/docs/a/b/c": None,
+            "https://example.com/blog/post": None,
+        }
+
+        with patch('fast_ordered_crawler.SitemapReader.read', AsyncMock(return_value=pages)):
+            added = await crawler.seed_from_sitemap(frontier)
+        crawler.journal.close()
+
+        assert added == 1
+        assert crawler.sitemap_lastmod["https://example.com/docs/guide/setup"] == pages[
+            "https://example.com/docs/guide/setup"]
+        assert "https://example.com/blog/post" not in crawler.sitemap_lastmod
+        entries = [await frontier.get() for _ in range(frontier.pending)]
+        assert [(e.url, e.depth) for e in entries] == [
+            ("https://example.com/docs", 0),
+            ("https://example.com/docs/guide/setup", 2),
+        ]
@@ -0,0 +1,87 @@
+"""
+Unit tests for TieredFetcher module.
+
+Tests the JavaScript-detection heuristic and HTTP-tier page conversion.
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from bs4 import BeautifulSoup
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawlers.tiered_fetcher import TieredFetcher, StaticPage
+
+
+STATIC_PAGE = """
+<html>
+<head>
+    <title>Install Guide</title>
+    <meta name="description" content="How to install">
+</head>
+<body>
+    <nav><a href="/docs/setup">Setup</a> <a href="https://other.com/x">Elsewhere</a></nav>
+    <main><h1>Install</h1><p>{text}</p></main>
+</body>
+</html>
+""".format(text="Server rendered documentation text. " * 10)
+
+
+class TestTieredFetcher:
+    """Test suite for TieredFetcher class."""
+
+    @pytest.fixture
+    def fetcher(self):
+        """Create a TieredFetcher instance for testing."""
+        return TieredFetcher()
+
+    def test_static_page_needs_no_browser(self, fetcher):
+        """Test that server-rendered content stays on the HTTP tier."""
+        soup = BeautifulSoup(STATIC_PAGE, "html.parser")
+        assert fetcher.needs_browser(soup) is None
+
+    def test_noscript_shell_needs_browser(self, fetcher):
+        """Test that a noscript warning on an empty page escalates."""
+        html = "<html><body><noscript>Please enable JavaScript</noscript><div></div></body></html>"
+        soup = BeautifulSoup(html, "html.parser")
+        assert fetcher.needs_browser(soup) == "noscript shell"
+
+    def test_spa_marker_needs_browser(self, fetcher):
+        """Test that an empty SPA mount point escalates."""
+        html = '<html><body><div id="root"></div><script src="/app.js"></script></body></html>'
+        soup = BeautifulSoup(html, "html.parser")
+        assert fetcher.needs_browser(soup).startswith("SPA marker")
+
+    def test_empty_main_content_needs_browser(self, fetcher):
+        """Test that pages without visible text escalate."""
+        soup = BeautifulSoup("<html><body><main></main></body></html>", "html.parser")
+        assert fetcher.needs_browser(soup) == "empty main content"
+
+    @pytest.mark.asyncio
+    async def test_fetch_static_page(self, fetcher):
+        """Test that a static page is converted with links and metadata."""
+        with patch.object(fetcher, 'fetch_html', AsyncMock(return_value=STATIC_PAGE)):
+            page = await fetcher.fetch("https://example.com/docs/install")
+
+        assert isinstance(page, StaticPage)
+        assert page.success
+        assert page.metadata['title'] == "Install Guide"
+        assert page.metadata['description'] == "How to install"
+        assert "# Install" in page.markdown
+        assert page.links['internal'][0]['href'] == "https://example.com/docs/setup"
+        assert page.links['external'][0]['href'] == "https://other.com/x"
+
+    @pytest.mark.asyncio
+    async def test_fetch_escalates_on_http_failure(self, fetcher):
+        """Test that failed downloads are left to the browser tier."""
+        with patch.object(fetcher, 'fetch_html', AsyncMock(return_value=None)):
+            assert await fetcher.fetch("https://example.com/missing") is None
+
+    def test_record_hit(self, fetcher):
+        """Test per-tier hit counting."""
+        fetcher.record_hit('http')
+        fetcher.record_hit('browser', 3)
+        assert fetcher.stats == {'http': 1, 'browser': 3}
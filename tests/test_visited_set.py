@@ -0,0 +1,203 @@
+"""
+Unit tests for the visited-set backends.
+
+Tests Bloom filter accuracy and growth, disk confirmation in the compact
+backend, and its use by the crawlers.
+"""
+
+import pytest
+import sqlite3
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawlers.frontier import CrawlFrontier
+from crawlers.visited_set import (
+    CompactVisitedSet, ExactVisitedSet, ScalableBloomFilter,
+    bytes_per_url, create_visited_set, url_hash
+)
+
+
+def urls(count, prefix="https://example.com/page"):
+    return [f"{prefix}/{i}" for i in range(count)]
+
+
+class TestScalableBloomFilter:
+    """Test suite for ScalableBloomFilter class."""
+
+    def test_no_false_negatives_and_bounded_false_positives(self):
+        """Test that added keys are always found and unseen keys rarely are."""
+        bloom = ScalableBloomFilter(initial_capacity=1000, error_rate=0.01)
+        for url in urls(5000):
+            bloom.add(url_hash(url))
+
+        assert all(url_hash(url) in bloom for url in urls(5000))
+        false_positives = sum(url_hash(url) in bloom for url in urls(20000, "https://other.com"))
+        assert false_positives / 20000 < 0.01
+        assert len(bloom.filters) > 1
+
+    def test_invalid_error_rate(self):
+        """Test that the error rate must be a probability."""
+        with pytest.raises(ValueError):
+            ScalableBloomFilter(error_rate=1.5)
+
+
+class TestVisitedSets:
+    """Test the exact and compact visited-set backends."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for on-disk stores."""
+        temp_dir = tempfile.mkdtemp()
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir)
+
+    def test_compact_matches_exact(self, temp_dir):
+        """Test that both backends agree on membership and size."""
+        exact = ExactVisitedSet()
+        compact = CompactVisitedSet(temp_dir / "visited.sqlite", initial_capacity=100)
+        for url in urls(500) + urls(100):
+            exact.add(url)
+            compact.add(url)
+
+        assert len(exact) == len(compact) == 500
+        assert all(url in compact for url in urls(500))
+        assert "https://example.com/page/500" not in compact
+        assert sorted(compact) == sorted(exact)
+        compact.close()
+
+    def test_bloom_maybe_is_confirmed_on_disk(self, temp_dir):
+        """Test that a Bloom false positive is refuted by the exact store."""
+        compact = CompactVisitedSet(temp_dir / "visited.sqlite")
+        compact.add("https://example.com/a")
+
+        with patch.object(ScalableBloomFilter, '__contains__', return_value=True):
+            assert "https://example.com/b" not in compact
+
+        assert compact.stats == {'disk_lookups': 1, 'false_positives': 1}
+        compact.close()
+
+    def test_compact_uses_less_memory_per_url(self, temp_dir):
+        """Test that the compact backend reports a small per-URL footprint."""
+        exact = create_visited_set('exact')
+        compact = create_visited_set('compact', temp_dir / "visited.sqlite")
+        exact.update(urls(20000))
+        compact.update(urls(20000))
+
+        assert bytes_per_url(compact) < 8
+        assert bytes_per_url(exact) > 10 * bytes_per_url(compact)
+        assert bytes_per_url(create_visited_set('exact')) == 0.0
+        compact.close()
+
+    def test_factory_validates_backend(self):
+        """Test that unknown backends and missing store paths are rejected."""
+        with pytest.raises(ValueError):
+            create_visited_set('bloom')
+        with pytest.raises(ValueError):
+            create_visited_set('compact')
+
+    def test_frontier_with_compact_seen(self, temp_dir):
+        """Test that the frontier deduplicates through a compact store."""
+        frontier = CrawlFrontier(max_depth=2, seen=CompactVisitedSet(temp_dir / "queued.sqlite"))
+
+        assert frontier.put("https://example.com/a", 1)
+        assert not frontier.put("https://example.com/a/", 1)
+        assert frontier.pending == 1
+
+    def test_depth_crawler_compact_summary(self, temp_dir):
+        """Test that the summary reports the backend and resolves URLs from saved files."""
+        from crawlers.depth_crawler import DepthCrawler
+
+        crawler = DepthCrawler("https://example.com", output_dir=str(temp_dir), visited_backend='compact')
+        filepath = crawler._save_markdown("https://example.com/page", "Content", 0, {'title': 'Page'})
+        crawler.visited_urls.add("https://example.com/page")
+
+        assert crawler.url_to_filepath == {}
+        crawler._generate_summary({
+            'total_crawled': 1, 'successful': 1, 'failed': 0,
+            'files_created': [str(filepath)], 'errors': [],
+            'visited_backend': 'compact', 'visited_bytes_per_url': bytes_per_url(crawler.visited_urls)
+        })
+        crawler.journal.close()
+
+        summary = (temp_dir / "crawl_summary.md").read_text()
+        assert "- Visited Set: compact" in summary
+        assert f"({filepath.name}) - https://example.com/page" in summary
+
+    @pytest.mark.asyncio
+    async def test_fast_crawler_reports_and_closes_compact_stores(self, temp_dir):
+        """Test that crawl() reports the visited set and closes both stores."""
+        from fast_ordered_crawler import FastOrderedCrawler
+
+        crawler = FastOrderedCrawler("https://example.com/docs", output_dir=str(temp_dir),
+                                     show_progress=False, visited_backend='compact')
+        frontiers = []
+        create_frontier = crawler.create_frontier
+
+        def track_frontier():
+            frontiers.append(create_frontier())
+            return frontiers[-1]
+
+        async def succeed(url, depth, semaphore, parent=None):
+            crawler.processed_urls.add(url)
+            return True
+
+        with patch.object(crawler, 'create_frontier', side_effect=track_frontier), \
+                patch.object(crawler, 'process_url', side_effect=succeed), \
+                patch.object(crawler, 'create_summary_document', return_value=temp_dir / "summary.md"):
+            stats = await crawler.crawl()
+
+        assert stats['visited_backend'] == 'compact'
+        assert stats['visited_bytes_per_url'] > 0
+        for store in (crawler.processed_urls, frontiers[0].seen):
+            with pytest.raises(sqlite3.ProgrammingError):
+                store._db.execute("SELECT 1")
+
+    @pytest.mark.asyncio
+    async def test_depth_crawler_store_outlives_crawl(self, temp_dir):
+        """Test that the visited store stays usable after crawl() until close()."""
+        from crawlers import depth_crawler
+        from crawlers.depth_crawler import DepthCrawler
+
+        stores = []
+
+        def track_store(*args):
+            stores.append(create_visited_set(*args))
+            return stores[-1]
+
+        def page(url):
+            result = Mock(success=True, url=url, markdown="word " * 60, status_code=200,
+                          response_headers={}, dispatch_result=None, redirected_url=None)
+            result.metadata = {'title': 'Home', 'description': ''}
+            result.links = {'internal': []}
+            return result
+
+        async def arun_many(urls, config, dispatcher):
+            async def stream():
+                for url in urls:
+                    yield page(url)
+            return stream()
+
+        with patch.object(depth_crawler, 'create_visited_set', side_effect=track_store), \
+                patch.object(depth_crawler, 'AsyncWebCrawler') as MockCrawler:
+            instance = AsyncMock()
+            instance.arun_many.side_effect = arun_many
+            MockCrawler.return_value.__aenter__.return_value = instance
+            async with DepthCrawler("https://example.com", max_depth=1, output_dir=str(temp_dir),
+                                    streaming=True, visited_backend='compact') as crawler:
+                first = await crawler.crawl()
+                # Levels are done, so the seed is dropped rather than hitting a closed store
+                assert crawler.add_seed_urls(["https://example.com/late"]) == 0
+                second = await crawler.crawl()
+
+        assert first['successful'] == 1
+        # The root is remembered as visited across crawls
+        assert second['total_crawled'] == 0
+        assert [store.store_path.name for store in stores] == [".visited.sqlite", ".queued.sqlite", ".queued.sqlite"]
+        for store in stores:
+            with pytest.raises(sqlite3.ProgrammingError):
+                store._db.execute("SELECT 1")